@@ -0,0 +1,245 @@
+# pyright: strict
+
+from copy import deepcopy
+from dataclasses import asdict, dataclass
+from statistics import median, quantiles
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Any, Callable
+import gc
+import json
+import logging
+import platform
+import re
+import sys
+
+import jsonrpcserver
+
+from climatevision.generator import (
+    Inputs,
+    RefData,
+    ResultCache,
+    calculate,
+    make_entries,
+    synthdata,
+)
+from climatevision.generator.generator import SCHEDULE
+from climatevision.server import GeneratorRpcs
+from climatevision.tracing import TRACED, with_tracing
+
+GOETTINGEN = "03159016"
+GERMANY = "DG000000"
+YEAR = 2035
+
+# Every sample runs the benchmark often enough to take at least this long (in seconds),
+# so that the resolution of the timer does not matter.
+MIN_SAMPLE_TIME = 0.01
+
+
+@dataclass(kw_only=True)
+class Benchmark:
+    name: str
+    # What is timed. Gets the value returned by setup, which runs before every call
+    # of run but is not timed itself.
+    run: Callable[[Any], object]
+    setup: Callable[[], Any] = lambda: None
+
+
+@dataclass(kw_only=True)
+class Stats:
+    """The time of one call of a benchmark in seconds."""
+
+    median: float
+    iqr: float  # The interquartile range
+    min: float
+    samples: int
+    number: int  # Calls per sample
+
+
+def suite(datadir: str) -> list[Benchmark]:
+    """All benchmarks, using the reference data in datadir."""
+    rd = RefData.load(datadir)
+    facts_and_assumptions = rd.facts_and_assumptions()
+
+    def inputs(ags: str) -> Inputs:
+        return Inputs(
+            facts_and_assumptions=facts_and_assumptions,
+            entries=make_entries(rd, ags, YEAR),
+        )
+
+    goettingen = inputs(GOETTINGEN)
+    germany = inputs(GERMANY)
+    goettingen_traced = Inputs(
+        facts_and_assumptions=facts_and_assumptions,
+        entries=goettingen.entries,
+        numeric=TRACED,
+    )
+    results = SCHEDULE.run(goettingen)
+    result = calculate(goettingen)
+
+    benchmarks = [
+        Benchmark(
+            name="refdata/parse",
+            run=lambda _: RefData.load(datadir, use_snapshot=False),
+        ),
+        Benchmark(name="refdata/snapshot", run=lambda _: RefData.load(datadir)),
+        Benchmark(
+            name="make_entries/goettingen",
+            run=lambda _: make_entries(rd, GOETTINGEN, YEAR),
+        ),
+        Benchmark(
+            name="make_entries/germany", run=lambda _: make_entries(rd, GERMANY, YEAR)
+        ),
+    ]
+    for step in SCHEDULE.steps:
+
+        def setup(step: Any = step) -> dict[str, Any]:
+            kwargs = {a: results[a] for a in step.arguments()}
+            if step.updates is not None:
+                kwargs[step.updates] = deepcopy(kwargs[step.updates])
+            return kwargs
+
+        benchmarks.append(
+            Benchmark(
+                name=f"calc/{step.name}",
+                run=lambda kwargs, step=step: step.fn(goettingen, **kwargs),
+                setup=setup,
+            )
+        )
+
+    def rpc_request() -> str:
+        return json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "calculate",
+                "params": {
+                    "ags": GOETTINGEN,
+                    "year": YEAR,
+                    "overrides": {},
+                    "trace": False,
+                },
+                "id": 1,
+            }
+        )
+
+    benchmarks += [
+        Benchmark(name="calculate/goettingen", run=lambda _: calculate(goettingen)),
+        Benchmark(name="calculate/germany", run=lambda _: calculate(germany)),
+        Benchmark(name="result_dict", run=lambda _: result.result_dict()),
+        Benchmark(
+            name="calculate_traced",
+            run=lambda _: with_tracing(
+                enabled=True, f=lambda: calculate(goettingen_traced).result_dict()
+            ),
+        ),
+        # A fresh server every time, so nothing is cached
+        Benchmark(
+            name="rpc/calculate",
+            run=lambda rpcs: jsonrpcserver.dispatch(  # type: ignore
+                rpc_request(), methods=rpcs.methods()
+            ),
+            setup=lambda: GeneratorRpcs(rd, ResultCache(maxsize=0)),
+        ),
+    ]
+    return benchmarks
+
+
+def _sample(b: Benchmark, number: int) -> float:
+    total = 0.0
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(number):
+            arg = b.setup()
+            start = perf_counter()
+            b.run(arg)
+            total += perf_counter() - start
+    finally:
+        gc.enable()
+    return total / number
+
+
+def measure(b: Benchmark, *, repeat: int) -> Stats:
+    # Warm up (and find out how many calls we need per sample)
+    t = _sample(b, 1)
+    number = max(1, min(1000, int(MIN_SAMPLE_TIME / t) if t > 0 else 1000))
+    times = [_sample(b, number) for _ in range(repeat)]
+    q1, _, q3 = quantiles(times, n=4) if len(times) > 1 else (times[0],) * 3
+    return Stats(
+        median=median(times),
+        iqr=q3 - q1,
+        min=min(times),
+        samples=repeat,
+        number=number,
+    )
+
+
+def is_regression(stats: Stats, baseline: Stats, threshold: float) -> bool:
+    """Slower by more than threshold (relative) and more than the noise of both runs."""
+    slower_by = stats.median - baseline.median
+    return slower_by > threshold * baseline.median and slower_by > 2 * max(
+        stats.iqr, baseline.iqr
+    )
+
+
+def _ms(seconds: float) -> str:
+    return f"{1000 * seconds:10.3f}"
+
+
+def run_benchmarks(args: Any, datadir: str) -> dict[str, Stats]:
+    baseline: dict[str, Stats] = {}
+    if args.baseline is not None:
+        with open(args.baseline) as fp:
+            baseline = {
+                name: Stats(**s) for name, s in json.load(fp)["benchmarks"].items()
+            }
+
+    print(
+        f"{'benchmark':<28}{'median ms':>10}{'iqr ms':>10}{'min ms':>10}"
+        + (f"{'baseline':>10}{'change':>9}" if baseline else "")
+    )
+    all_stats: dict[str, Stats] = {}
+    regressions: list[str] = []
+    for b in suite(datadir):
+        if args.filter is not None and not re.search(args.filter, b.name):
+            continue
+        stats = measure(b, repeat=args.repeat)
+        all_stats[b.name] = stats
+        line = f"{b.name:<28}{_ms(stats.median)}{_ms(stats.iqr)}{_ms(stats.min)}"
+        base = baseline.get(b.name)
+        if base is not None:
+            change = stats.median / base.median - 1
+            line += f"{_ms(base.median)}{change:+8.1%}"
+            if is_regression(stats, base, args.threshold):
+                line += " SLOWER"
+                regressions.append(b.name)
+        print(line, flush=True)
+
+    if args.o is not None:
+        with open(args.o, "w") as fp:
+            json.dump(
+                {
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "benchmarks": {
+                        name: asdict(stats) for name, stats in all_stats.items()
+                    },
+                },
+                fp,
+                indent=4,
+            )
+    if regressions:
+        print(f"{len(regressions)} benchmarks got slower", file=sys.stderr)
+        exit(1)
+    return all_stats
+
+
+def cmd_bench(args: Any):
+    # Printing the progress of every calculation would be measured as well
+    logging.getLogger("climatevision").setLevel(logging.WARNING)
+    if args.datadir is not None:
+        run_benchmarks(args, args.datadir)
+        return
+    with TemporaryDirectory() as datadir:
+        synthdata.write(datadir, communes=args.communes)
+        run_benchmarks(args, datadir)
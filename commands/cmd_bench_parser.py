@@ -0,0 +1,42 @@
+# pyright: strict
+
+from typing import Any
+
+from commands.cmd_bench import cmd_bench
+
+
+def add_cmd_bench_parser(subcmd_parsers: Any):
+    cmd_bench_parser = subcmd_parsers.add_parser(
+        "bench",
+        help="Benchmark the generator (on a synthetic reference data set by default)",
+    )
+    cmd_bench_parser.add_argument(
+        "-datadir",
+        default=None,
+        help="Use this reference data instead of generating a synthetic data set",
+    )
+    cmd_bench_parser.add_argument(
+        "-communes",
+        type=int,
+        default=1000,
+        help="Number of communes in the synthetic data set",
+    )
+    cmd_bench_parser.add_argument(
+        "-filter", default=None, help="Only run the benchmarks matching this regex"
+    )
+    cmd_bench_parser.add_argument(
+        "-repeat", type=int, default=15, help="Number of samples per benchmark"
+    )
+    cmd_bench_parser.add_argument(
+        "-o", default=None, help="Write the results to this file (to use as baseline)"
+    )
+    cmd_bench_parser.add_argument(
+        "-baseline", default=None, help="Compare with the results in this file"
+    )
+    cmd_bench_parser.add_argument(
+        "-threshold",
+        type=float,
+        default=0.1,
+        help="Report benchmarks that got slower by more than this fraction",
+    )
+    cmd_bench_parser.set_defaults(func=cmd_bench)
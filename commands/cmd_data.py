@@ -5,7 +5,7 @@ import csv
 import sys
 import os.path
 
-from climatevision.generator import ags, refdatatools, refdata
+from climatevision.generator import ags, refdatatools, refdata, synthdata
 
 
 def cmd_data_normalize(args: Any):
@@ -84,7 +84,7 @@ def lookup_by_ags(ags: Any, *, fix_missing_entries: bool):
             print(record)
         print()
 
-    data = refdata.RefData.load(fix_missing_entries=fix_missing_entries)
+    data = refdata.RefData.load(fix_missing_entries=fix_missing_entries, lazy=True)
 
     by_ags = [
         ("area", data.area),
@@ -136,7 +136,7 @@ def lookup_fact_or_ass(
     ],
 ):
 
-    data = refdata.RefData.load()
+    data = refdata.RefData.load(lazy=True)
     try:
         res = lookup(data.facts_and_assumptions(), pattern)
         bold(pattern)
@@ -232,3 +232,13 @@ def cmd_data_checkout(args: Any):
         current=status.proprietary_status.rev,
         wanted=status.production.proprietary,
     )
+
+
+def cmd_data_synth(args: Any):
+    if os.path.exists(os.path.join(args.datadir, "production.json")):
+        bold(f"{args.datadir} already contains reference data!", file=sys.stderr)
+        exit(1)
+    synthdata.write(args.datadir, communes=args.communes, seed=args.seed)
+    print(
+        f"Wrote synthetic reference data with {args.communes} communes to {args.datadir}"
+    )
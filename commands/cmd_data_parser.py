@@ -7,6 +7,7 @@ from commands.cmd_data import (
     cmd_data_checkout,
     cmd_data_lookup,
     cmd_data_is_production,
+    cmd_data_synth,
 )
 
 
@@ -47,3 +48,14 @@ def add_cmd_data_parser(subcmd_parsers: Any):
         "-no-fixes", action="store_false", dest="fix_missing_entries"
     )
     cmd_data_lookup_parser.set_defaults(func=cmd_data_lookup)
+
+    cmd_data_synth_parser = subcmd_data.add_parser(
+        "synth",
+        help="Write a synthetic reference data set (e.g. for load tests)",
+    )
+    cmd_data_synth_parser.add_argument("datadir")
+    cmd_data_synth_parser.add_argument(
+        "-communes", type=int, default=11000, help="Number of communes"
+    )
+    cmd_data_synth_parser.add_argument("-seed", type=int, default=0)
+    cmd_data_synth_parser.set_defaults(func=cmd_data_synth)
@@ -1,89 +1,40 @@
 # pyright: strict
 ###### WORDS OF WARNING
-# This implements a simple http JSON "RPC" server for the generator
+# This serves the explorer and the JSON RPCs of the generator over http (see
+# climatevision.server.httpserver).
 #
-# The keyword here is simple! You do NOT want to run this open on the
-# internet. It is purely a way to get a UI for developers of the generator
-# up and running, easily without having to spin up docker or anything else.
-#
-# More specifically this is not intented to be the RPC server that we will
-# offer to the outside world. This is just a quick-dirty test bed for RPCs
-# + the thing needed to provide the UI.
+# It can serve many users at the same time, but there is no authentication or rate
+# limiting whatsoever. You do NOT want to run this open on the internet.
 
+from functools import partial
 from typing import Any
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import jsonrpcserver
 
-from climatevision.generator import RefData
+from climatevision.generator import RefData, ResultCache
 from climatevision.server import GeneratorRpcs
+from climatevision.server.httpserver import GeneratorHttpServer, StaticFile
+
+
+def make_rpcs(cache_dir: str | None) -> GeneratorRpcs:
+    # Called once in every worker process, before it answers its first request. The
+    # datasets are parsed when a request first needs them.
+    rd = RefData.load(lazy=True)
+    return GeneratorRpcs(rd, ResultCache(directory=cache_dir))
 
 
 def cmd_explorer(args: Any):
-    rd = RefData.load()
-    generator_rpcs = GeneratorRpcs(rd)
     with open("explorer/index.html", encoding="utf-8") as index_file:
         index = index_file.read()
     with open("explorer/elm.js", encoding="utf-8") as elm_js_file:
         elm_js = elm_js_file.read()
 
-    class ExplorerHandler(BaseHTTPRequestHandler):
-        def handle_index(self):
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(index.encode())
-
-        def handle_elm_js(self):
-            self.send_response(200)
-            self.send_header("Content-type", "text/javascript")
-            self.end_headers()
-            self.wfile.write(elm_js.encode())
-
-        def do_POST(self):
-            match self.path.split("/"):
-                case ["", "localzero", "api", "v0", ""]:
-                    content_len = int(self.headers["Content-Length"])
-                    if content_len < 0 or content_len > 1024 * 1024 * 5:
-                        self.send_response(400)
-                        return
-                    request = self.rfile.read(content_len).decode()
-                    response = jsonrpcserver.dispatch(
-                        request,
-                        methods=generator_rpcs.methods(),  # type: ignore TODO: Figure out a better way to deal with this
-                    )
-                    self.send_response(200)
-                    self.send_header("Content-type", "application/json")
-                    self.send_header("Access-Control-Allow-Origin", "*")
-                    self.end_headers()
-                    self.wfile.write(response.encode())
-                case path:
-                    print(path)
-                    self.send_response(404)
-                    self.end_headers()
-
-        def do_OPTIONS(self):
-            print("OPTIONS", self.command)
-            print(self.path.split("/"))
-            self.send_response(204)
-            self.send_header("Access-Control-Allow-Methods", "POST, GET, OPTIONS")
-            self.send_header("Access-Control-Allow-Headers", "Content-Type")
-            self.send_header("Access-Control-Allow-Origin", "*")
-            self.end_headers()
-
-        def do_GET(self):
-            print(self.command)
-            print(self.path.split("/"))
-            match self.path.split("/"):
-                case ["", ""]:
-                    self.handle_index()
-
-                case ["", "elm.js"]:
-                    self.handle_elm_js()
-
-                case _:
-                    self.send_response(404)
-                    self.end_headers()
-
-    httpd = HTTPServer(("", 4070), ExplorerHandler)
-    print("Ready to go. Explore at http://localhost:4070")
-    httpd.serve_forever()
+    httpd = GeneratorHttpServer(
+        (args.host, args.port),
+        partial(make_rpcs, args.cache_dir),
+        workers=args.workers,
+        static={
+            "/": StaticFile(index, "text/html"),
+            "/elm.js": StaticFile(elm_js, "text/javascript"),
+        },
+    )
+    print(f"Ready to go. Explore at http://localhost:{args.port}")
+    httpd.serve_until_signalled()
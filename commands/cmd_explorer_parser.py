@@ -1,6 +1,7 @@
 # pyright: strict
 
 from typing import Any
+import os
 
 from commands.cmd_explorer import cmd_explorer
 
@@ -10,4 +11,19 @@ def add_cmd_explorer_parser(subcmd_parsers: Any):
         "explorer", help="Start the LocalZero Explorer"
     )
     cmd_explorer_parser.add_argument("-trace", action="store_true")
+    cmd_explorer_parser.add_argument(
+        "-cache-dir",
+        default=None,
+        help="Also keep the results of calculations in this directory.",
+    )
+    cmd_explorer_parser.add_argument(
+        "-host", default="", help="Listen on this address (default: all of them)"
+    )
+    cmd_explorer_parser.add_argument("-port", type=int, default=4070)
+    cmd_explorer_parser.add_argument(
+        "-workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes doing the calculations, every AGS and year is always calculated by the same one (0 to do them in the server process)",
+    )
     cmd_explorer_parser.set_defaults(func=cmd_explorer)
@@ -1,35 +1,63 @@
 # pyright: strict
 
 from dataclasses import asdict
-from typing import Any
-import json
+from typing import Any, Callable
 import sys
 
-from climatevision.generator import calculate_with_default_inputs, RefData, make_entries
-from climatevision.tracing import with_tracing
+from climatevision.generator import (
+    calculate_with_default_inputs,
+    RefData,
+    make_entries,
+    write_result_json,
+)
+from climatevision.tracing import (
+    dag_traces,
+    finalizing_default,
+    with_tracing,
+    with_unfinalized_tracing,
+)
 
 
-def json_to_output(json_object: Any, args: Any):
-    """Write json_object to stdout or a file depending on args"""
+def json_to_output(
+    json_object: Any,
+    args: Any,
+    default: Callable[[object], object] | None = None,
+):
+    """Write json_object (a dict or a dataclass like Result) to stdout or a file
+    depending on args.  The JSON is written as it is produced, so it is never held in
+    memory as a whole. default is passed on to write_result_json."""
+    indent = None if args.compact else 4
     if args.o is not None:
         with open(args.o, mode="w") as fp:
-            json.dump(json_object, indent=4, fp=fp)
+            write_result_json(json_object, fp, indent=indent, default=default)
     else:
-        json.dump(json_object, indent=4, fp=sys.stdout)
+        write_result_json(json_object, sys.stdout, indent=indent, default=default)
 
 
 def cmd_run(args: Any):
-    d = with_tracing(
-        enabled=args.trace,
-        f=lambda: calculate_with_default_inputs(
-            ags=args.ags, year=int(args.year)
-        ).result_dict(),
-    )
-    json_to_output(d, args)
+    if args.trace_dag:
+        d = with_tracing(
+            enabled=True,
+            f=lambda: calculate_with_default_inputs(
+                ags=args.ags, year=int(args.year)
+            ).result_dict(),
+        )
+        json_to_output(dag_traces(d), args)
+    elif args.trace:
+        # The traces are finalized as they are written
+        result = with_unfinalized_tracing(
+            lambda: calculate_with_default_inputs(ags=args.ags, year=int(args.year))
+        )
+        json_to_output(result, args, default=finalizing_default(result))
+    else:
+        # No need to build the result dict
+        json_to_output(
+            calculate_with_default_inputs(ags=args.ags, year=int(args.year)), args
+        )
 
 
 def cmd_make_entries(args: Any):
-    rd = RefData.load()
+    rd = RefData.cached()
     e = with_tracing(
         enabled=args.trace, f=lambda: asdict(make_entries(rd, args.ags, int(args.year)))
     )
@@ -11,6 +11,14 @@ def add_cmd_run_parser(subcmd_parsers: Any):
     cmd_run_parser.add_argument("-year", default=2035)
     cmd_run_parser.add_argument("-o", default=None)
     cmd_run_parser.add_argument("-trace", action="store_true")
+    cmd_run_parser.add_argument(
+        "-trace-dag",
+        action="store_true",
+        help="Trace and store every trace only once (see tracing.dag_traces)",
+    )
+    cmd_run_parser.add_argument(
+        "-compact", action="store_true", help="Do not indent the JSON output"
+    )
     cmd_run_parser.set_defaults(func=cmd_run)
 
 
@@ -20,4 +28,7 @@ def add_cmd_make_entries_parser(subcmd_parsers: Any):
     cmd_make_entries_parser.add_argument("-year", default=2035)
     cmd_make_entries_parser.add_argument("-o", default=None)
     cmd_make_entries_parser.add_argument("-trace", action="store_true")
+    cmd_make_entries_parser.add_argument(
+        "-compact", action="store_true", help="Do not indent the JSON output"
+    )
     cmd_make_entries_parser.set_defaults(func=cmd_make_entries)
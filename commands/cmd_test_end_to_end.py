@@ -1,6 +1,10 @@
 # pyright: strict
 
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import ExitStack
 from dataclasses import asdict
+from itertools import islice
+from time import time
 from typing import Iterator, Any
 import json
 import sys
@@ -8,7 +12,15 @@ import os
 import os.path
 import re
 
-from climatevision.generator import calculate_with_default_inputs, make_entries, RefData
+from climatevision.generator import (
+    calculate,
+    calculate_with_default_inputs,
+    make_entries,
+    make_entries_batch,
+    EntriesBatch,
+    Inputs,
+    RefData,
+)
 
 test_dir = os.path.join("tests", "end_to_end_expected")
 
@@ -29,7 +41,7 @@ def update_expectation(ags: str, year: int, file_path: str):
 
 
 def update_entries(ags: str, year: int, file_path: str):
-    rd = RefData.load()
+    rd = RefData.cached()
     entries = make_entries(rd, ags=ags, year=year)
     json_to_output_file(asdict(entries), file_path)
 
@@ -61,18 +73,144 @@ def cmd_test_end_to_end_create_expectation(args: Any):
     update_expectation(args.ags, int(args.year), filepath)
 
 
+# The reference data and entries used by the workers of run_all_ags. Set by the parent
+# process before the pool is started, so that forked workers share it (copy on write).
+# Workers that are spawned instead load it themselves (see _init_worker).
+_worker_data: tuple[RefData, EntriesBatch] | None = None
+
+# The number of AGS a worker calculates before reporting back
+CHUNK_SIZE = 25
+
+PROGRESS_FILE = "test_progress.txt"
+ERRORS_FILE = "test_errors.txt"
+
+
+def _load_worker_data(
+    year: int, only_ags: list[str] | None
+) -> tuple[RefData, EntriesBatch]:
+    data = RefData.cached()
+    all_ags = only_ags if only_ags is not None else list(data.ags_master().keys())
+    return (data, make_entries_batch(data, all_ags, [year]))
+
+
+def _init_worker(year: int, only_ags: list[str] | None):
+    global _worker_data
+    if _worker_data is None:
+        _worker_data = _load_worker_data(year, only_ags)
+
+
+def _calculate_chunk(
+    chunk: list[str], year: int, with_results: bool
+) -> list[tuple[str, dict[str, Any] | None, str | None]]:
+    """Calculate every AGS in chunk and return (ags, result or None, error or None)."""
+    assert _worker_data is not None
+    data, batch = _worker_data
+    out: list[tuple[str, dict[str, Any] | None, str | None]] = []
+    for ags in chunk:
+        try:
+            inputs = Inputs(
+                facts_and_assumptions=data.facts_and_assumptions(),
+                entries=batch.entries(ags, year),
+            )
+            result = calculate(inputs)
+            out.append((ags, result.result_dict() if with_results else None, None))
+        except Exception as e:
+            out.append((ags, None, repr(e)))
+    return out
+
+
+def _done_ags(year: int) -> set[str]:
+    """The AGS that PROGRESS_FILE lists as done for year."""
+    if not os.path.exists(PROGRESS_FILE):
+        return set()
+    done: set[str] = set()
+    with open(PROGRESS_FILE) as fp:
+        for line in fp:
+            # Lines without a year are from before the year was recorded
+            fields = line.split()
+            if len(fields) == 2 and fields[1] == str(year):
+                done.add(fields[0])
+    return done
+
+
 def cmd_test_end_to_end_run_all_ags(args: Any):
-    data = RefData.load()
+    """Calculate all AGS (or only args.ags), on args.jobs processes.
+
+    Errors are written to test_errors.txt (and the results to args.results if given) as
+    soon as they are known. Every AGS that was calculated without an error is also added
+    to test_progress.txt (together with the year), so that an interrupted run can be
+    continued with args.resume. That skips only the AGS that were done for the same year,
+    so the AGS that failed are tried again.
+    """
+    global _worker_data
+    year = int(args.year)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    with_results = args.results is not None
+
+    _worker_data = _load_worker_data(year, args.ags)
+    all_ags = (
+        args.ags if args.ags is not None else list(_worker_data[0].ags_master().keys())
+    )
+
+    mode = "a" if args.resume else "w"
+    done: set[str] = _done_ags(year) if args.resume else set()
+    todo = [ags for ags in all_ags if ags not in done]
+    chunks = [todo[i : i + CHUNK_SIZE] for i in range(0, len(todo), CHUNK_SIZE)]
+
     good = 0
     errors = 0
-    with open("test_errors.txt", "w") as error_file:
-        for ags in list(data.ags_master().keys()):
-            try:
-                calculate_with_default_inputs(ags=ags, year=int(args.year))
-                good = good + 1
-            except Exception as e:
-                errors = errors + 1
-                print(ags, repr(e), sep="\t", file=error_file)
-                sys.stdout.write(ags + ": " + repr(e) + "\n")
-
-            sys.stdout.write(f"OK {good:>5}    ERROR {errors:>5}\n\n")
+    start_t = time()
+    with ExitStack() as stack:
+        error_file = stack.enter_context(open(ERRORS_FILE, mode))
+        progress_file = stack.enter_context(open(PROGRESS_FILE, mode))
+        results_file = (
+            stack.enter_context(open(args.results, mode)) if with_results else None
+        )
+
+        def report(out: list[tuple[str, dict[str, Any] | None, str | None]]):
+            nonlocal good, errors
+            for (ags, result, error) in out:
+                if error is None:
+                    good = good + 1
+                    if results_file is not None:
+                        json.dump(
+                            {"ags": ags, "year": year, "result": result},
+                            fp=results_file,
+                        )
+                        results_file.write("\n")
+                    print(ags, year, sep="\t", file=progress_file)
+                else:
+                    errors = errors + 1
+                    print(ags, year, error, sep="\t", file=error_file)
+                    sys.stdout.write(ags + ": " + error + "\n")
+            for f in [error_file, results_file, progress_file]:
+                if f is not None:
+                    f.flush()
+            elapsed = time() - start_t
+            sys.stdout.write(
+                f"OK {good:>5}    ERROR {errors:>5}    "
+                f"{good + errors:>5} of {len(todo)} in {elapsed:.0f}s\n\n"
+            )
+
+        if jobs == 1:
+            for chunk in chunks:
+                report(_calculate_chunk(chunk, year, with_results))
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(year, args.ags)
+        ) as executor:
+            # Do not submit everything at once, so that finished results do not pile up
+            pending = iter(chunks)
+            running = {
+                executor.submit(_calculate_chunk, chunk, year, with_results)
+                for chunk in islice(pending, 2 * jobs)
+            }
+            while running:
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    report(future.result())
+                for chunk in islice(pending, len(finished)):
+                    running.add(
+                        executor.submit(_calculate_chunk, chunk, year, with_results)
+                    )
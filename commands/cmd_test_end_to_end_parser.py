@@ -42,6 +42,28 @@ def add_cmd_test_end_to_end_parser(subcmd_parsers: Any):
         help="Runs the generator for all ags.",
     )
     cmd_test_end_to_end_run_all_ags_parser.add_argument("-year", default=2035)
+    cmd_test_end_to_end_run_all_ags_parser.add_argument(
+        "-jobs",
+        type=int,
+        default=1,
+        help="Number of processes to use (0 for one per CPU).",
+    )
+    cmd_test_end_to_end_run_all_ags_parser.add_argument(
+        "-resume",
+        action="store_true",
+        help="Skip the AGS that test_progress.txt lists as done for the same year.",
+    )
+    cmd_test_end_to_end_run_all_ags_parser.add_argument(
+        "-results",
+        default=None,
+        help="Write the results to this file (one JSON object per line).",
+    )
+    cmd_test_end_to_end_run_all_ags_parser.add_argument(
+        "-ags",
+        nargs="+",
+        default=None,
+        help="Only calculate these AGS.",
+    )
     cmd_test_end_to_end_run_all_ags_parser.set_defaults(
         func=cmd_test_end_to_end_run_all_ags
     )
@@ -15,6 +15,7 @@ This is a simple wrapper around the generator to
 
 from typing import Any
 import argparse
+import logging
 import sys
 
 from commands.cmd_run_parser import add_cmd_make_entries_parser, add_cmd_run_parser
@@ -22,6 +23,7 @@ from commands.cmd_explorer_parser import add_cmd_explorer_parser
 from commands.cmd_ready_to_rock_parser import add_cmd_ready_to_rock_parser
 from commands.cmd_data_parser import add_cmd_data_parser
 from commands.cmd_test_end_to_end_parser import add_cmd_test_end_to_end_parser
+from commands.cmd_bench_parser import add_cmd_bench_parser
 
 
 class Devtool:
@@ -30,6 +32,11 @@ class Devtool:
 
     def parse_args(self, args: Any):
         self.parser.set_defaults()
+        self.parser.add_argument(
+            "-quiet",
+            action="store_true",
+            help="Do not print the progress of the calculation",
+        )
         subcmd_parsers = self.parser.add_subparsers(dest="subcmd", title="Commands")
 
         add_cmd_run_parser(subcmd_parsers)
@@ -38,6 +45,7 @@ class Devtool:
         add_cmd_ready_to_rock_parser(subcmd_parsers)
         add_cmd_data_parser(subcmd_parsers)
         add_cmd_test_end_to_end_parser(subcmd_parsers)
+        add_cmd_bench_parser(subcmd_parsers)
 
         return self.parser.parse_args(args)
 
@@ -45,6 +53,9 @@ class Devtool:
 def main():
     devtool = Devtool()
     args = devtool.parse_args(sys.argv[1:])
+    logging.basicConfig(format="%(message)s")
+    if not args.quiet:
+        logging.getLogger("climatevision").setLevel(logging.DEBUG)
 
     if args.subcmd is None:
         devtool.parser.print_help()
@@ -4,17 +4,44 @@
 #   from climatevision.generator import calculate_with_default_inputs
 from . import ags
 from .refdata import RefData
-from .makeentries import make_entries, Entries
+from .makeentries import make_entries, make_entries_batch, Entries, EntriesBatch
 from .inputs import Inputs
-from .generator import calculate, calculate_with_default_inputs, Result
+from .generator import (
+    calculate,
+    calculate_incremental,
+    calculate_years,
+    calculate_with_default_inputs,
+    Calculation,
+    Result,
+)
+from .instrumentation import Instrumentation, StepMeasurement, StepStatistics
+from .resultcache import ResultCache
+from .resultdict import projected_result_dict, write_result_json
+from .scenarios import ScenariosFailed, calculate_scenarios, scenario_result
+from .vector import Vector
 
 __all__ = [
     "ags",
     "RefData",
     "make_entries",
+    "make_entries_batch",
     "Entries",
+    "EntriesBatch",
     "Inputs",
     "calculate",
+    "calculate_incremental",
+    "calculate_years",
+    "Calculation",
     "calculate_with_default_inputs",
     "Result",
+    "Instrumentation",
+    "StepMeasurement",
+    "StepStatistics",
+    "ResultCache",
+    "projected_result_dict",
+    "write_result_json",
+    "ScenariosFailed",
+    "calculate_scenarios",
+    "scenario_result",
+    "Vector",
 ]
@@ -15,7 +15,7 @@ from .energy_demand import (
 from .energy_source import CO2eFromEnergyUse, CO2eFromEnergyUseDetail
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class A18:
     a: CO2eEmissions
     p: P
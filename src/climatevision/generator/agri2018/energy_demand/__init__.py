@@ -15,7 +15,7 @@ from .co2eFromOther import CO2eFromOther
 from .operationHeatEnergy import OperationHeatEnergy
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Production:
 
     p: P
@@ -7,7 +7,7 @@ from ...inputs import Inputs
 from ...common.co2eEmissions import CO2eEmissions
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eFromFermentationOrManure(CO2eEmissions):
     # Used by p_fermen_dairycow, p_fermen_nondairy, p_fermen_swine, p_fermen_poultry, p_fermen_oanimal, p_manure_dairycow, p_manure_nondairy, p_manure_swine, p_manure_poultry, p_manure_oanimal, p_manure_deposition
     CO2e_production_based_per_t: float
@@ -7,7 +7,7 @@ from ...inputs import Inputs
 from ...common.co2eEmissions import CO2eEmissions
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eFromOther(CO2eEmissions):
     # Used by p_other_liming_dolomite, p_other_urea, p_other_ecrop, p_other_liming_calcit
     CO2e_production_based_per_t: float
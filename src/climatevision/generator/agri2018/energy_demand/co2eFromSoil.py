@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from ...common.co2eEmissions import CO2eEmissions
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eFromSoil(CO2eEmissions):
     # Used by p_soil_fertilizer, p_soil_manure, p_soil_sludge, p_soil_ecrop, p_soil_grazing, p_soil_residue, p_soil_orgfarm, p_soil_orgloss, p_soil_leaching, p_soil_deposition
     CO2e_production_based_per_t: float
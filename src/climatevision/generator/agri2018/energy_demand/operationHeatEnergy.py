@@ -8,7 +8,7 @@ from ...business2018.b18 import B18
 from ...common.energy import EnergyWithPercentage
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OperationHeatEnergy(EnergyWithPercentage):
     # Used by p_operation_heat
     area_m2: float
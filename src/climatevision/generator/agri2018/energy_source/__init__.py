@@ -8,7 +8,7 @@ from .co2eFromEnergyUse import CO2eFromEnergyUse
 from .co2eFromEnergyUseDetail import CO2eFromEnergyUseDetail
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergySupply:
     s: CO2eFromEnergyUse
     s_petrol: CO2eFromEnergyUseDetail
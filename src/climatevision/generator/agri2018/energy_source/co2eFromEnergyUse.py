@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from ...common.co2eEmissions import CO2eEmissions
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eFromEnergyUse(CO2eEmissions):
     # Used by s
     CO2e_combustion_based: float
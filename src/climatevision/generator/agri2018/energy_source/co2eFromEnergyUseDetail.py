@@ -7,7 +7,7 @@ from ...utils import div
 from .co2eFromEnergyUse import CO2eFromEnergyUse
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eFromEnergyUseDetail(CO2eFromEnergyUse):
     # TODO: Why are these called s_ ?
     # Used by s_petrol, s_diesel, s_fueloil, s_lpg, s_gas, s_biomass, s_elec, s_heatpump
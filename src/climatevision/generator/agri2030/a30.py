@@ -30,7 +30,7 @@ from .energy_source import (
 from .co2eChangeA import CO2eChangeA
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class A30:
     a: CO2eChangeA
 
@@ -11,7 +11,7 @@ from .energy_source import CO2eChangeS
 from .energy_general import CO2eChangeG
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeA:
     CO2e_combustion_based: float = 0
     CO2e_production_based: float = 0
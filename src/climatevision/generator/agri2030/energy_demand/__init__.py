@@ -20,7 +20,7 @@ from .co2eChangePOperationElecHeatpump import CO2eChangePOperationElecHeatpump
 from .co2eChangePOperationVehicles import CO2eChangePOperationVehicles
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Production:
 
     p: CO2eChangeP
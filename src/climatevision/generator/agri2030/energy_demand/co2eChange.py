@@ -7,7 +7,7 @@ from ...utils import div
 from ...agri2018.a18 import A18
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChange:
     CO2e_combustion_based: float
     CO2e_production_based: float
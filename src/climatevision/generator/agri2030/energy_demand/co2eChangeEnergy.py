@@ -7,7 +7,7 @@ from ...utils import div
 from ...agri2018.a18 import A18
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeEnergy:
     change_energy_MWh: float = 0
     change_energy_pct: float = 0
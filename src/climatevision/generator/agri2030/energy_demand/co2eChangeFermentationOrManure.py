@@ -8,7 +8,7 @@ from ...agri2018.a18 import A18
 from .co2eChange import CO2eChange
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeFermentationOrManure(CO2eChange):
     CO2e_production_based_per_t: float = 0
     amount: float = 0
@@ -9,7 +9,7 @@ from ...agri2018.a18 import A18
 from .co2eChangePOperation import CO2eChangePOperation
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeP:
     CO2e_production_based: float = 0
     CO2e_total: float = 0
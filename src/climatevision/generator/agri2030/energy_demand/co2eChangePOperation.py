@@ -12,7 +12,7 @@ from .co2eChangePOperationElecElcon import CO2eChangePOperationElecElcon
 from .co2eChangePOperationElecHeatpump import CO2eChangePOperationElecHeatpump
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangePOperation(CO2eChangeEnergy):
     cost_wage: float = 0
     demand_biomass: float = 0
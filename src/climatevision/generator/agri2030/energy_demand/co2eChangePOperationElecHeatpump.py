@@ -9,7 +9,7 @@ from .co2eChangeEnergy import CO2eChangeEnergy
 from .co2eChangePOperationHeat import CO2eChangePOperationHeat
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangePOperationElecHeatpump(CO2eChangeEnergy):
     demand_electricity: float = 0
 
@@ -9,7 +9,7 @@ from ...agri2018.a18 import A18
 from .co2eChangeEnergy import CO2eChangeEnergy
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangePOperationHeat(CO2eChangeEnergy):
     area_m2: float = 0
     area_m2_nonrehab: float = 0
@@ -9,7 +9,7 @@ from ...agri2018.a18 import A18
 from .co2eChangeEnergy import CO2eChangeEnergy
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangePOperationVehicles(CO2eChangeEnergy):
     demand_biomass: float = 0
     demand_change: float = 0
@@ -9,7 +9,7 @@ from .co2eChangeGConsult import CO2eChangeGConsult
 from .co2eChangeGOrganic import CO2eChangeGOrganic
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class G:
     g: CO2eChangeG
     g_consult: CO2eChangeGConsult
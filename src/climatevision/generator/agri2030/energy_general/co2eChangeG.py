@@ -6,7 +6,7 @@ from .co2eChangeGConsult import CO2eChangeGConsult
 from .co2eChangeGOrganic import CO2eChangeGOrganic
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeG:
     CO2e_total: float = 0
     cost_wage: float = 0
@@ -6,7 +6,7 @@ from ...inputs import Inputs
 from ...utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeGConsult:
     area_ha_available: float = 0
     cost_wage: float = 0
@@ -13,7 +13,7 @@ from .co2eChangeFuelHeatpump import CO2eChangeFuelHeatpump
 from .co2eChangeFuelEmethan import CO2eChangeFuelEmethan
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergySupply:
     s: CO2eChangeS
     s_petrol: CO2eChangeEnergyPerMWh
@@ -8,7 +8,7 @@ from ...agri2018.a18 import A18
 from ..energy_demand import CO2eChange
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeEnergyPerMWh(CO2eChange):
     energy: float
 
@@ -7,7 +7,7 @@ from ...agri2018.a18 import A18
 from ..energy_demand import CO2eChange
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeFuelEmethan(CO2eChange):
     energy: float
 
@@ -8,7 +8,7 @@ from ...agri2018.a18 import A18
 from .co2eChangeEnergyPerMWh import CO2eChangeEnergyPerMWh
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeFuelHeatpump(CO2eChangeEnergyPerMWh):
     cost_fuel: float = 0
     cost_fuel_per_MWh: float = 0
@@ -7,7 +7,7 @@ from ...agri2018.a18 import A18
 from .co2eChangeEnergyPerMWh import CO2eChangeEnergyPerMWh
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeFuelOilGas(CO2eChangeEnergyPerMWh):
     area_m2: float = 0
 
@@ -13,7 +13,7 @@ from .co2eChangeFuelEmethan import CO2eChangeFuelEmethan
 from .co2eChangeFuelHeatpump import CO2eChangeFuelHeatpump
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class CO2eChangeS(CO2eChange):
     change_energy_MWh: float = 0
     change_energy_pct: float = 0
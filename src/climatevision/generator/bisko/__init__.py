@@ -15,7 +15,7 @@ from ..residences2018.r18 import R18
 from ..transport2018.t18 import T18
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductionBasedEmission:
     # production based Emissions
     CO2e_pb: float
@@ -34,7 +34,7 @@ class ProductionBasedEmission:
         self.CO2e_cb = self.CO2e_cb + sum([elem.CO2e_cb for elem in args])
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Emissions(ProductionBasedEmission):
     # combustion based Emissions
     CO2e_cb: float
@@ -65,7 +65,7 @@ class Emissions(ProductionBasedEmission):
         self.CO2e_total = self.CO2e_cb + self.CO2e_pb
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergyAndEmissions(Emissions):
     """
     This class contains the relevant data attributes for the Bisko greenhous gas (GHG)
@@ -87,7 +87,7 @@ class EnergyAndEmissions(Emissions):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergyAndEmissionsCalcIntermediate(EnergyAndEmissions):
     """
     This class is a contains all relevant parameters for the conversion calculation
@@ -134,7 +134,7 @@ class EnergyAndEmissionsCalcIntermediate(EnergyAndEmissions):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Sums(EnergyAndEmissions):
     """
     This class represents a sum over instances of class EnergyAndEmissionsCalcIntermediate.
@@ -187,7 +187,7 @@ class Sums(EnergyAndEmissions):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoSector:
     # shared BISKO sector variables
     total: Sums | EnergyAndEmissions
@@ -198,6 +198,7 @@ class BiskoSector:
     fueloil: EnergyAndEmissions
 
 
+# Not slotted, as it is used as second base class (which must not have slots too)
 @dataclass(kw_only=True)
 class BiskoSectorWithExtraCommunalFacilities:
     """
@@ -210,7 +211,7 @@ class BiskoSectorWithExtraCommunalFacilities:
     sector_without_communal_facilities: EnergyAndEmissions
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoPrivResidences(BiskoSector, BiskoSectorWithExtraCommunalFacilities):
     """
     Bisko Sector for private residences.
@@ -337,7 +338,7 @@ class BiskoPrivResidences(BiskoSector, BiskoSectorWithExtraCommunalFacilities):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoBusiness(BiskoSector, BiskoSectorWithExtraCommunalFacilities):
     petrol: EnergyAndEmissions
     diesel: EnergyAndEmissions
@@ -497,7 +498,7 @@ class BiskoBusiness(BiskoSector, BiskoSectorWithExtraCommunalFacilities):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoTransport(BiskoSector):
     """
     Bisko sector for transportation.
@@ -625,7 +626,7 @@ class BiskoTransport(BiskoSector):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoIndustry(BiskoSector):
     """
     Bisko sector for industry. We are currently not able to calculate any
@@ -788,7 +789,7 @@ class BiskoIndustry(BiskoSector):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoAgriculture:
     total: ProductionBasedEmission
     forest: ProductionBasedEmission
@@ -810,7 +811,7 @@ class BiskoAgriculture:
         return cls(forest=forest, manure=manure, soil=soil, other=other, total=total)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class BiskoLULUCF:
     total: Emissions
     forest: Emissions
@@ -866,7 +867,7 @@ class BiskoLULUCF:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Bisko:
     priv_residences: BiskoPrivResidences
     business: BiskoBusiness
@@ -16,7 +16,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class B18:
     b: Vars0
     p: Vars2
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars0:
     # Used by b
     CO2e_combustion_based: float = None  # type: ignore
@@ -11,13 +11,13 @@ class Vars0:
     CO2e_total: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars2:
     # Used by p, p_elec_elcon, p_elec_heatpump, p_vehicles, p_other
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars3:
     # Used by p_nonresi
     area_m2: float = None  # type: ignore
@@ -26,7 +26,7 @@ class Vars3:
     number_of_buildings: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars4:
     # Used by p_nonresi_com
     area_m2: float = None  # type: ignore
@@ -35,7 +35,7 @@ class Vars4:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars5:
     # Used by s
     CO2e_combustion_based: float = None  # type: ignore
@@ -45,7 +45,7 @@ class Vars5:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     # Used by s_gas, s_lpg, s_petrol, s_jetfuel, s_diesel, s_fueloil, s_coal, s_heatnet, s_heatpump, s_solarth
     CO2e_combustion_based: float = None  # type: ignore
@@ -57,7 +57,7 @@ class Vars6:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars7:
     # Used by s_biomass
     CO2e_combustion_based: float = None  # type: ignore
@@ -70,7 +70,7 @@ class Vars7:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8:
     # Used by s_elec_heating, s_elec
     CO2e_combustion_based: float = None  # type: ignore
@@ -80,7 +80,7 @@ class Vars8:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars9:
     # Used by rb
     CO2e_combustion_based: float = None  # type: ignore
@@ -88,7 +88,7 @@ class Vars9:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars10:
     # Used by rp_p
     CO2e_combustion_based: float = None  # type: ignore
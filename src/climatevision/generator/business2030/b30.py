@@ -25,7 +25,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class B30:
     b: Vars0
     g: Vars1
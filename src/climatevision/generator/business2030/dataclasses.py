@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars0:
     # Used by b
     CO2e_combustion_based: float = None  # type: ignore
@@ -24,7 +24,7 @@ class Vars0:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars1:
     # Used by g
     cost_wage: float = None  # type: ignore
@@ -37,7 +37,7 @@ class Vars1:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars2:
     # Used by g_consult
     cost_wage: float = None  # type: ignore
@@ -52,7 +52,7 @@ class Vars2:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars3:
     # Used by p
     change_energy_MWh: float = None  # type: ignore
@@ -74,7 +74,7 @@ class Vars3:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars4:
     # Used by p_nonresi
     area_m2: float = None  # type: ignore
@@ -105,7 +105,7 @@ class Vars4:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars5:
     # Used by p_nonresi_com
     area_m2: float = None  # type: ignore
@@ -121,7 +121,7 @@ class Vars5:
     invest_per_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     # Used by p_elec_elcon
     change_energy_MWh: float = None  # type: ignore
@@ -131,7 +131,7 @@ class Vars6:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars7:
     # Used by p_elec_heatpump
     change_energy_MWh: float = None  # type: ignore
@@ -140,7 +140,7 @@ class Vars7:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8:
     # Used by p_vehicles
     change_energy_MWh: float = None  # type: ignore
@@ -150,7 +150,7 @@ class Vars8:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars9:
     # Used by p_other
     change_energy_MWh: float = None  # type: ignore
@@ -160,7 +160,7 @@ class Vars9:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars10:
     # Used by s
     CO2e_combustion_based: float = None  # type: ignore
@@ -184,7 +184,7 @@ class Vars10:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars11:
     # Used by s_gas
     CO2e_combustion_based: float = None  # type: ignore
@@ -204,7 +204,7 @@ class Vars11:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars12:
     # Used by s_emethan
     CO2e_combustion_based: float = None  # type: ignore
@@ -219,7 +219,7 @@ class Vars12:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars13:
     # Used by s_lpg, s_petrol, s_jetfuel, s_diesel, s_elec_heating, s_elec
     CO2e_combustion_based: float = None  # type: ignore
@@ -235,7 +235,7 @@ class Vars13:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars14:
     # Used by s_fueloil, s_coal
     CO2e_combustion_based: float = None  # type: ignore
@@ -253,7 +253,7 @@ class Vars14:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars15:
     # Used by s_biomass, s_heatnet
     CO2e_combustion_based: float = None  # type: ignore
@@ -272,7 +272,7 @@ class Vars15:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars16:
     # Used by s_heatpump
     CO2e_combustion_based: float = None  # type: ignore
@@ -304,7 +304,7 @@ class Vars16:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars17:
     # Used by s_solarth
     CO2e_combustion_based: float = None  # type: ignore
@@ -335,7 +335,7 @@ class Vars17:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars18:
     # Used by rb
     CO2e_combustion_based: float = None  # type: ignore
@@ -5,12 +5,12 @@ from dataclasses import InitVar, dataclass
 from ..utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Energy:
     energy: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergyWithPercentage(Energy):
     pct_energy: float = 0
     total_energy: InitVar[float]
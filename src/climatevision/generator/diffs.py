@@ -28,7 +28,7 @@ def float_matches(actual: Any, expected: Any, rel: Any):
     return False
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class MissingSentinel:
     def __str__(self):
         return "nothing"
@@ -37,7 +37,7 @@ class MissingSentinel:
 MISSING_SENTINEL = MissingSentinel()
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Diff:
     path: str
     actual: object
@@ -24,7 +24,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class E18:
     e: Vars0
     d: Vars2
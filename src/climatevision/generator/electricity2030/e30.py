@@ -12,7 +12,7 @@ from .electricity2030_core import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class E30:
     e: EColVars2030
     g: EColVars2030
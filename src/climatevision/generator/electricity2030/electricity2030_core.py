@@ -6,7 +6,7 @@ from ..inputs import Inputs
 from ..utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FossilFuelsProduction:
     """This describes energy produced by fossil fuels. Which we do not do in 2030, so this
     just describes the effect of shutting those energy providers down."""
@@ -74,19 +74,19 @@ class FossilFuelsProduction:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Energy:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergyDemand(Energy):
     pct_energy: float = None  # type: ignore
     change_energy_MWh: float = None  # type: ignore
     change_energy_pct: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RenewableGeothermalProduction(EnergyDemand):
     """Energy production using geothermal."""
 
@@ -119,14 +119,14 @@ class RenewableGeothermalProduction(EnergyDemand):
     full_load_hour: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergyDemandWithCostFuel(EnergyDemand):
     cost_fuel_per_MWh: float = None  # type: ignore
     cost_fuel: float = None  # type: ignore
 
 
 # Definition der relevanten Spaltennamen für den Sektor E
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EColVars2030(EnergyDemandWithCostFuel):
     pet_sites: float = None  # type: ignore
     energy_installable: float = None  # type: ignore
@@ -7,7 +7,7 @@ from ...transport2018.t18 import T18
 from ...common.energy import Energy as EnergyDemand
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Demand:
     residences: EnergyDemand
     business: EnergyDemand
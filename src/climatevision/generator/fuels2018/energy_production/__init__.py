@@ -8,7 +8,7 @@ from ...transport2018.t18 import T18
 from .fuelProduction import FuelProduction, TotalFuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Production:
     petrol: FuelProduction
     jetfuel: FuelProduction
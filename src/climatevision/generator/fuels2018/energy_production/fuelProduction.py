@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class FuelProduction:
     CO2e_production_based: float
     CO2e_production_based_per_MWh: float
@@ -29,7 +29,7 @@ class FuelProduction:
         self.CO2e_total = self.CO2e_production_based + self.CO2e_combustion_based
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TotalFuelProduction:
     CO2e_production_based: float
     CO2e_combustion_based: float
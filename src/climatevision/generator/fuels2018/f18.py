@@ -8,7 +8,7 @@ from .energy_demand import EnergyDemand
 from .energy_production import FuelProduction, TotalFuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class F18:
     d: EnergyDemand
     d_r: EnergyDemand
@@ -12,7 +12,7 @@ from ...common.energy import Energy as EnergyDemand
 from ..energy_production.newEFuelProduction import NewEFuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Demand:
     residences: EnergyDemand
     business: EnergyDemand
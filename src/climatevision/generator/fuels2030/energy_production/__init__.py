@@ -20,7 +20,7 @@ from .eFuels import EFuels
 from .totalEFuelProduction import TotalEFuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Production:
     petrol: EFuelProduction
     jetfuel: EFuelProduction
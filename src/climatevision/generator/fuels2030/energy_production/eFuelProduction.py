@@ -7,7 +7,7 @@ from ...utils import div
 from ...fuels2018.energy_production import FuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EFuelProduction:
     """This computes the replacement of fossil fuels by corresponding E-fuels.
     (e.g. petrol -> epetrol).
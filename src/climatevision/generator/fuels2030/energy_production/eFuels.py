@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .eFuelProduction import EFuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EFuels:
     change_CO2e_t: float
     energy: float
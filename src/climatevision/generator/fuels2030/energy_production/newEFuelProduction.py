@@ -6,7 +6,7 @@ from ...inputs import Inputs
 from ...utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class NewEFuelProduction:
     """Production of new style of efuels that are not yet used (at an industrial scale)."""
 
@@ -10,7 +10,7 @@ from .newEFuelProduction import NewEFuelProduction
 from .fuelWithoutDirectReplacement import FuelWithoutDirectReplacement
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class TotalEFuelProduction:
     CO2e_production_based: float
     CO2e_total: float
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .energy_production import TotalEFuelProduction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class F:
     CO2e_production_based: float
     CO2e_total: float
@@ -13,7 +13,7 @@ from .energy_production import (
 from .f import F
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class F30:
     d: EnergyDemand
     d_r: EnergyDemand
@@ -1,12 +1,22 @@
 # pyright: strict
 
-from dataclasses import dataclass, fields, is_dataclass
+from concurrent.futures import Executor
+from dataclasses import dataclass, fields
 from time import time
-from sys import stderr
+from typing import Any, Iterable, TextIO
+import logging
 
+from . import numeric
 from .inputs import Inputs
+from .instrumentation import Instrumentation
 from .refdata import RefData
-from .makeentries import make_entries
+from .makeentries import make_entries, make_entries_batch, Entries
+from .resultdict import (
+    dataclass_to_result_dict,
+    projected_result_dict,
+    write_result_json,
+)
+from .scheduler import Recording, Schedule, Step
 from .bisko import Bisko
 from .methodology183x import M183X
 from .lulucf2030 import lulucf2030_pyr
@@ -56,36 +66,7 @@ from . import industry2030
 
 from . import methodology183x
 
-
-def _convert_item(v: object) -> object:
-    if is_dataclass(v) and not isinstance(v, type):
-        return dataclass_to_result_dict(v)
-    else:
-        return v
-
-
-def dataclass_to_result_dict(v: object) -> dict[str, object]:
-    """This does basically the same as asdict from dataclasses does.
-
-    The most important difference is that classes can contain a list
-    called LIFT_INTO_RESULT_DICT and will list all values contained
-    in that dictionary into the resulting dictionary.
-    """
-    result = {f.name: _convert_item(getattr(v, f.name)) for f in fields(v)}
-    names_to_lift: list[str] = getattr(v, "LIFT_INTO_RESULT_DICT", [])
-    values_to_lift: list[dict[str, object]] = []
-    for name in names_to_lift:
-        v = result[name]
-        if isinstance(v, dict):
-            values_to_lift.append(v)  # type: ignore
-            del result[name]
-        else:
-            assert (
-                False
-            ), f"LIFT_INTO_RESULT_DICT encountered {v} at {name} -- which is not a dictionary"
-    for v in values_to_lift:
-        result.update(v)
-    return result
+log = logging.getLogger(__name__)
 
 
 @dataclass(kw_only=True)
@@ -115,199 +96,218 @@ class Result:
     m183X: M183X
     bisko: Bisko
 
-    def result_dict(self):
+    def result_dict(self, *, paths: list[str] | None = None) -> dict[str, Any]:
+        """The whole result as a dict, or only the values whose path matches one of
+        the glob patterns in paths (e.g. "bisko.total", "m183X.*")."""
+        if paths is not None:
+            return projected_result_dict(self, paths)
         return dataclass_to_result_dict(self)
 
-
-def calculate(inputs: Inputs) -> Result:
-    """This is the entry point to the actual calculation."""
+    def write_json(self, fp: TextIO, *, indent: int | None = None) -> None:
+        """The same as json.dump(self.result_dict(), fp, indent=indent), only faster."""
+        write_result_json(self, fp, indent=indent)
+
+
+numeric.choose_classes(Result)
+
+SCHEDULE = Schedule(
+    [
+        # 2018
+        Step(name="r18", label="Residence2018_calc", fn=residences2018.calc),
+        Step(name="b18", label="Business2018_calc", fn=business2018.calc),
+        Step(name="i18", label="Industry2018_calc", fn=industry2018.calc),
+        Step(name="t18", label="Transport2018_calc", fn=transport2018.calc),
+        Step(name="f18", label="Fuels2018_calc", fn=fuels2018.calc),
+        Step(name="l18", label="Lulucf2018_calc", fn=lulucf2018.calc),
+        Step(name="a18", label="Agri2018_calc", fn=agri2018.calc),
+        Step(name="e18", label="Electricity2018_calc", fn=electricity2018.calc),
+        Step(name="h18", label="Heat2018_calc", fn=heat2018.calc),
+        # target year
+        Step(name="t30", label="Transport2030", fn=transport2030.calc),
+        Step(name="i30", label="Industry2030", fn=industry2030.calc),
+        # Also sets some values of r18 that are only known now
+        Step(
+            name="r30",
+            label="Residenctial2030",
+            fn=residences2030.calc,
+            updates="r18",
+        ),
+        Step(name="b30", label="Business2030_calc", fn=business2030.calc),
+        Step(name="l30", label="Lulucf2030_calc", fn=lulucf2030.calc),
+        Step(name="a30", label="Agri2030_calc", fn=agri2030.calc),
+        Step(
+            name="p_local_biomass",
+            label="Electricity2030_calc_biomass",
+            fn=electricity2030_core.calc_biomass,
+        ),
+        Step(
+            name="p_local_biomass_cogen",
+            label="Electricity2030_calc_biomass_cogen",
+            fn=electricity2030_core.calc_biomass_cogen,
+        ),
+        Step(name="h30", label="Heat2030_calc", fn=heat2030.calc),
+        Step(name="f30", label="Fuels2030_calc", fn=fuels2030.calc),
+        # Also fills in the rest of p_local_biomass
+        Step(
+            name="e30",
+            label="Electricity2030_calc",
+            fn=electricity2030.calc,
+            updates="p_local_biomass",
+        ),
+        Step(
+            name="m183X", label="Methodology2030_calc", fn=methodology183x.calc_budget
+        ),
+        Step(
+            name="l30_pyr",
+            label="Lulucf2030_calcPyr",
+            fn=lulucf2030_pyr.calc,
+            updates="l30",
+        ),
+        Step(
+            name="m183X_z",
+            label="Methodology2030_calcZ",
+            fn=methodology183x.calc_z,
+            updates="m183X",
+        ),
+        Step(name="bisko", label="Bisko_calc", fn=Bisko.calc),
+    ]
+)
+
+
+def calculate(
+    inputs: Inputs,
+    *,
+    executor: Executor | None = None,
+    instrumentation: Instrumentation | None = None,
+) -> Result:
+    """This is the entry point to the actual calculation.
+
+    The sectors are calculated one after the other, unless an executor is given. In that
+    case sectors that do not depend on each other are calculated concurrently on the
+    executor (which must be a ThreadPoolExecutor or similar, see Schedule.run).
+
+    If instrumentation is given, it is told what the calculation of every sector cost
+    (see instrumentation.StepStatistics).
+    """
     start_t = time()
-    # 2018
-    print("Residence2018_calc", file=stderr)
-    r18 = residences2018.calc(inputs)
-
-    print("Business2018_calc", file=stderr)
-    b18 = business2018.calc(inputs, r18=r18)
-
-    print("Industry2018_calc", file=stderr)
-    i18 = industry2018.calc(inputs)
-
-    print("Transport2018_calc", file=stderr)
-    t18 = transport2018.calc(inputs)
-
-    print("Fuels2018_calc", file=stderr)
-    f18 = fuels2018.calc(inputs, t18=t18)
-
-    print("Lulucf2018_calc", file=stderr)
-    l18 = lulucf2018.calc(inputs)
-
-    print("Agri2018_calc", file=stderr)
-    a18 = agri2018.calc(inputs, l18=l18, b18=b18)
-
-    print("Electricity2018_calc", file=stderr)
-    e18 = electricity2018.calc(inputs, t18=t18)
-
-    print("Heat2018_calc", file=stderr)
-    h18 = heat2018.calc(inputs, t18=t18, e18=e18)
-
+    with numeric.using(inputs.numeric):
+        results = SCHEDULE.run(
+            inputs, executor=executor, instrumentation=instrumentation
+        )
     end_t = time()
-    print(
-        "elapsed time for 18-sectors: {:5.3f}s".format(end_t - start_t),
-        file=stderr,
-    )
-
-    # target year
-    print("Transport2030", file=stderr)
-    t30 = transport2030.calc(inputs, t18=t18)
-
-    print("Industry2030", file=stderr)
-    i30 = industry2030.calc(inputs, i18=i18)
-
-    print("Residenctial2030", file=stderr)
-    r30 = residences2030.calc(inputs, r18=r18, b18=b18)
-
-    print("Business2030_calc", file=stderr)
-    b30 = business2030.calc(inputs, b18=b18, r18=r18, r30=r30)
+    log.info("elapsed time for all sectors: %5.3fs", end_t - start_t)
+    return Result(**{f.name: results[f.name] for f in fields(Result)})
 
-    print("Lulucf2030_calc", file=stderr)
-    l30 = lulucf2030.calc(inputs, l18=l18)
 
-    print("Agri2030_calc", file=stderr)
-    a30 = agri2030.calc(inputs, a18=a18, l30=l30)
-
-    print("Electricity2030_calc_biomass", file=stderr)
-    p_local_biomass = electricity2030_core.calc_biomass(inputs)
-    p_local_biomass_cogen = electricity2030_core.calc_biomass_cogen(
-        inputs, p_local_biomass=p_local_biomass
-    )
-
-    print("Heat2030_calc", file=stderr)
-    h30 = heat2030.calc(
-        inputs,
-        h18=h18,
-        r30=r30,
-        b30=b30,
-        a30=a30,
-        i30=i30,
-        p_local_biomass_cogen=p_local_biomass_cogen,
-    )
-
-    print("Fuels2030_calc", file=stderr)
-    f30 = fuels2030.calc(
-        inputs, f18=f18, a30=a30, b30=b30, h30=h30, i30=i30, r30=r30, t30=t30
-    )
-
-    print("Electricity2030_calc", file=stderr)
-    e30 = electricity2030.calc(
+@dataclass(kw_only=True)
+class Calculation:
+    """A Result together with everything calculate_incremental needs to update it."""
+
+    inputs: Inputs
+    result: Result
+    recording: Recording
+
+
+def _changed_entries(old: Entries, new: Entries) -> set[str]:
+    changed: set[str] = set()
+    for f in fields(Entries):
+        old_value = getattr(old, f.name)
+        new_value = getattr(new, f.name)
+        # An int replaced by the equal float still changes the result (dict)
+        if type(old_value) is not type(new_value) or old_value != new_value:
+            changed.add(f.name)
+    return changed
+
+
+def calculate_incremental(
+    inputs: Inputs,
+    previous: Calculation | None = None,
+    *,
+    instrumentation: Instrumentation | None = None,
+) -> Calculation:
+    """Like calculate, but remembers which entries every sector reads. So when called again
+    with the previous calculation and inputs whose entries differ in only a few fields
+    (e.g. because the user changed an override), only the sectors that read one of those
+    fields and the sectors that depend on them are recalculated.
+    """
+    start_t = time()
+    with numeric.using(inputs.numeric):
+        recording = _run_incremental(inputs, previous, instrumentation)
+    end_t = time()
+    log.info("elapsed time for all sectors: %5.3fs", end_t - start_t)
+    result = Result(**{f.name: recording.results[f.name] for f in fields(Result)})
+    return Calculation(inputs=inputs, result=result, recording=recording)
+
+
+def _run_incremental(
+    inputs: Inputs,
+    previous: Calculation | None,
+    instrumentation: Instrumentation | None,
+) -> Recording:
+    if (
+        previous is None
+        or previous.inputs.facts_and_assumptions() is not inputs.facts_and_assumptions()
+        or previous.inputs.numeric is not inputs.numeric
+    ):
+        return SCHEDULE.run_incremental(inputs, instrumentation=instrumentation)
+    return SCHEDULE.run_incremental(
         inputs,
-        e18=e18,
-        r18=r18,
-        b18=b18,
-        a30=a30,
-        b30=b30,
-        f30=f30,
-        h30=h30,
-        i30=i30,
-        r30=r30,
-        t30=t30,
-        p_local_biomass_cogen=p_local_biomass_cogen,
-        p_local_biomass=p_local_biomass,
+        previous=previous.recording,
+        changed=_changed_entries(previous.inputs.entries, inputs.entries),
+        instrumentation=instrumentation,
     )
 
-    print("Methodology2030_calc", file=stderr)
-    m183X = methodology183x.calc_budget(
-        inputs,
-        a18=a18,
-        b18=b18,
-        e18=e18,
-        f18=f18,
-        h18=h18,
-        i18=i18,
-        l18=l18,
-        r18=r18,
-        t18=t18,
-    )
 
-    print("Lulucf2030_calcPyr", file=stderr)
-    lulucf2030_pyr.calc(
-        inputs,
-        l18=l18,
-        l30=l30,
-        a30=a30,
-        b30=b30,
-        e30=e30,
-        f30=f30,
-        h30=h30,
-        i30=i30,
-        r30=r30,
-        t30=t30,
-    )
+# The 2018 sectors, which only depend on the AGS and not on the target year
+BASELINE_SECTORS = ["r18", "b18", "i18", "t18", "f18", "l18", "a18", "e18", "h18"]
+# Fails to build if a 2018 sector ever depends on any other sector
+BASELINE = Schedule([step for step in SCHEDULE.steps if step.name in BASELINE_SECTORS])
 
-    print("Methodology2030_calcZ", file=stderr)
-    methodology183x.calc_z(
-        inputs,
-        m183X=m183X,
-        a18=a18,
-        b18=b18,
-        e18=e18,
-        f18=f18,
-        h18=h18,
-        i18=i18,
-        l18=l18,
-        r18=r18,
-        t18=t18,
-        a30=a30,
-        b30=b30,
-        e30=e30,
-        f30=f30,
-        h30=h30,
-        i30=i30,
-        l30=l30,
-        r30=r30,
-        t30=t30,
-    )
 
-    print("Bisko_calc", file=stderr)
-    bisko = Bisko.calc(
-        inputs,
-        r18=r18,
-        b18=b18,
-        i18=i18,
-        t18=t18,
-        f18=f18,
-        l18=l18,
-        a18=a18,
-        e18=e18,
-        h18=h18,
-    )
+def calculate_years(
+    ags: str,
+    years: Iterable[int],
+    *,
+    executor: Executor | None = None,
+    instrumentation: Instrumentation | None = None,
+) -> dict[int, Result]:
+    """Calculate with default inputs for every year in years.
 
-    return Result(
-        r18=r18,
-        b18=b18,
-        i18=i18,
-        t18=t18,
-        f18=f18,
-        l18=l18,
-        a18=a18,
-        e18=e18,
-        h18=h18,
-        t30=t30,
-        i30=i30,
-        r30=r30,
-        b30=b30,
-        f30=f30,
-        e30=e30,
-        l30=l30,
-        a30=a30,
-        h30=h30,
-        m183X=m183X,
-        bisko=bisko,
-    )
+    The 2018 sectors are only calculated once and then reused for every year. The result
+    for every year is identical to the one returned by calculate_with_default_inputs.
+    """
+    refdata = RefData.cached()
+    years = list(years)
+    batch = make_entries_batch(refdata, [ags], years)
+    facts_and_assumptions = refdata.facts_and_assumptions()
+    baseline: dict[str, Any] | None = None
+    results: dict[int, Result] = {}
+    for year in years:
+        inputs = Inputs(
+            facts_and_assumptions=facts_and_assumptions,
+            entries=batch.entries(ags, year),
+        )
+        start_t = time()
+        with numeric.using(inputs.numeric):
+            if baseline is None:
+                baseline = BASELINE.run(
+                    inputs, executor=executor, instrumentation=instrumentation
+                )
+            step_results = SCHEDULE.run(
+                inputs,
+                executor=executor,
+                known=baseline,
+                instrumentation=instrumentation,
+            )
+        end_t = time()
+        log.info("elapsed time for all sectors: %5.3fs", end_t - start_t)
+        results[year] = Result(**{f.name: step_results[f.name] for f in fields(Result)})
+    return results
 
 
 def calculate_with_default_inputs(ags: str, year: int) -> Result:
     """Calculate without the ability to override entries."""
-    refdata = RefData.load()
+    refdata = RefData.cached()
     entries = make_entries(refdata, ags=ags, year=year)
     inputs = Inputs(
         facts_and_assumptions=refdata.facts_and_assumptions(), entries=entries
@@ -13,7 +13,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Production:
     total: HeatProduction
     gas: HeatProduction
@@ -6,7 +6,7 @@ from typing import Any
 from ...utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class HeatProduction:
     CO2e_combustion_based: float
     CO2e_combustion_based_per_MWh: float
@@ -89,7 +89,7 @@ class HeatProduction:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     CO2e_production_based: float = 0
     CO2e_combustion_based: float
@@ -106,11 +106,12 @@ class Vars6:
         self.energy = energy
         self.pct_energy = div(energy, total_energy)
 
+        self.CO2e_production_based = 0
         self.CO2e_combustion_based = CO2e_combustion_based
         self.CO2e_total = CO2e_combustion_based
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8FromEnergySum:
     CO2e_production_based: float
     CO2e_production_based_per_MWh: float
@@ -131,4 +132,5 @@ class Vars8FromEnergySum:
 
         self.CO2e_production_based_per_MWh = CO2e_production_based_per_MWh
         self.CO2e_production_based = CO2e_production_based
+        self.CO2e_combustion_based = 0
         self.CO2e_total = self.CO2e_production_based
@@ -12,7 +12,7 @@ from .energy_production import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class H18:
     d: EnergyDemand
     d_r: EnergyDemand
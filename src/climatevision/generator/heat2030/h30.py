@@ -22,7 +22,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class H30:
     h: Vars0
     g: Vars1
@@ -14,7 +14,7 @@ from .production_branches import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Production:
 
     p: ProductionSum
@@ -6,7 +6,7 @@ from ..inputs import Inputs
 from ..common.energy import Energy, EnergyWithPercentage
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class EnergySupply:
     s: EnergyWithPercentage
     s_fossil: Energy
@@ -13,7 +13,7 @@ from .production_branches import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class I18:
     i: ProductionSum
     p: ProductionSum
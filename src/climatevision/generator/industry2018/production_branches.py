@@ -6,7 +6,7 @@ from ..inputs import Inputs
 from ..utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductionSubBranch:
     energy: float
     pct_energy: float
@@ -66,7 +66,7 @@ class ProductionSubBranch:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductionSubBranchCO2viaFEC:
     """This class is only used by p_other_further as we were not able to determine a production volume for this quantitiy
     Therefore we set the prod_volume to 100% an and calculate the CO2e Emissiones via a Emmissions/Energy_consumption - Factor"""
@@ -126,7 +126,7 @@ class ProductionSubBranchCO2viaFEC:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ExtraEmission:
     """This is only used by p_other_2efgh. We are adding some additional prouction based emissions as we so not include them in p_other_further."""
 
@@ -154,7 +154,7 @@ class ExtraEmission:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductionSubSum:
     energy: float
     pct_energy: float
@@ -195,7 +195,7 @@ class ProductionSubSum:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductionBranch:
     energy: float
     prod_volume: float
@@ -245,7 +245,7 @@ class ProductionBranch:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ProductionSum:
     energy: float
     prod_volume: float
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars0:
     # Used by g
     cost_wage: float = None  # type: ignore
@@ -16,7 +16,7 @@ class Vars0:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars1:
     # Used by g_consult
     cost_wage: float = None  # type: ignore
@@ -32,7 +32,7 @@ class Vars1:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars2:
     # Used by i
     CO2e_combustion_based: float = None  # type: ignore
@@ -56,7 +56,7 @@ class Vars2:
     invest_pa_outside: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars3:
     # Used by p
     CO2e_combustion_based: float = None  # type: ignore
@@ -85,7 +85,7 @@ class Vars3:
     prod_volume: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars4:
     # Used by p_miner
     CO2e_combustion_based: float = None  # type: ignore
@@ -111,7 +111,7 @@ class Vars4:
     prod_volume: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars5:
     # Used by p_miner_cement, p_miner_chalk, p_chem_basic, p_chem_other
     CO2e_combustion_based: float = None  # type: ignore
@@ -141,7 +141,7 @@ class Vars5:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     # Used by p_miner_glas, p_chem_ammonia, p_metal_steel_secondary
     CO2e_combustion_based: float = None  # type: ignore
@@ -170,7 +170,7 @@ class Vars6:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars7:
     # Used by p_miner_ceram, p_metal_nonfe
     CO2e_combustion_based: float = None  # type: ignore
@@ -201,7 +201,7 @@ class Vars7:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8:
     # Used by p_chem
     CO2e_combustion_based: float = None  # type: ignore
@@ -225,7 +225,7 @@ class Vars8:
     prod_volume: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars9:
     # Used by p_metal
     CO2e_combustion_based: float = None  # type: ignore
@@ -250,7 +250,7 @@ class Vars9:
     prod_volume: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars10:
     # Used by p_metal_steel
     CO2e_combustion_based: float = None  # type: ignore
@@ -273,7 +273,7 @@ class Vars10:
     prod_volume: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars11:
     # Used by p_metal_steel_primary
     CO2e_combustion_based: float = None  # type: ignore
@@ -303,7 +303,7 @@ class Vars11:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars12:
     # Used by p_other
     CO2e_combustion_based: float = None  # type: ignore
@@ -328,7 +328,7 @@ class Vars12:
     prod_volume: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars13:
     # Used by p_other_paper, p_other_food
     CO2e_combustion_based: float = None  # type: ignore
@@ -358,7 +358,7 @@ class Vars13:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars14:
     # Used by p_other_further
     CO2e_combustion_based: float = None  # type: ignore
@@ -389,7 +389,7 @@ class Vars14:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars15:
     # Used by p_other_2efgh
     CO2e_production_based: float = None  # type: ignore
@@ -410,7 +410,7 @@ class Vars15:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars16:
     # Used by s, s_fossil_gas, s_fossil_coal, s_fossil_diesel, s_fossil_fueloil, s_fossil_lpg, s_fossil_opetpro, s_fossil_ofossil, s_renew, s_renew_hydrogen, s_renew_emethan, s_renew_biomass, s_renew_heatnet, s_renew_heatpump, s_renew_solarth, s_renew_elec
     energy: float
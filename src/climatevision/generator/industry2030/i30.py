@@ -23,7 +23,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class I30:
     g: Vars0
     g_consult: Vars1
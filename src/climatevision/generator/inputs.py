@@ -19,6 +19,7 @@ calculation (most famously electricity basically depends on everything else).
 from dataclasses import dataclass
 
 from .makeentries import Entries
+from .numeric import Numeric, current
 from .refdata import FactsAndAssumptions
 
 
@@ -28,10 +29,20 @@ class Inputs:
         self,
         facts_and_assumptions: FactsAndAssumptions,
         entries: Entries,
+        numeric: Numeric | None = None,
     ):
-        self._facts_and_assumptions = facts_and_assumptions
+        """numeric is the kind of numbers the calculation is done with. By default the
+        one in use when the inputs are created (see numeric.using)."""
+        self.numeric = numeric if numeric is not None else current()
+        self._original_facts_and_assumptions = facts_and_assumptions
+        self._facts_and_assumptions = self.numeric.facts_and_assumptions(
+            facts_and_assumptions
+        )
         self.entries = entries
 
+    def facts_and_assumptions(self) -> FactsAndAssumptions:
+        return self._original_facts_and_assumptions
+
     def fact(self, keyname: str) -> float:
         """Statistics about the past. Must be able to give a source for each fact."""
         return self._facts_and_assumptions.fact(keyname)
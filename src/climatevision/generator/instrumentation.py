@@ -0,0 +1,151 @@
+"""Module instrumentation -- measure what every step of the calculation costs.
+
+Pass an Instrumentation to calculate (or Schedule.run) and it is told the wall time,
+the CPU time and optionally the memory allocated by every step. StepStatistics adds
+those measurements up over as many calculations as you like.
+
+Allocations are measured with tracemalloc, which slows the calculation down a lot, so
+it is only done when asked for. They are only meaningful when the steps run one after
+the other (i.e. without an executor), as tracemalloc can not tell threads apart.
+"""
+
+# pyright: strict
+
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from threading import Lock
+from time import perf_counter, thread_time
+from typing import Any, Callable, Generator
+import tracemalloc
+
+
+@dataclass(kw_only=True, frozen=True)
+class StepMeasurement:
+    name: str  # The name of the step
+    label: str
+    wall: float  # Seconds
+    cpu: float  # Seconds the thread that ran the step spent on the CPU
+    # Bytes allocated by the step that were not freed again, and the peak during the
+    # step (both relative to what was allocated before). None unless measured.
+    allocated: int | None = None
+    peak: int | None = None
+
+
+class Instrumentation:
+    """Receives a StepMeasurement after every step. Override step_done to do something
+    with them."""
+
+    measure_allocations: bool = False
+
+    def step_done(self, m: StepMeasurement) -> None:
+        pass
+
+
+@dataclass(kw_only=True)
+class StepStats:
+    count: int = 0
+    wall: float = 0.0
+    wall_max: float = 0.0
+    cpu: float = 0.0
+    allocated: int = 0
+    peak_max: int = 0
+
+
+class StepStatistics(Instrumentation):
+    """Adds up the measurements of every step over many calculations. Steps may be
+    done on several threads at once (see calculate with an executor)."""
+
+    def __init__(self, *, measure_allocations: bool = False):
+        self.measure_allocations = measure_allocations
+        self.steps: dict[str, StepStats] = {}
+        self._lock = Lock()
+
+    def step_done(self, m: StepMeasurement) -> None:
+        with self._lock:
+            stats = self.steps.get(m.name)
+            if stats is None:
+                stats = StepStats()
+                self.steps[m.name] = stats
+            stats.count += 1
+            stats.wall += m.wall
+            stats.wall_max = max(stats.wall_max, m.wall)
+            stats.cpu += m.cpu
+            if m.allocated is not None:
+                stats.allocated += m.allocated
+            if m.peak is not None:
+                stats.peak_max = max(stats.peak_max, m.peak)
+
+    def report(self) -> str:
+        """A table of all steps, the most expensive (in total wall time) first."""
+        lines = [
+            f"{'step':<24}{'count':>8}{'wall ms':>10}{'max ms':>10}{'cpu ms':>10}"
+            + (
+                ""
+                if not self.measure_allocations
+                else f"{'alloc kB':>10}{'peak kB':>10}"
+            )
+        ]
+        with self._lock:
+            steps = [(name, replace(s)) for name, s in self.steps.items()]
+        by_wall = sorted(steps, key=lambda kv: kv[1].wall, reverse=True)
+        for name, s in by_wall:
+            line = (
+                f"{name:<24}{s.count:>8}{1000 * s.wall / s.count:>10.3f}"
+                f"{1000 * s.wall_max:>10.3f}{1000 * s.cpu / s.count:>10.3f}"
+            )
+            if self.measure_allocations:
+                line += (
+                    f"{s.allocated / s.count / 1024:>10.1f}{s.peak_max / 1024:>10.1f}"
+                )
+            lines.append(line)
+        return "\n".join(lines)
+
+
+@contextmanager
+def tracing_allocations(
+    instrumentation: Instrumentation | None,
+) -> Generator[None, None, None]:
+    """Make sure tracemalloc is tracing if instrumentation measures allocations."""
+    start = (
+        instrumentation is not None
+        and instrumentation.measure_allocations
+        and not tracemalloc.is_tracing()
+    )
+    if start:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if start:
+            tracemalloc.stop()
+
+
+def measured(
+    instrumentation: Instrumentation, name: str, label: str, fn: Callable[[], Any]
+) -> Any:
+    """Call fn and tell instrumentation what that cost.
+
+    tracemalloc must already be tracing if allocations are measured (see
+    tracing_allocations).
+    """
+    allocated: int | None = None
+    peak: int | None = None
+    before = 0
+    if instrumentation.measure_allocations:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+    start_wall = perf_counter()
+    start_cpu = thread_time()
+    result = fn()
+    cpu = thread_time() - start_cpu
+    wall = perf_counter() - start_wall
+    if instrumentation.measure_allocations:
+        current, current_peak = tracemalloc.get_traced_memory()
+        allocated = current - before
+        peak = current_peak - before
+    instrumentation.step_done(
+        StepMeasurement(
+            name=name, label=label, wall=wall, cpu=cpu, allocated=allocated, peak=peak
+        )
+    )
+    return result
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars0:
     # Used by l
     CO2e_combustion_based: float = None  # type: ignore
@@ -11,7 +11,7 @@ class Vars0:
     CO2e_total: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars1:
     # Used by g
     CO2e_combustion_based: float = None  # type: ignore
@@ -20,7 +20,7 @@ class Vars1:
     area_ha: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars3:
     # Used by g_forest
     CO2e_combustion_based: float = None  # type: ignore
@@ -30,7 +30,7 @@ class Vars3:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars4:
     # Used by g_forest_managed
     CO2e_combustion_based: float = None  # type: ignore
@@ -42,7 +42,7 @@ class Vars4:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars5:
     # Used by g_forest_natural, g_crop_min_conv, g_crop_org_low, g_crop_org_high, g_grass_min_conv, g_grass_org_low, g_grass_org_high, g_grove_min, g_grove_org_low, g_grove_org_high, g_wet_min, g_wet_org_low, g_wet_org_high, g_water_min, g_water_org_low, g_water_org_high, g_settlement_min, g_settlement_org_low, g_settlement_org_high
     CO2e_production_based: float = None  # type: ignore
@@ -52,7 +52,7 @@ class Vars5:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     # Used by g_crop, g_crop_org, g_grass, g_grass_org, g_grove, g_grove_org, g_wet, g_wet_org, g_water, g_water_org, g_settlement, g_settlement_org
     CO2e_production_based: float = None  # type: ignore
@@ -61,13 +61,13 @@ class Vars6:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars7:
     # Used by g_crop_min_hum, g_wet_org_r, pyrolysis
     CO2e_total: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8:
     # Used by g_other, g_wood
     CO2e_production_based: float = None  # type: ignore
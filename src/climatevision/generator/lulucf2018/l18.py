@@ -14,7 +14,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class L18:
     l: Vars0
     g: Vars1
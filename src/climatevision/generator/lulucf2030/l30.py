@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .dataclasses import LColVars2030
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class L30:
     l: LColVars2030
     g: LColVars2030
@@ -1,9 +1,13 @@
 # pyright: strict
 
 from dataclasses import dataclass
+from math import nan
+from typing import Any, Iterable, cast
 
+from . import numeric
 from .utils import div
-from .refdata import RefData, Row
+from .refdata import DATASETS, DataFrame, LookupFailure, RefData, Row
+from .vector import Divergence, Vector
 
 # FIXME: This block should die
 
@@ -181,6 +185,44 @@ class Entries:
 
 
 def make_entries(data: RefData, ags: str, year: int) -> Entries:
+    return Entries(**_ags_fields(data, ags), **_year_fields(data, year))
+
+
+def _year_fields(data: RefData, year: int) -> dict[str, Any]:
+    """The fields of Entries that only depend on the target year."""
+    # m_year_today = date.today.year
+    m_year_today = 2022  # TODO replace by above
+
+    m_year_target = year
+
+    m_duration_target = m_year_target - m_year_today
+    m_duration_target_until_2050 = 2050 - m_year_target
+    m_duration_neutral = float(m_duration_target_until_2050 + m_duration_target / 2)
+
+    m_GHG_budget_2016_to_year_target = data.co2path(year).float(
+        "GHG_budget_2016_to_year"
+    )
+    m_nonCO2_budget_2016_to_year_target = data.co2path(year).float(
+        "nonCO2_budget_2016_to_year"
+    )
+
+    return dict(
+        m_duration_neutral=m_duration_neutral,
+        m_duration_target=m_duration_target,
+        m_duration_target_until_2050=m_duration_target_until_2050,
+        m_GHG_budget_2016_to_year_target=m_GHG_budget_2016_to_year_target,
+        m_nonCO2_budget_2016_to_year_target=m_nonCO2_budget_2016_to_year_target,
+        m_year_target=m_year_target,
+        m_year_today=m_year_today,
+    )
+
+
+def _ags_fields(data: RefData, ags: str) -> dict[str, Any]:
+    """All other fields of Entries.
+
+    make_entries_batch passes many AGS at once as ags (see there). So everything here
+    must also work with a Vector in place of every AGS and every number looked up.
+    """
     # ags identifies the community (Kommune)
     ags_dis = ags[:5]  # This identifies the administrative district (Landkreis)
     ags_sta = ags[:2]  # This identifies the federal state (Bundesland)
@@ -191,19 +233,18 @@ def make_entries(data: RefData, ags: str, year: int) -> Entries:
 
     ags = ags
 
-    # m_year_today = date.today.year
-    m_year_today = 2022  # TODO replace by above
+    # First, so that make_entries_batch splits the lanes before doing anything else
+    if ags == ags_germany or ags == ags_sta_padded or ags == ags_dis_padded:
+        t_rt7 = "nd"
+        t_rt3 = "nd"
+    else:
+        t_rt7 = data.area_kinds(ags).str("rt7")
+        t_rt3 = data.area_kinds(ags).str("rt3")
 
     m_AGS_com = ags
     m_AGS_dis = ags_dis
     m_AGS_sta = ags_sta
 
-    m_year_target = year
-
-    m_duration_target = m_year_target - m_year_today
-    m_duration_target_until_2050 = 2050 - m_year_target
-    m_duration_neutral = float(m_duration_target_until_2050 + m_duration_target / 2)
-
     m_population_com_2018 = data.population(ags).int("total")
     m_population_com_203X = m_population_com_2018
     m_population_dis = data.population(ags_dis_padded).int("total")
@@ -298,13 +339,6 @@ def make_entries(data: RefData, ags: str, year: int) -> Entries:
     r_rehab_rate_pa = data.ass("Ass_R_B_P_renovation_rate")
     r_heatnet_ratio_year_target = div(r_flats_w_heatnet, r_flats_com)
 
-    if ags == ags_germany or ags == ags_sta_padded or ags == ags_dis_padded:
-        t_rt7 = "nd"
-        t_rt3 = "nd"
-    else:
-        t_rt7 = data.area_kinds(ags).str("rt7")
-        t_rt3 = data.area_kinds(ags).str("rt3")
-
     data_renewable_energy_com = data.renewable_energy(ags)
     data_nat_energy_sta = data.nat_energy(ags_sta_padded)
     e_PV_power_inst_roof = (
@@ -693,14 +727,7 @@ def make_entries(data: RefData, ags: str, year: int) -> Entries:
         data_nat_organic_agri_sta.float("organic_farms_area") / m_area_agri_sta
     )
 
-    m_GHG_budget_2016_to_year_target = data.co2path(year).float(
-        "GHG_budget_2016_to_year"
-    )
-    m_nonCO2_budget_2016_to_year_target = data.co2path(year).float(
-        "nonCO2_budget_2016_to_year"
-    )
-
-    return Entries(
+    return dict(
         a_area_agri_com_pct_of_organic=a_area_agri_com_pct_of_organic,
         a_biomass_fec=a_biomass_fec,
         a_diesel_fec=a_diesel_fec,
@@ -783,7 +810,6 @@ def make_entries(data: RefData, ags: str, year: int) -> Entries:
         m_AGS_com=m_AGS_com,
         m_AGS_dis=m_AGS_dis,
         m_AGS_sta=m_AGS_sta,
-        m_GHG_budget_2016_to_year_target=m_GHG_budget_2016_to_year_target,
         m_area_agri_com=m_area_agri_com,
         m_area_agri_nat=m_area_agri_nat,
         m_area_agri_sta=m_area_agri_sta,
@@ -803,17 +829,11 @@ def make_entries(data: RefData, ags: str, year: int) -> Entries:
         m_area_veg_wood_com=m_area_veg_wood_com,
         m_area_water_com=m_area_water_com,
         m_area_wood_com=m_area_wood_com,
-        m_duration_neutral=m_duration_neutral,
-        m_duration_target=m_duration_target,
-        m_duration_target_until_2050=m_duration_target_until_2050,
-        m_nonCO2_budget_2016_to_year_target=m_nonCO2_budget_2016_to_year_target,
         m_population_com_2018=m_population_com_2018,
         m_population_com_203X=m_population_com_203X,
         m_population_dis=m_population_dis,
         m_population_nat=m_population_nat,
         m_population_sta=m_population_sta,
-        m_year_target=m_year_target,
-        m_year_today=m_year_today,
         r_area_m2=r_area_m2,
         r_area_m2_1flat=r_area_m2_1flat,
         r_area_m2_2flat=r_area_m2_2flat,
@@ -866,3 +886,211 @@ def make_entries(data: RefData, ags: str, year: int) -> Entries:
         t_rt7=t_rt7,
         ags=ags,
     )
+
+
+class _Lanes(Vector):
+    """The AGS passed to _ags_fields by make_entries_batch, one per lane."""
+
+    def __getitem__(self, s: slice) -> "_Lanes":
+        return _Lanes([ags[s] for ags in self.values])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, str):
+            return self._decide([ags == other for ags in self.values])
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore
+
+
+class _LanesRow:
+    """Like Row, but for the rows of the AGS of all lanes at once.
+
+    Lookups that would raise in make_entries (row not found, field not populated,
+    expected an int) do not raise here. Instead the lane is added to failed and gets
+    nan as a placeholder.
+    """
+
+    def __init__(self, df: DataFrame[str], keys: list[str], failed: set[int]):
+        self._df = df
+        self._failed = failed
+        self._ndxs: list[int] = []
+        self._not_found: list[int] = []
+        for lane, ndx in enumerate(df.indices_of(keys)):
+            if ndx is None:
+                failed.add(lane)
+                self._not_found.append(lane)
+                ndx = 0
+            self._ndxs.append(ndx)
+
+    def float(self, attr: str) -> Vector:
+        values: list[Any] = self._df.floats_at(self._ndxs, self._df.header[attr])
+        for lane in self._not_found:
+            values[lane] = nan
+        if None in values:
+            for lane, value in enumerate(values):
+                if value is None:
+                    self._failed.add(lane)
+                    values[lane] = nan
+        return Vector(values)
+
+    def int(self, attr: str) -> Vector:
+        values: list[Any] = self.float(attr).values
+        ints = [int(v) if v.is_integer() else nan for v in values]
+        for lane, value in enumerate(values):
+            if ints[lane] != ints[lane] and value == value:
+                # Not an int (and not a placeholder either)
+                self._failed.add(lane)
+        return Vector(ints)
+
+    def str(self, attr: str) -> Vector:
+        column = self._df.header[attr]
+        values = [self._df.str_at(ndx, column) for ndx in self._ndxs]
+        for lane in self._not_found:
+            values[lane] = ""
+        return Vector(values)
+
+
+class _LanesData:
+    """Stands in for the RefData when _ags_fields is called with _Lanes: the rows of the
+    AGS of all lanes are looked up at once (see _LanesRow), everything else (e.g. the
+    row of Germany, or a fact) in data."""
+
+    def __init__(self, data: RefData, failed: set[int]):
+        self._data = data
+        self._failed = failed
+        # The same rows are looked up more than once (e.g. area for every level)
+        self._rows: dict[tuple[str, tuple[str, ...]], _LanesRow] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in DATASETS:
+            return getattr(self._data, name)
+
+        def row(key: object) -> Row[Any] | _LanesRow:
+            if not isinstance(key, Vector):
+                return getattr(self._data, name)(key)
+            keys = tuple(key.values)
+            found = self._rows.get((name, keys))
+            if found is None:
+                found = _LanesRow(self._data.dataset(name), list(keys), self._failed)
+                self._rows[(name, keys)] = found
+            return found
+
+        return row
+
+
+def _ags_fields_of_lanes(
+    data: RefData, ags_list: list[str]
+) -> tuple[list[tuple[list[str], dict[str, Any]]], list[str]]:
+    """_ags_fields for many AGS at once. Returns the groups of AGS computed together
+    (with their fields) and the AGS that make_entries has to compute on its own, as it
+    probably raises for them.
+    """
+    groups: list[tuple[list[str], dict[str, Any]]] = []
+    alone: list[str] = []
+    todo = [ags_list]
+    while todo:
+        lanes = todo.pop()
+        if not lanes:
+            continue
+        failed: set[int] = set()
+        try:
+            fields = _ags_fields(
+                cast(RefData, _LanesData(data, failed)), cast(str, _Lanes(lanes))
+            )
+        except Divergence as d:
+            # E.g. communes and districts, see the t_rt7 of _ags_fields
+            todo.append([ags for ags, o in zip(lanes, d.mask) if o])
+            todo.append([ags for ags, o in zip(lanes, d.mask) if not o])
+            continue
+        except ArithmeticError:
+            # Some AGS divide by zero, find them by halving
+            if len(lanes) == 1:
+                alone.extend(lanes)
+            else:
+                todo.append(lanes[: len(lanes) // 2])
+                todo.append(lanes[len(lanes) // 2 :])
+            continue
+        except LookupFailure:
+            # Not a row of one of the AGS (e.g. Germany), so it fails for all of them
+            alone.extend(lanes)
+            continue
+        # The lanes do not influence each other, so only the failed ones are lost
+        alone.extend(ags for lane, ags in enumerate(lanes) if lane in failed)
+        groups.append((lanes, fields))
+    return groups, alone
+
+
+@dataclass(kw_only=True)
+class EntriesBatch:
+    """The Entries of many AGS for several target years. See make_entries_batch."""
+
+    # The fields (see _ags_fields) of groups of AGS, a Vector with one value per AGS
+    # wherever they differ
+    _groups: list[dict[str, Any]]
+    # The group and the lane in there of every AGS computed in a group
+    _lanes: dict[str, tuple[int, int]]
+    _year_fields: dict[int, dict[str, Any]]
+    # The Entries (or the exception raised by make_entries) of everything else
+    _alone: dict[tuple[str, int], Entries | LookupFailure | ArithmeticError]
+
+    def entries(self, ags: str, year: int) -> Entries:
+        """Returns what make_entries(data, ags, year) returns or raises what it raises."""
+        lane = self._lanes.get(ags)
+        if lane is None:
+            res = self._alone[(ags, year)]
+            if isinstance(res, Exception):
+                raise res
+            return res
+        group, ndx = lane
+        return Entries(
+            **{
+                name: v.values[ndx] if isinstance(v, Vector) else v
+                for name, v in self._groups[group].items()
+            },
+            **self._year_fields[year],
+        )
+
+
+def make_entries_batch(
+    data: RefData, ags_list: Iterable[str], years: Iterable[int]
+) -> EntriesBatch:
+    """Compute the entries of every AGS in ags_list for every year in years.
+
+    Instead of going through the reference data once per AGS like make_entries does,
+    the same code computes the fields of all AGS at once: every AGS is a lane of a
+    Vector (see vector), and the rows of all lanes are looked up column wise. The fields
+    that only depend on the target year are computed once per year. The result is bit
+    for bit identical to calling make_entries for each AGS and year.
+
+    AGS for which make_entries would raise (because some data is missing or it divides
+    by zero) are computed by make_entries. That way EntriesBatch.entries raises the same
+    exceptions make_entries would. So is every AGS if the numbers are not plain floats
+    (e.g. when tracing), as the lanes of a Vector have to be plain numbers.
+    """
+    if numeric.current() is numeric.PLAIN:
+        groups, alone = _ags_fields_of_lanes(data, list(ags_list))
+    else:
+        groups, alone = [], list(ags_list)
+    year_fields = {year: _year_fields(data, year) for year in years}
+
+    lanes: dict[str, tuple[int, int]] = {}
+    for group, (group_ags, _) in enumerate(groups):
+        for ndx, ags in enumerate(group_ags):
+            lanes.setdefault(ags, (group, ndx))
+    for ags in alone:
+        lanes.pop(ags, None)
+
+    entries: dict[tuple[str, int], Entries | LookupFailure | ArithmeticError] = {}
+    for ags in alone:
+        for year in year_fields:
+            try:
+                entries[(ags, year)] = make_entries(data, ags, year)
+            except (LookupFailure, ArithmeticError) as e:
+                entries[(ags, year)] = e
+
+    return EntriesBatch(
+        _groups=[fields for _, fields in groups],
+        _lanes=lanes,
+        _year_fields=year_fields,
+        _alone=entries,
+    )
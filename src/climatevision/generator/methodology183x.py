@@ -26,7 +26,7 @@ from .lulucf2030.l30 import L30
 from .fuels2030.f30 import F30
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class zColVars:
     energy_18: float = None  # type: ignore
     pct_energy_18: float = None  # type: ignore
@@ -63,7 +63,7 @@ class zColVars:
 
 
 # definition of variable names for sector M(ethodology) - there are no rows or columns in the excel!
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class M183X:
     # year_target: float = None
     # duration_target: float = None
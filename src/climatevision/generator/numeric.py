@@ -0,0 +1,149 @@
+"""Module numeric -- the kind of numbers the calculation is done with.
+
+Normally those are plain python floats. But the explorer also wants to know how every
+value was computed (see tracing). For that all numbers read from the reference data are
+replaced by numbers that record every operation done with them. The formulas of the
+calculation work the same with both.
+
+Which kind of numbers the calculation uses is part of its Inputs. The reference data
+(and so make_entries) uses the Numeric set by using, which is local to the current
+thread (or asyncio task). calculate sets it to the Numeric of the inputs while the
+steps run. So calculations with different kinds of numbers can run at the same time.
+
+A Numeric can also choose the class of every new instance of the result dataclasses
+(see result_class), e.g. so that tracing can tell which field a number was read from.
+The result dataclasses are only changed for that while such a Numeric is in use, so
+that the calculations with plain floats do not pay for it.
+"""
+
+# pyright: strict
+
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import fields, is_dataclass
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Callable, Generator
+
+if TYPE_CHECKING:
+    from .refdata import FactsAndAssumptions
+
+
+class Numeric:
+    """Plain floats. Subclasses (see tracing) return other numbers instead."""
+
+    # Whether result_class returns anything but the class itself
+    chooses_classes = False
+
+    def data(self, value: float, dataset: str, key: object, attr: str) -> float:
+        """A value read from the reference data."""
+        return value
+
+    def fact_or_ass(self, keyname: str, value: float) -> float:
+        """A fact or assumption read from the reference data."""
+        return value
+
+    def facts_and_assumptions(
+        self, facts_and_assumptions: "FactsAndAssumptions"
+    ) -> "FactsAndAssumptions":
+        """Where the calculation reads the facts and assumptions from."""
+        return facts_and_assumptions
+
+    def result_class(self, cls: type) -> type:
+        """The class of a new instance of the result dataclass cls: cls itself or a
+        subclass of it. Only called if chooses_classes."""
+        return cls
+
+    def scope(self) -> AbstractContextManager[None]:
+        """Entered for every with block of using this Numeric (e.g. to set up state
+        that is shared by the numbers of one calculation)."""
+        return nullcontext()
+
+
+PLAIN = Numeric()
+
+_current: ContextVar[Numeric] = ContextVar("numeric", default=PLAIN)
+
+
+def current() -> Numeric:
+    return _current.get()
+
+
+@contextmanager
+def using(numeric: Numeric) -> Generator[None, None, None]:
+    """Use numeric (in this thread) until the end of the with block."""
+    if numeric.chooses_classes:
+        _start_choosing_classes()
+    token = _current.set(numeric)
+    try:
+        with numeric.scope():
+            yield
+    finally:
+        _current.reset(token)
+        if numeric.chooses_classes:
+            _stop_choosing_classes()
+
+
+def _choosing_init(init: Callable[..., None]) -> Callable[..., None]:
+    def __init__(self: object, *args: Any, **kwargs: Any) -> None:
+        numeric = _current.get()
+        if numeric.chooses_classes:
+            # Before init, so that __post_init__ already sees the chosen class
+            object.__setattr__(self, "__class__", numeric.result_class(type(self)))
+        init(self, *args, **kwargs)
+
+    return __init__
+
+
+def _hook(t: type, seen: set[type]) -> None:
+    if t in seen or not is_dataclass(t):
+        return
+    seen.add(t)
+    init = t.__dict__.get("__init__")
+    if init is not None:
+        _hooked[t] = init
+        t.__init__ = _choosing_init(init)  # type: ignore
+    for f in fields(t):
+        if isinstance(f.type, type):
+            _hook(f.type, seen)
+    for sub in t.__subclasses__():
+        _hook(sub, seen)
+
+
+_result_classes: list[type] = []
+# The original __init__ of every class whose __init__ is replaced (see _choosing_init)
+_hooked: dict[type, Callable[..., None]] = {}
+# The number of with blocks of using a Numeric that chooses classes
+_choosing = 0
+_hook_lock = Lock()
+
+
+def choose_classes(t: type) -> None:
+    """Let the Numeric in use choose the class of every new instance of the dataclass t,
+    of the dataclasses of its fields (recursively) and of their subclasses.
+
+    That costs some time for every instance, so their __init__ is only replaced while a
+    Numeric that chooses classes is in use (in any thread)."""
+    with _hook_lock:
+        _result_classes.append(t)
+        if _choosing > 0:
+            _hook(t, set(_hooked))
+
+
+def _start_choosing_classes() -> None:
+    global _choosing
+    with _hook_lock:
+        _choosing += 1
+        if _choosing == 1:
+            seen: set[type] = set()
+            for t in _result_classes:
+                _hook(t, seen)
+
+
+def _stop_choosing_classes() -> None:
+    global _choosing
+    with _hook_lock:
+        _choosing -= 1
+        if _choosing == 0:
+            for t, init in _hooked.items():
+                t.__init__ = init  # type: ignore
+            _hooked.clear()
@@ -3,11 +3,20 @@
 """
 # pyright: strict
 
+from array import array
 from dataclasses import dataclass
+from functools import cached_property
+from math import nan
 from typing import Any, Generic, TypeVar, Callable, Iterable
 from os import path, getcwd
+from threading import Lock
 import csv
+import io
 import json
+import os
+import pickle
+
+from .numeric import PLAIN, current as current_numeric
 
 # TODO: Write small wrappers classes for each data source so that we can document
 # the columns and get better type checking from pylance.
@@ -16,9 +25,19 @@ import json
 # be used when the generator is run by members of GermanZero
 PROPRIETARY_DATA_SOURCES = frozenset(["traffic"])
 
+# Bump this whenever the in memory representation of the reference data changes,
+# so that old snapshots are no longer used.
+SNAPSHOT_FORMAT = 5
+SNAPSHOT_DIR = ".snapshots"
+
 KeyT = TypeVar("KeyT")
 
 
+def csv_path(datadir: str, what: str, filename: str = "2018") -> str:
+    repo = "proprietary" if what in PROPRIETARY_DATA_SOURCES else "public"
+    return path.join(datadir, repo, what, filename + ".csv")
+
+
 @dataclass(kw_only=True)
 class MalformedCsv(Exception):
     dataset: str
@@ -38,9 +57,54 @@ class MalformedCsv(Exception):
         return f"Excluding the key column row {self.row} of {self.dataset} has {self.row_columns} but row 0 (header) has {self.header_columns} columns"
 
 
+def _parse_float_column(
+    values: list[str],
+) -> "tuple[array[float], bytearray, dict[int, str]] | None":
+    """Parse all values of a column. Returns the values, a mask of the empty cells and
+    the raw values that _float_to_str does not give back (see DataFrame._raws), or None
+    if the column contains anything that is not a number."""
+    floats = array("d", bytes(8 * len(values)))
+    missing = bytearray(len(values))
+    raws: dict[int, str] = {}
+    for ndx, value in enumerate(values):
+        if value == "":
+            floats[ndx] = nan
+            missing[ndx] = 1
+        else:
+            try:
+                f = floats[ndx] = float(value)
+            except ValueError:
+                return None
+            if _float_to_str(f) != value:
+                raws[ndx] = value
+    return (floats, missing, raws)
+
+
+def _float_to_str(value: float) -> str:
+    """Inverse of float() for most of the values that occur in our csv files."""
+    if value.is_integer():
+        return str(int(value))
+    else:
+        return repr(value)
+
+
 class DataFrame(Generic[KeyT]):
-    _rows: dict[KeyT, list[str]]  # the list does NOT contain the reference value
-    header: dict[str, int]
+    """A table of reference data, stored column wise.
+
+    Columns that only contain numbers (or empty cells) are parsed once when loading into
+    an array of doubles plus a mask of the empty cells. All other columns are kept as
+    lists of strings.  Columns are identified by their index in the header, rows
+    by their index in _index.
+    """
+
+    _index: dict[KeyT, int]  # key -> row number
+    _floats: "list[array[float] | None]"  # None for str columns
+    _missing: list[bytearray | None]  # 1 for every empty cell, None for str columns
+    _strs: list[list[str] | None]  # None for float columns
+    # The values of float columns exactly as in the csv file (e.g. "1.50" or "007") for
+    # the cells where _float_to_str gives something else. None for str columns
+    _raws: list[dict[int, str] | None]
+    header: dict[str, int]  # does NOT contain the key column
     dataset: str
     key_column: str
 
@@ -54,16 +118,15 @@ class DataFrame(Generic[KeyT]):
         filename: str = "2018",
         set_nans_to_0_in_columns: list[str] = [],
     ) -> "DataFrame[KeyT]":
-        repo = "proprietary" if what in PROPRIETARY_DATA_SOURCES else "public"
         with open(
-            path.join(datadir, repo, what, filename + ".csv"),
+            csv_path(datadir, what, filename),
             "r",
             encoding="utf-8",
             newline="",
         ) as file:
             reader = csv.reader(file)
             header = {}
-            rows = {}
+            rows: dict[KeyT, list[str]] = {}
             set_nans_to_0_in_columns_indices = []
             key_column_ndx = 0  # in the original row without the key removed
             for row_num, r in enumerate(reader):
@@ -96,17 +159,104 @@ class DataFrame(Generic[KeyT]):
                             r[c] = "0"
 
         res = cls()
-        res._rows = rows
         if header is not None:
             res.header = header
         else:
             assert False, "Loading DataFrame failed. File was empty"
         res.dataset = what
         res.key_column = key_column
+        res._set_rows(rows)
         return res
 
+    def _set_rows(self, rows: dict[KeyT, list[str]]):
+        self._index = {key: ndx for ndx, key in enumerate(rows.keys())}
+        self._floats = []
+        self._missing = []
+        self._strs = []
+        self._raws = []
+        raw_rows = list(rows.values())
+        for column in range(len(self.header)):
+            values = [r[column] for r in raw_rows]
+            parsed = _parse_float_column(values)
+            if parsed is None:
+                self._floats.append(None)
+                self._missing.append(None)
+                self._strs.append(values)
+                self._raws.append(None)
+            else:
+                self._floats.append(parsed[0])
+                self._missing.append(parsed[1])
+                self._strs.append(None)
+                self._raws.append(parsed[2])
+
+    def index_of(self, key: KeyT) -> int:
+        """The row number of key. Raises KeyError if there is no such row."""
+        return self._index[key]
+
+    def indices_of(self, keys: list[KeyT]) -> list[int | None]:
+        """Like index_of for many keys, None for the keys without a row."""
+        index = self._index
+        return [index.get(key) for key in keys]
+
+    def float_at(self, ndx: int, column: int) -> float | None:
+        """The value in the given row and column or None if the cell is empty."""
+        floats = self._floats[column]
+        if floats is not None:
+            if self._missing[column][ndx]:  # type: ignore (the mask exists for every float column)
+                return None
+            return floats[ndx]
+        strs = self._strs[column]
+        assert strs is not None
+        value = strs[ndx]
+        if value == "":
+            return None
+        return float(value)
+
+    def floats_at(self, ndxs: list[int], column: int) -> list[float | None]:
+        """Like float_at for many rows of the same column."""
+        floats = self._floats[column]
+        missing = self._missing[column]
+        if floats is None or missing is None:
+            return [self.float_at(ndx, column) for ndx in ndxs]
+        return [None if missing[ndx] else floats[ndx] for ndx in ndxs]
+
+    def str_at(self, ndx: int, column: int) -> str:
+        """The value in the given row and column as it would appear in the csv file."""
+        floats = self._floats[column]
+        if floats is not None:
+            if self._missing[column][ndx]:  # type: ignore (the mask exists for every float column)
+                return ""
+            raw = self._raws[column].get(ndx)  # type: ignore (exists for every float column)
+            return raw if raw is not None else _float_to_str(floats[ndx])
+        strs = self._strs[column]
+        assert strs is not None
+        return strs[ndx]
+
+    def keys(self) -> Iterable[KeyT]:
+        return self._index.keys()
+
     def rows(self) -> Iterable[tuple[KeyT, list[str]]]:
-        return self._rows.items()
+        return (
+            (key, [self.str_at(ndx, c) for c in range(len(self.header))])
+            for (key, ndx) in self._index.items()
+        )
+
+    def float_rows(self) -> Iterable[tuple[KeyT, list[float]]]:
+        """Like rows, but every value is converted to a float.  Raises FieldNotPopulated
+        if a cell is empty."""
+        for key, ndx in self._index.items():
+            values: list[float] = []
+            for attr, c in self.header.items():
+                value = self.float_at(ndx, c)
+                if value is None:
+                    raise FieldNotPopulated(
+                        key_column=self.key_column,
+                        key_value=key,
+                        data_column=attr,
+                        dataset=self.dataset,
+                    )
+                values.append(value)
+            yield (key, values)
 
     @classmethod
     def load_ags(
@@ -126,16 +276,147 @@ class DataFrame(Generic[KeyT]):
         )
 
     def get(self, key: KeyT) -> list[str]:
-        return self._rows[key]
+        ndx = self._index[key]
+        return [self.str_at(ndx, c) for c in range(len(self.header))]
 
     def to_dict(self) -> dict[KeyT, dict[str, str]]:
         return {
-            key: {k: row[ndx] for k, ndx in self.header.items()}
-            for (key, row) in self._rows.items()
+            key: {k: self.str_at(ndx, c) for k, c in self.header.items()}
+            for (key, ndx) in self._index.items()
         }
 
-    def append_rows(self, rows: dict[KeyT, list[str]]):
-        self._rows.update(rows)
+    def append_rows(self, rows: "dict[KeyT, list[str]] | dict[KeyT, list[float]]"):
+        """Add (or replace) rows. Values can be given either as they would appear in the
+        csv file or as already parsed floats."""
+        for key, row in rows.items():
+            ndx = self._index.get(key)
+            if ndx is None:
+                ndx = len(self._index)
+                self._index[key] = ndx
+                for column in range(len(self.header)):
+                    self._append_cell(ndx, column, row[column])
+            else:
+                for column in range(len(self.header)):
+                    self._set_cell(ndx, column, row[column])
+
+    def _append_cell(self, ndx: int, column: int, value: str | float):
+        floats = self._floats[column]
+        missing = self._missing[column]
+        strs = self._strs[column]
+        if floats is not None and missing is not None:
+            floats.append(nan)
+            missing.append(1)
+        elif strs is not None:
+            strs.append("")
+        self._set_cell(ndx, column, value)
+
+    def _set_cell(self, ndx: int, column: int, value: str | float):
+        floats = self._floats[column]
+        missing = self._missing[column]
+        raws = self._raws[column]
+        if floats is not None and missing is not None and raws is not None:
+            raws.pop(ndx, None)
+            if not isinstance(value, str):
+                floats[ndx] = value
+                missing[ndx] = 0
+                return
+            elif value == "":
+                floats[ndx] = nan
+                missing[ndx] = 1
+                return
+            try:
+                f = floats[ndx] = float(value)
+                missing[ndx] = 0
+                if _float_to_str(f) != value:
+                    raws[ndx] = value
+                return
+            except ValueError:
+                # Not a number after all, so from now on this is a str column
+                self._strs[column] = [
+                    self.str_at(n, column) for n in range(len(floats))
+                ]
+                self._floats[column] = None
+                self._missing[column] = None
+                self._raws[column] = None
+        strs = self._strs[column]
+        assert strs is not None
+        strs[ndx] = value if isinstance(value, str) else _float_to_str(value)
+
+
+@dataclass(kw_only=True, frozen=True)
+class Dataset:
+    """Where to find one dataset of the reference data and how to parse it."""
+
+    what: str
+    filename: str = "2018"  # without the .csv suffix
+    key_column: str = "ags"
+    key_from_raw: Callable[[str], Any] = str
+    # Empty cells in these columns are set to 0 when fixing missing entries
+    nans_to_0_columns: tuple[str, ...] = ()
+
+    def path(self, datadir: str) -> str:
+        return csv_path(datadir, self.what, self.filename)
+
+    def load(self, datadir: str, *, fix_missing_entries: bool) -> DataFrame[Any]:
+        return DataFrame[Any].load(
+            datadir,
+            self.what,
+            key_column=self.key_column,
+            key_from_raw=self.key_from_raw,
+            filename=self.filename,
+            set_nans_to_0_in_columns=list(self.nans_to_0_columns)
+            if fix_missing_entries
+            else [],
+        )
+
+
+# Every dataset that is part of the reference data.
+DATASETS: dict[str, Dataset] = {
+    d.what: d
+    for d in [
+        Dataset(what="ags", filename="master"),
+        Dataset(
+            what="area",
+            nans_to_0_columns=(
+                "land_settlement",
+                "land_traffic",
+                "veg_forrest",
+                "veg_agri",
+                "veg_wood",
+                "veg_heath",
+                "veg_moor",
+                "veg_marsh",
+                "veg_plant_uncover_com",
+                "settlement_ghd",
+                "water_total",
+            ),
+        ),
+        Dataset(what="area_kinds"),
+        Dataset(what="assumptions", key_column="label"),
+        Dataset(what="buildings"),
+        Dataset(what="co2path", key_column="year", key_from_raw=int),
+        Dataset(what="destatis"),
+        Dataset(what="facts", key_column="label"),
+        Dataset(
+            what="flats",
+            nans_to_0_columns=(
+                "residential_buildings_total",
+                "buildings_1flat",
+                "buildings_2flats",
+                "buildings_3flats",
+                "buildings_dorms",
+                "residential_buildings_area_total",
+            ),
+        ),
+        Dataset(what="nat_agri"),
+        Dataset(what="nat_organic_agri", filename="2016"),
+        Dataset(what="nat_energy"),
+        Dataset(what="nat_res_buildings"),
+        Dataset(what="population", nans_to_0_columns=("total",)),
+        Dataset(what="renewable_energy"),
+        Dataset(what="traffic"),
+    ]
+}
 
 
 def _add_derived_rows_for_summable(df: DataFrame[str]) -> None:
@@ -147,18 +428,18 @@ def _add_derived_rows_for_summable(df: DataFrame[str]) -> None:
     data, we do NOT override or duplicate it.
     """
 
-    def add_to(d: dict[str, list[float]], ags: str, e: list[str]):
+    def add_to(d: dict[str, list[float]], ags: str, e: list[float]):
         if ags in d:
             for column, value in enumerate(e):
-                d[ags][column] += float(value)
+                d[ags][column] += value
         else:
-            d[ags] = [float(x) for x in e]
+            d[ags] = list(e)
 
     sums_by_sta = {}
     sums_by_dis = {}
     already_in_raw_data: set[str] = set()
 
-    for ags, row in df.rows():
+    for ags, row in df.float_rows():
         ags_sta = ags[:2] + "000000"
         ags_dis = ags[:5] + "000"
         if ags == ags_sta or ags == ags_dis:
@@ -177,11 +458,8 @@ def _add_derived_rows_for_summable(df: DataFrame[str]) -> None:
         if a in sums_by_sta:
             del sums_by_sta[a]
 
-    def values_as_strs(d: dict[str, list[float]]):
-        return {k: [str(v) for v in r] for (k, r) in d.items()}
-
-    df.append_rows(values_as_strs(sums_by_dis))
-    df.append_rows(values_as_strs(sums_by_sta))
+    df.append_rows(sums_by_dis)
+    df.append_rows(sums_by_sta)
 
 
 @dataclass(kw_only=True)
@@ -239,28 +517,32 @@ class Row(Generic[KeyT]):
         self.key_value = key_value
         self.dataset = df.dataset
         self.header = df.header
+        self.df = df
         try:
-            self.data = df.get(key_value)
+            self.ndx = df.index_of(key_value)
         except:
             raise RowNotFound(key_column=self.key_column, key_value=key_value, df=df)
 
     def float(self, attr: str) -> float:
         """Access a float attribute."""
-        value = self.data[self.header[attr]]
-        if value == "":
+        value = self.df.float_at(self.ndx, self.header[attr])
+        if value is None:
             raise FieldNotPopulated(
                 key_column=self.key_column,
                 key_value=self.key_value,
                 data_column=attr,
                 dataset=self.dataset,
             )
-        return float(value)
+        numeric = current_numeric()
+        if numeric is PLAIN:
+            return value
+        return numeric.data(value, self.dataset, self.key_value, attr)
 
     def int(self, attr: str) -> int:
         """Access an integer attribute."""
         f = self.float(attr)
         if f.is_integer():
-            if isinstance(f, float):  # type: ignore When we monkey patch this for tracing it might actually not be a float
+            if isinstance(f, float):  # type: ignore When tracing this might actually not be a float (see numeric)
                 return int(f)
             else:
                 return f
@@ -274,13 +556,13 @@ class Row(Generic[KeyT]):
 
     def str(self, attr: str) -> str:
         """Access a str attribute."""
-        return str(self.data[self.header[attr]])
+        return self.df.str_at(self.ndx, self.header[attr])
 
     def __str__(self):
         max_key_length = max((len(k) for k in self.header.keys()))
         return "\n".join(
             (
-                k.rjust(max_key_length) + "  " + str(self.data[ndx])
+                k.rjust(max_key_length) + "  " + self.df.str_at(self.ndx, ndx)
                 for (k, ndx) in self.header.items()
             )
         )
@@ -311,15 +593,37 @@ class FactOrAssumptionCompleteRow:
         )
 
 
+def _values(df: DataFrame[str]) -> dict[str, float]:
+    """The value of every fact or assumption that has a valid one."""
+    column = df.header["value"]
+    values: dict[str, float] = {}
+    for key in df.keys():
+        try:
+            value = df.float_at(df.index_of(key), column)
+        except ValueError:
+            continue
+        if value is not None:
+            values[key] = value
+    return values
+
+
 @dataclass(kw_only=True)
 class FactsAndAssumptions:
     def __init__(self, facts: DataFrame[str], assumptions: DataFrame[str]):
         self._facts = facts
         self._assumptions = assumptions
+        # fact and ass are called thousands of times per calculation, so parse all
+        # values up front.
+        self._fact_values = _values(facts)
+        self._ass_values = _values(assumptions)
 
     def fact(self, keyname: str) -> float:
         """Statistics about the past. Must be able to give a source for each fact."""
-        return Row(self._facts, keyname).float("value")
+        try:
+            return self._fact_values[keyname]
+        except KeyError:
+            # Raises the appropriate LookupFailure
+            return Row(self._facts, keyname).float("value")
 
     def complete_fact(self, keyname: str) -> FactOrAssumptionCompleteRow:
         r = Row(self._facts, keyname)
@@ -331,7 +635,11 @@ class FactsAndAssumptions:
 
     def ass(self, keyname: str) -> float:
         """Similar to fact, but these try to describe the future. And are therefore based on various assumptions."""
-        return Row(self._assumptions, keyname).float("value")
+        try:
+            return self._ass_values[keyname]
+        except KeyError:
+            # Raises the appropriate LookupFailure
+            return Row(self._assumptions, keyname).float("value")
 
 
 def datadir_or_default(datadir: str | None = None) -> str:
@@ -357,103 +665,239 @@ class Version:
             return cls(public=d["public"], proprietary=d["proprietary"])
 
 
+@dataclass(kw_only=True, frozen=True)
+class SnapshotKey:
+    """Identifies the inputs a snapshot of the reference data was created from.
+    A snapshot is only used if its key is equal to the key of the current data directory.
+    """
+
+    format: int
+    version: Version
+    fix_missing_entries: bool
+    # (path relative to the datadir, mtime in ns, size in bytes) of every csv file
+    stamps: tuple[tuple[str, int, int], ...]
+
+    @classmethod
+    def of_datadir(
+        cls, datadir: str, *, fix_missing_entries: bool
+    ) -> "SnapshotKey | None":
+        """Compute the key of the given datadir. Returns None if the datadir does not
+        contain all the files needed (in that case we do not use snapshots at all and leave
+        it to the normal loading code to complain)."""
+        try:
+            version = Version.load("production", datadir)
+            stamps: list[tuple[str, int, int]] = []
+            for dataset in DATASETS.values():
+                fname = dataset.path(datadir)
+                st = os.stat(fname)
+                stamps.append(
+                    (path.relpath(fname, datadir), st.st_mtime_ns, st.st_size)
+                )
+        except (OSError, KeyError, ValueError):
+            return None
+        return cls(
+            format=SNAPSHOT_FORMAT,
+            version=version,
+            fix_missing_entries=fix_missing_entries,
+            stamps=tuple(stamps),
+        )
+
+
+def snapshot_path(datadir: str, *, fix_missing_entries: bool) -> str:
+    fname = "refdata.pickle" if fix_missing_entries else "refdata-no-fixes.pickle"
+    return path.join(datadir, SNAPSHOT_DIR, fname)
+
+
+def _read_snapshot(fname: str, datadir: str, key: SnapshotKey) -> "RefData | None":
+    """Read the snapshot in one go. Returns None if there is no usable snapshot."""
+    try:
+        with open(fname, "rb") as fp:
+            blob = fp.read()
+    except OSError:
+        return None
+    try:
+        stream = io.BytesIO(blob)
+        if pickle.load(stream) != key:
+            return None
+        d = pickle.load(stream)
+    except Exception:
+        # A snapshot written by an incompatible version of the code or a truncated
+        # file.  Either way we just fall back to the csv files.
+        return None
+    if not isinstance(d, RefData):
+        return None
+    # The snapshot was made from the same files, but maybe via another path
+    d._datadir = datadir  # type: ignore (pickled by RefData)
+    d._snapshot_key = key  # type: ignore (pickled by RefData)
+    return d
+
+
+def _write_snapshot(fname: str, key: SnapshotKey, d: "RefData") -> None:
+    """Write the snapshot. Failing to do so (e.g. because the datadir is read only) is
+    not an error, it just means that the next load will be slow again."""
+    tmp_fname = f"{fname}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(path.dirname(fname), exist_ok=True)
+        with open(tmp_fname, "wb") as fp:
+            pickle.dump(key, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(d, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        # Atomically replace, so concurrent loads never see a half written snapshot.
+        os.replace(tmp_fname, fname)
+    except OSError:
+        if path.exists(tmp_fname):
+            os.remove(tmp_fname)
+
+
+# See RefData.cached. By (datadir, fix_missing_entries).
+_cache: dict[tuple[str, bool], tuple[SnapshotKey, "RefData"]] = {}
+_cache_lock = Lock()
+
+
+def _is_gemfr(description: str) -> bool:
+    return (
+        description.find("gemfr. Geb") != -1
+        or description.find("gemeindefreies Gebiet") != -1
+        or description.find("gemfr.Geb.") != -1
+    )
+
+
 @dataclass(kw_only=True)
 class RefData:
-    """This class gives you a single handle around all the reference data."""
-
-    _ags_master: dict[str, str]
-    _area: DataFrame[str]
-    _area_kinds: DataFrame[str]
-    _assumptions: DataFrame[str]
-    _buildings: DataFrame[str]
-    _co2path: DataFrame[int]
-    _destatis: DataFrame[str]
-    _facts: DataFrame[str]
-    _flats: DataFrame[str]
-    _nat_agri: DataFrame[str]
-    _nat_organic_agri: DataFrame[str]
-    _nat_energy: DataFrame[str]
-    _nat_res_buildings: DataFrame[str]
-    _population: DataFrame[str]
-    _renewable_energy: DataFrame[str]
-    _traffic: DataFrame[str]
+    """This class gives you a single handle around all the reference data.
 
-    def __init__(
-        self,
-        *,
-        ags_master: DataFrame[str],
-        area: DataFrame[str],
-        area_kinds: DataFrame[str],
-        assumptions: DataFrame[str],
-        buildings: DataFrame[str],
-        co2path: DataFrame[int],
-        destatis: DataFrame[str],
-        facts: DataFrame[str],
-        flats: DataFrame[str],
-        nat_agri: DataFrame[str],
-        nat_organic_agri: DataFrame[str],
-        nat_energy: DataFrame[str],
-        nat_res_buildings: DataFrame[str],
-        population: DataFrame[str],
-        renewable_energy: DataFrame[str],
-        traffic: DataFrame[str],
-        fix_missing_entries: bool,
-    ):
+    Every dataset is parsed (and fixed) the first time it is needed. Unless the
+    RefData is created with lazy=True that happens for all of them right away.
+    """
 
-        self._area = area
-        self._ags_master = {  # type: ignore
-            k: r["description"] for (k, r) in ags_master.to_dict().items()
-        }
-        self._area_kinds = area_kinds
-        self._facts_and_assumptions = FactsAndAssumptions(facts, assumptions)
-        self._buildings = buildings
-        self._co2path = co2path
-        self._destatis = destatis
-        self._flats = flats
-        self._nat_agri = nat_agri
-        self._nat_organic_agri = nat_organic_agri
-        self._nat_energy = nat_energy
-        self._nat_res_buildings = nat_res_buildings
-        self._population = population
-        self._renewable_energy = renewable_energy
-        self._traffic = traffic
-
-        if fix_missing_entries:
-            self._fix_missing_gemfr_ags()
-            self._fix_add_derived_rows_for_renewables()
-            self._fix_add_derived_rows_for_traffic()
-
-    def _fix_missing_gemfr_ags(self):
-        all_gemfr: set[str] = set()
-        for (k, v) in self._ags_master.items():
-            if (
-                v.find("gemfr. Geb") != -1
-                or v.find("gemeindefreies Gebiet") != -1
-                or v.find("gemfr.Geb.") != -1
-            ):
-                all_gemfr.add(k)
-
-        def add_zero_rows(df: DataFrame[str]):
-            num_columns = len(df.header)
-            missing_ags = all_gemfr - frozenset(df.to_dict().keys())
-            new_rows = {ags: ["0"] * num_columns for ags in missing_ags}
-            df.append_rows(new_rows)
-
-        # Some gemeindefreie Communes are not listed in the buildings list.
-        # Gemeindefreie Communes are usueally forests ore lakes and do not have any
-        # (they may have some, but we are going to ignore that) buildings.
-        # Therefore we just add them with 0 to the buildings list.
-        add_zero_rows(self._buildings)
-        # Similar logic to renewable installations. If they are not listed in the
-        # reference data they are probably unlikely to actually have anything.
-        # which seems like a big pity.
-        add_zero_rows(self._renewable_energy)
-
-    def _fix_add_derived_rows_for_renewables(self):
-        _add_derived_rows_for_summable(self._renewable_energy)
-
-    def _fix_add_derived_rows_for_traffic(self):
-        _add_derived_rows_for_summable(self._traffic)
+    _datadir: str
+    _fix_missing_entries: bool
+    # The key of the files in the datadir when they were loaded (see snapshot_key)
+    _snapshot_key: SnapshotKey | None
+
+    def __init__(self, datadir: str, *, fix_missing_entries: bool, lazy: bool = False):
+        self._datadir = datadir
+        self._fix_missing_entries = fix_missing_entries
+        self._snapshot_key = SnapshotKey.of_datadir(
+            datadir, fix_missing_entries=fix_missing_entries
+        )
+        if not lazy:
+            self.load_all()
+
+    def load_all(self) -> None:
+        """Make sure that every dataset is parsed."""
+        for attr in [
+            "_ags_master",
+            "_area",
+            "_area_kinds",
+            "_buildings",
+            "_co2path",
+            "_destatis",
+            "_facts_and_assumptions",
+            "_flats",
+            "_nat_agri",
+            "_nat_organic_agri",
+            "_nat_energy",
+            "_nat_res_buildings",
+            "_population",
+            "_renewable_energy",
+            "_traffic",
+        ]:
+            getattr(self, attr)
+
+    # The datasets below are cached_properties, so they are only loaded on the first
+    # access and after that stored in the __dict__ of the instance (and therefore
+    # also included in snapshots). If two threads access the same dataset for the
+    # first time at once, it might be parsed twice, but both get the same data.
+
+    def _load(self, what: str) -> DataFrame[Any]:
+        return DATASETS[what].load(
+            self._datadir, fix_missing_entries=self._fix_missing_entries
+        )
+
+    def _add_zero_rows_for_gemfr(self, df: DataFrame[str]):
+        all_gemfr = {k for (k, v) in self._ags_master.items() if _is_gemfr(v)}
+        num_columns = len(df.header)
+        missing_ags = all_gemfr - frozenset(df.keys())
+        new_rows = {ags: ["0"] * num_columns for ags in missing_ags}
+        df.append_rows(new_rows)
+
+    @cached_property
+    def _ags_master(self) -> dict[str, str]:
+        ags: DataFrame[str] = self._load("ags")
+        return {k: r["description"] for (k, r) in ags.to_dict().items()}
+
+    @cached_property
+    def _facts_and_assumptions(self) -> "FactsAndAssumptions":
+        return FactsAndAssumptions(self._load("facts"), self._load("assumptions"))
+
+    @cached_property
+    def _area(self) -> DataFrame[str]:
+        return self._load("area")
+
+    @cached_property
+    def _area_kinds(self) -> DataFrame[str]:
+        return self._load("area_kinds")
+
+    @cached_property
+    def _buildings(self) -> DataFrame[str]:
+        df: DataFrame[str] = self._load("buildings")
+        if self._fix_missing_entries:
+            # Some gemeindefreie Communes are not listed in the buildings list.
+            # Gemeindefreie Communes are usueally forests ore lakes and do not have any
+            # (they may have some, but we are going to ignore that) buildings.
+            # Therefore we just add them with 0 to the buildings list.
+            self._add_zero_rows_for_gemfr(df)
+        return df
+
+    @cached_property
+    def _co2path(self) -> DataFrame[int]:
+        return self._load("co2path")
+
+    @cached_property
+    def _destatis(self) -> DataFrame[str]:
+        return self._load("destatis")
+
+    @cached_property
+    def _flats(self) -> DataFrame[str]:
+        return self._load("flats")
+
+    @cached_property
+    def _nat_agri(self) -> DataFrame[str]:
+        return self._load("nat_agri")
+
+    @cached_property
+    def _nat_organic_agri(self) -> DataFrame[str]:
+        return self._load("nat_organic_agri")
+
+    @cached_property
+    def _nat_energy(self) -> DataFrame[str]:
+        return self._load("nat_energy")
+
+    @cached_property
+    def _nat_res_buildings(self) -> DataFrame[str]:
+        return self._load("nat_res_buildings")
+
+    @cached_property
+    def _population(self) -> DataFrame[str]:
+        return self._load("population")
+
+    @cached_property
+    def _renewable_energy(self) -> DataFrame[str]:
+        df: DataFrame[str] = self._load("renewable_energy")
+        if self._fix_missing_entries:
+            # Similar logic to renewable installations. If they are not listed in the
+            # reference data they are probably unlikely to actually have anything.
+            # which seems like a big pity.
+            self._add_zero_rows_for_gemfr(df)
+            _add_derived_rows_for_summable(df)
+        return df
+
+    @cached_property
+    def _traffic(self) -> DataFrame[str]:
+        df: DataFrame[str] = self._load("traffic")
+        if self._fix_missing_entries:
+            _add_derived_rows_for_summable(df)
+        return df
 
     def ags_master(self) -> dict[str, str]:
         """Returns the complete dictionary of AGS, where no big
@@ -464,10 +908,25 @@ class RefData:
         return self._facts_and_assumptions
 
     def fact(self, keyname: str) -> float:
-        return self._facts_and_assumptions.fact(keyname)
+        value = self._facts_and_assumptions.fact(keyname)
+        numeric = current_numeric()
+        if numeric is PLAIN:
+            return value
+        return numeric.fact_or_ass(keyname, value)
 
     def ass(self, keyname: str) -> float:
-        return self._facts_and_assumptions.ass(keyname)
+        value = self._facts_and_assumptions.ass(keyname)
+        numeric = current_numeric()
+        if numeric is PLAIN:
+            return value
+        return numeric.fact_or_ass(keyname, value)
+
+    def dataset(self, what: str) -> DataFrame[Any]:
+        """The complete (fixed) dataset, for column wise access. what is the name of
+        one of the datasets that can also be accessed row by row (e.g. 'area')."""
+        if what in ("ags", "facts", "assumptions") or what not in DATASETS:
+            raise KeyError(what)
+        return getattr(self, "_" + what)
 
     def area(self, ags: str):
         """How many hectare of land are used for what (e.g. farmland, traffic, ...) in each community / administrative district and federal state."""
@@ -521,7 +980,12 @@ class RefData:
 
     @classmethod
     def load(
-        cls, datadir: str | None = None, *, fix_missing_entries: bool = True
+        cls,
+        datadir: str | None = None,
+        *,
+        fix_missing_entries: bool = True,
+        use_snapshot: bool = True,
+        lazy: bool = False,
     ) -> "RefData":
         """Load all the reference data into memory.  This assumes that the working directory has a subdirectory
         called 'data' that contains the reference data in two subfolders one called 'public' and the other
@@ -529,71 +993,59 @@ class RefData:
 
         If your data directory is somewhere else provide the full path to it.
 
-        TODO: Provide a way to run this even when no proprietary data is available. As of right now unnecessary
-        as we can't yet run the generator without the data.
+        Parsing the csv files is slow, so the first load writes a snapshot of the loaded (and fixed) data
+        to data/.snapshots and later loads read that snapshot instead.  The snapshot is only used as long as
+        the production version and the size and modification time of every csv file are unchanged.
+        Pass use_snapshot=False to always parse the csv files.
+
+        TODO: Provide a way to run this without the proprietary data.
+
+        Pass lazy=True to only parse the datasets that are actually used (for example for short lived
+        commands that look up a single fact). Lazy loads neither read nor write snapshots.
         """
         datadir = datadir_or_default(datadir)
-        area_0_columns = (
-            [
-                "land_settlement",
-                "land_traffic",
-                "veg_forrest",
-                "veg_agri",
-                "veg_wood",
-                "veg_heath",
-                "veg_moor",
-                "veg_marsh",
-                "veg_plant_uncover_com",
-                "settlement_ghd",
-                "water_total",
-            ]
-            if fix_missing_entries
-            else []
-        )
-        flats_0_columns = (
-            [
-                "residential_buildings_total",
-                "buildings_1flat",
-                "buildings_2flats",
-                "buildings_3flats",
-                "buildings_dorms",
-                "residential_buildings_area_total",
-            ]
-            if fix_missing_entries
-            else []
-        )
-        population_0_columns = ["total"] if fix_missing_entries else []
-        d = cls(
-            ags_master=DataFrame.load_ags(datadir, "ags", filename="master"),
-            area=DataFrame.load_ags(
-                datadir, "area", set_nans_to_0_in_columns=area_0_columns
-            ),
-            area_kinds=DataFrame.load_ags(datadir, "area_kinds"),
-            assumptions=DataFrame.load(
-                datadir, "assumptions", key_column="label", key_from_raw=lambda k: k
-            ),
-            buildings=DataFrame.load_ags(datadir, "buildings"),
-            co2path=DataFrame.load(
-                datadir, "co2path", key_column="year", key_from_raw=int
-            ),
-            destatis=DataFrame.load_ags(datadir, "destatis"),
-            facts=DataFrame.load(
-                datadir, "facts", key_column="label", key_from_raw=lambda k: k
-            ),
-            flats=DataFrame.load_ags(
-                datadir, "flats", set_nans_to_0_in_columns=flats_0_columns
-            ),
-            nat_agri=DataFrame.load_ags(datadir, "nat_agri"),
-            nat_organic_agri=DataFrame.load_ags(
-                datadir, "nat_organic_agri", filename="2016"
-            ),
-            nat_energy=DataFrame.load_ags(datadir, "nat_energy"),
-            nat_res_buildings=DataFrame.load_ags(datadir, "nat_res_buildings"),
-            population=DataFrame.load_ags(
-                datadir, "population", set_nans_to_0_in_columns=population_0_columns
-            ),
-            renewable_energy=DataFrame.load_ags(datadir, "renewable_energy"),
-            traffic=DataFrame.load_ags(datadir, "traffic"),
-            fix_missing_entries=fix_missing_entries,
-        )
+        if lazy:
+            return cls(datadir, fix_missing_entries=fix_missing_entries, lazy=True)
+        if not use_snapshot:
+            return cls.load_from_csv(datadir, fix_missing_entries=fix_missing_entries)
+
+        key = SnapshotKey.of_datadir(datadir, fix_missing_entries=fix_missing_entries)
+        fname = snapshot_path(datadir, fix_missing_entries=fix_missing_entries)
+        if key is not None:
+            d = _read_snapshot(fname, datadir, key)
+            if d is not None:
+                return d
+        d = cls.load_from_csv(datadir, fix_missing_entries=fix_missing_entries)
+        if key is not None:
+            _write_snapshot(fname, key, d)
         return d
+
+    def snapshot_key(self) -> SnapshotKey | None:
+        """The key of the files in the datadir at the time this RefData was loaded (see
+        SnapshotKey). None if the version of the files is unknown."""
+        return self._snapshot_key
+
+    @classmethod
+    def cached(
+        cls, datadir: str | None = None, *, fix_missing_entries: bool = True
+    ) -> "RefData":
+        """Like load, but returns the same RefData to every caller in this process, until
+        the production version or one of the csv files changes (see SnapshotKey).
+
+        The returned RefData is shared, so it must not be modified.
+        """
+        datadir = datadir_or_default(datadir)
+        key = SnapshotKey.of_datadir(datadir, fix_missing_entries=fix_missing_entries)
+        with _cache_lock:
+            cached = _cache.get((datadir, fix_missing_entries))
+            if cached is not None and key is not None and cached[0] == key:
+                return cached[1]
+            d = cls.load(datadir, fix_missing_entries=fix_missing_entries)
+            if key is not None:
+                _cache[(datadir, fix_missing_entries)] = (key, d)
+            return d
+
+    @classmethod
+    def load_from_csv(cls, datadir: str, *, fix_missing_entries: bool) -> "RefData":
+        """Parse all the csv files in datadir. You probably want to use load instead."""
+        return cls(datadir, fix_missing_entries=fix_missing_entries)
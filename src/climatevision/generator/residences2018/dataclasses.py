@@ -3,20 +3,20 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars1:
     # Used by r
     CO2e_combustion_based: float = None  # type: ignore
     CO2e_total: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars2:
     # Used by p, p_elec_elcon, p_elec_heatpump, p_vehicles, p_other
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars3:
     # Used by p_buildings_total, p_buildings_until_1919, p_buildings_1919_1948, p_buildings_1949_1978, p_buildings_1979_1995, p_buildings_1996_2004
     area_m2: float = None  # type: ignore
@@ -31,7 +31,7 @@ class Vars3:
     relative_heat_ratio_buildings_until_2004: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars4:
     # Used by p_buildings_2005_2011, p_buildings_2011_today
     area_m2: float = None  # type: ignore
@@ -44,7 +44,7 @@ class Vars4:
     relative_heat_ratio_BMWi: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars5:
     # Used by p_buildings_area_m2_com
     area_m2: float = None  # type: ignore
@@ -53,7 +53,7 @@ class Vars5:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     # Used by s
     CO2e_combustion_based: float = None  # type: ignore
@@ -63,7 +63,7 @@ class Vars6:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars7:
     # Used by s_fueloil, s_lpg, s_coal, s_petrol, s_heatnet, s_solarth, s_heatpump, s_elec_heating, s_gas
     CO2e_combustion_based: float = None  # type: ignore
@@ -75,7 +75,7 @@ class Vars7:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8:
     # Used by s_biomass
     CO2e_combustion_based: float = None  # type: ignore
@@ -88,7 +88,7 @@ class Vars8:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars9:
     # Used by s_elec
     CO2e_combustion_based: float = None  # type: ignore
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from .dataclasses import Vars1, Vars2, Vars3, Vars4, Vars5, Vars6, Vars7, Vars8, Vars9
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class R18:
     r: Vars1
     p: Vars2
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars0:
     # Used by g
     cost_wage: float = None  # type: ignore
@@ -16,7 +16,7 @@ class Vars0:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars1:
     # Used by g_consult
     cost_wage: float = None  # type: ignore
@@ -31,7 +31,7 @@ class Vars1:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars2:
     # Used by p
     change_energy_MWh: float = None  # type: ignore
@@ -52,7 +52,7 @@ class Vars2:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars3:
     # Used by p_buildings_total
     area_m2: float = None  # type: ignore
@@ -82,7 +82,7 @@ class Vars3:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars4:
     # Used by p_buildings_until_1919, p_buildings_1919_1948, p_buildings_1949_1978, p_buildings_1979_1995, p_buildings_1996_2004
     area_m2: float = None  # type: ignore
@@ -103,7 +103,7 @@ class Vars4:
     rate_rehab_pa: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars5:
     # Used by p_buildings_2005_2011, p_buildings_2011_today
     area_m2_nonrehab: float = None  # type: ignore
@@ -119,7 +119,7 @@ class Vars5:
     pct_rehab: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars6:
     # Used by p_buildings_new
     area_m2: float = None  # type: ignore
@@ -129,7 +129,7 @@ class Vars6:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars7:
     # Used by p_buildings_area_m2_com
     area_m2: float = None  # type: ignore
@@ -147,7 +147,7 @@ class Vars7:
     pct_x: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars8:
     # Used by r
     CO2e_combustion_based: float = None  # type: ignore
@@ -168,7 +168,7 @@ class Vars8:
     invest_pa_com: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars9:
     # Used by s
     CO2e_combustion_based: float = None  # type: ignore
@@ -195,7 +195,7 @@ class Vars9:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars10:
     # Used by s_fueloil, s_lpg, s_biomass, s_coal, s_petrol, s_heatnet
     CO2e_combustion_based: float = None  # type: ignore
@@ -215,7 +215,7 @@ class Vars10:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars11:
     # Used by s_solarth
     CO2e_combustion_based: float = None  # type: ignore
@@ -250,7 +250,7 @@ class Vars11:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars12:
     # Used by s_heatpump
     CO2e_combustion_based: float = None  # type: ignore
@@ -284,7 +284,7 @@ class Vars12:
     ratio_wage_to_emplo: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars13:
     # Used by s_gas
     CO2e_combustion_based: float = None  # type: ignore
@@ -303,7 +303,7 @@ class Vars13:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars14:
     # Used by s_elec_heating, s_elec
     CO2e_combustion_based: float = None  # type: ignore
@@ -320,7 +320,7 @@ class Vars14:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars15:
     # Used by s_emethan
     CO2e_combustion_based: float = None  # type: ignore
@@ -338,7 +338,7 @@ class Vars15:
     pct_energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars16:
     # Used by p_elec_elcon, p_elec_heatpump
     change_energy_MWh: float = None  # type: ignore
@@ -348,7 +348,7 @@ class Vars16:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars17:
     # Used by p_other
     change_energy_MWh: float = None  # type: ignore
@@ -357,7 +357,7 @@ class Vars17:
     energy: float = None  # type: ignore
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Vars18:
     # Used by p_vehicles
     change_energy_MWh: float = None  # type: ignore
@@ -25,7 +25,7 @@ from .dataclasses import (
 )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class R30:
     g: Vars0
     g_consult: Vars1
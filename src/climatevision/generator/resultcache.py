@@ -0,0 +1,212 @@
+"""Module resultcache -- remember the results of calculations.
+
+The result of a calculation only depends on the reference data, the entries and the
+code of the generator. So the cache key is a hash of exactly those three things:
+
+- The SnapshotKey of the reference data (production version and file stamps).
+- The entries (as JSON, which keeps ints and floats apart and does not round floats).
+- All the source files of this package.
+
+Results are kept in memory (the most recently used ones) and, if a directory is given,
+also on disk, so that other processes and later runs can use them as well.
+"""
+
+# pyright: strict
+
+from collections import OrderedDict
+from dataclasses import asdict
+from hashlib import sha256
+from os import path
+from threading import Lock, get_ident
+from typing import Any
+import json
+import os
+import pickle
+
+from .generator import calculate
+from .inputs import Inputs
+from .makeentries import Entries
+from .numeric import PLAIN
+from .refdata import RefData, SnapshotKey
+
+_code_version: str | None = None
+
+
+def code_version() -> str:
+    """A hash of all python source files of the generator."""
+    global _code_version
+    if _code_version is None:
+        h = sha256()
+        root = path.dirname(__file__)
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for fname in sorted(filenames):
+                if fname.endswith(".py"):
+                    full = path.join(dirpath, fname)
+                    h.update(path.relpath(full, root).encode())
+                    with open(full, "rb") as fp:
+                        h.update(sha256(fp.read()).digest())
+        _code_version = h.hexdigest()
+    return _code_version
+
+
+def cache_key(data: SnapshotKey, entries: Entries) -> str:
+    h = sha256()
+    h.update(code_version().encode())
+    h.update(repr(data).encode())
+    h.update(json.dumps(asdict(entries), sort_keys=True).encode())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """A cache of result dicts. Safe to use from several threads.
+
+    The returned result dicts are shared between all callers that ask for the same
+    calculation, so they must not be modified.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 256,
+        directory: str | None = None,
+        max_disk_bytes: int = 1 << 30,
+    ):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # The bytes in directory as far as we know: what was there when we last looked
+        # (see _evict) plus what we wrote since. None until we looked.
+        self._disk_bytes: int | None = None
+        self._lock = Lock()
+
+    def key(self, data: RefData, entries: Entries) -> str | None:
+        """The key of the calculation with the given inputs. None if the version of the
+        reference data is unknown (in which case we can not cache anything).
+
+        Uses the key of the files data was loaded from (see RefData.snapshot_key), so
+        this does not look at the datadir."""
+        data_key = data.snapshot_key()
+        if data_key is None:
+            return None
+        return cache_key(data_key, entries)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return result
+        result = self._read(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        with self._lock:
+            self._remember(key, result)
+        self._write(key, result)
+
+    def result_dict(self, data: RefData, entries: Entries) -> dict[str, Any]:
+        """Returns calculate(...).result_dict() for the given entries, from the cache if
+        possible. Always calculated with plain floats (even when called while tracing),
+        as that is what the key stands for."""
+        key = self.key(data, entries)
+        result = None if key is None else self.get(key)
+        if result is None:
+            inputs = Inputs(
+                facts_and_assumptions=data.facts_and_assumptions(),
+                entries=entries,
+                numeric=PLAIN,
+            )
+            result = calculate(inputs).result_dict()
+            if key is not None:
+                self.put(key, result)
+        return result
+
+    def _remember(self, key: str, result: dict[str, Any]) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _fname(self, key: str) -> str:
+        assert self.directory is not None
+        return path.join(self.directory, key + ".pickle")
+
+    def _read(self, key: str) -> dict[str, Any] | None:
+        if self.directory is None:
+            return None
+        fname = self._fname(key)
+        try:
+            with open(fname, "rb") as fp:
+                result = pickle.load(fp)
+            # Remember that it was used (see _evict)
+            os.utime(fname)
+        except Exception:
+            # Not there, or written by an incompatible version of python
+            return None
+        return result if isinstance(result, dict) else None  # type: ignore
+
+    def _write(self, key: str, result: dict[str, Any]) -> None:
+        """Failing to write to the disk is not an error, it just means the next lookup
+        will need to calculate again."""
+        if self.directory is None:
+            return
+        fname = self._fname(key)
+        tmp_fname = f"{fname}.{os.getpid()}.{get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_fname, "wb") as fp:
+                pickle.dump(result, fp, protocol=pickle.HIGHEST_PROTOCOL)
+                size = fp.tell()
+            os.replace(tmp_fname, fname)
+            self._written(size)
+        except OSError:
+            if path.exists(tmp_fname):
+                os.remove(tmp_fname)
+
+    def _written(self, size: int) -> None:
+        """Account for a file of size bytes written to the directory. Only looks at the
+        directory if it might have grown too big."""
+        with self._lock:
+            if self._disk_bytes is not None:
+                # Too much if the file replaced another one, but that only means
+                # that we look at the directory a bit earlier
+                self._disk_bytes += size
+                if self._disk_bytes <= self.max_disk_bytes:
+                    return
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used files until the directory is small enough.
+        Other processes may write to the directory as well, so this starts over from
+        what is actually there."""
+        assert self.directory is not None
+        files: list[tuple[float, int, str]] = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for e in it:
+                if e.name.endswith(".pickle"):
+                    st = e.stat()
+                    files.append((st.st_mtime, st.st_size, e.path))
+                    total += st.st_size
+        files.sort()
+        for (_, size, fname) in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(fname)
+            except OSError:
+                pass
+            total -= size
+        with self._lock:
+            self._disk_bytes = total
@@ -0,0 +1,364 @@
+"""Module resultdict -- convert the (nested) result dataclasses into dicts or JSON.
+
+For every dataclass we compute once which fields go into the dict in which order (the
+plan), so that converting a Result does not need to ask the dataclasses module about
+the fields of every single node again.
+"""
+
+# pyright: strict
+
+from dataclasses import dataclass, fields, is_dataclass
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Iterable, TextIO
+
+
+@dataclass(kw_only=True)
+class _Plan:
+    fields: list[str]  # The fields that are converted as is, in order
+    # The fields whose values are lifted into the dict of the parent (in that order),
+    # see LIFT_INTO_RESULT_DICT
+    lifted: list[str]
+
+
+# By type. None for every type that is not a dataclass.
+_plans: dict[type, _Plan | None] = {}
+
+
+def _plan(t: type) -> _Plan | None:
+    try:
+        return _plans[t]
+    except KeyError:
+        pass
+    plan = None
+    if is_dataclass(t):
+        lifted: list[str] = list(getattr(t, "LIFT_INTO_RESULT_DICT", []))
+        plan = _Plan(
+            fields=[f.name for f in fields(t) if f.name not in lifted], lifted=lifted
+        )
+    _plans[t] = plan
+    return plan
+
+
+def _lift(out: dict[str, Any], name: str, v: object, convert: bool) -> None:
+    plan = _plan(type(v))
+    if plan is not None:
+        _fill(out, v, plan, convert)
+    elif isinstance(v, dict):
+        out.update(v)  # type: ignore
+    else:
+        assert (
+            False
+        ), f"LIFT_INTO_RESULT_DICT encountered {v} at {name} -- which is not a dictionary"
+
+
+def _fill(out: dict[str, Any], v: object, plan: _Plan, convert: bool) -> None:
+    if convert:
+        for name in plan.fields:
+            out[name] = _convert_item(getattr(v, name))
+    else:
+        for name in plan.fields:
+            out[name] = getattr(v, name)
+    for name in plan.lifted:
+        _lift(out, name, getattr(v, name), convert)
+
+
+def _convert_item(v: object) -> object:
+    plan = _plan(type(v))
+    if plan is None:
+        return v
+    out: dict[str, Any] = {}
+    _fill(out, v, plan, True)
+    return out
+
+
+def dataclass_to_result_dict(v: object) -> dict[str, object]:
+    """This does basically the same as asdict from dataclasses does.
+
+    The most important difference is that classes can contain a list
+    called LIFT_INTO_RESULT_DICT and will list all values contained
+    in that dictionary into the resulting dictionary.
+    """
+    plan = _plan(type(v))
+    assert plan is not None, f"{v} is not a dataclass"
+    out: dict[str, Any] = {}
+    _fill(out, v, plan, True)
+    return out
+
+
+class _Glob:
+    """A shell like glob pattern for result paths like "e30.e.CO2e_total" (case
+    insensitive, like the globs of the explorer): '*' matches any number of
+    characters (including '.'), '?' a single one.
+
+    Matched one character at a time, so that we know for every path whether the
+    pattern matches it or may match a longer path starting with it.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern.lower()
+        self.start = self._closure({0})
+        # The position at which the whole pattern matched
+        self.end = len(self.pattern)
+        # The same keys appear in many nodes
+        self._steps: dict[tuple[frozenset[int], str], frozenset[int]] = {}
+
+    def _closure(self, states: set[int]) -> frozenset[int]:
+        # A '*' may match nothing
+        for i in sorted(states):
+            while i < len(self.pattern) and self.pattern[i] == "*":
+                i += 1
+                states.add(i)
+        return frozenset(states)
+
+    def step(self, states: frozenset[int], text: str) -> frozenset[int]:
+        """The positions in pattern reachable after also matching text."""
+        try:
+            return self._steps[(states, text)]
+        except KeyError:
+            pass
+        result = self._step(states, text)
+        self._steps[(states, text)] = result
+        return result
+
+    def _step(self, states: frozenset[int], text: str) -> frozenset[int]:
+        pattern = self.pattern
+        for c in text.lower():
+            if not states:
+                break
+            next: set[int] = set()
+            for i in states:
+                if i < len(pattern):
+                    p = pattern[i]
+                    if p == "*":
+                        next.add(i)
+                    elif p == "?" or p == c:
+                        next.add(i + 1)
+            states = self._closure(next)
+        return states
+
+
+@lru_cache(maxsize=256)
+def _glob(pattern: str) -> _Glob:
+    return _Glob(pattern)
+
+
+def _project(
+    items: Iterable[tuple[object, object]],
+    globs: list[_Glob],
+    states: list[frozenset[int]],
+    prefix: str,
+) -> dict[Any, Any]:
+    out: dict[Any, Any] = {}
+    for k, v in items:
+        text = prefix + (k if type(k) is str else _key_to_json(k))
+        child: list[frozenset[int]] = []
+        matched = alive = False
+        for g, s in zip(globs, states):
+            c = g.step(s, text)
+            child.append(c)
+            if c:
+                alive = True
+                matched = matched or g.end in c
+        if matched:
+            out[k] = _convert_item(v)
+        elif alive:
+            plan = _plan(type(v))
+            if plan is not None:
+                inner = _project(_items(v, plan), globs, child, ".")
+            elif isinstance(v, dict):
+                inner = _project(v.items(), globs, child, ".")  # type: ignore
+            else:
+                continue
+            if inner:
+                out[k] = inner
+    return out
+
+
+def projected_result_dict(v: object, patterns: list[str]) -> dict[Any, Any]:
+    """The result dict of v (a result dataclass or an already converted result dict)
+    with only the values whose path matches one of the glob patterns (see _Glob).
+    The rest of v is neither converted nor copied.
+
+    E.g. ["m183X.*", "bisko.total"] gives {"m183X": {...}, "bisko": {"total": ...}}.
+    """
+    globs = [_glob(p) for p in patterns]
+    plan = _plan(type(v))
+    if plan is not None:
+        items = _items(v, plan)
+    else:
+        assert isinstance(v, dict), f"{v} is neither a dataclass nor a dict"
+        items = v.items()  # type: ignore
+    return _project(items, globs, [g.start for g in globs], "")  # type: ignore
+
+
+def result_dict_items(v: object) -> Iterable[tuple[Any, Any]] | None:
+    """The items of the result dict of v (a result dataclass or an already converted
+    result dict), with the values not yet converted. None for all other values."""
+    plan = _plan(type(v))
+    if plan is not None:
+        return _items(v, plan)
+    if isinstance(v, dict):
+        return v.items()  # type: ignore
+    return None
+
+
+def _items(v: object, plan: _Plan) -> Iterable[tuple[str, Any]]:
+    """The items of the result dict of v, but with the values not yet converted."""
+    if not plan.lifted:
+        return ((name, getattr(v, name)) for name in plan.fields)
+    # Lifted values can replace earlier ones, so we need to know them all first
+    out: dict[str, Any] = {}
+    _fill(out, v, plan, False)
+    return out.items()
+
+
+def _float_to_json(f: float) -> str:
+    if f != f:
+        return "NaN"
+    elif f == float("inf"):
+        return "Infinity"
+    elif f == float("-inf"):
+        return "-Infinity"
+    return float.__repr__(f)
+
+
+def _key_to_json(k: object) -> str:
+    if isinstance(k, str):
+        return k
+    elif k is True:
+        return "true"
+    elif k is False:
+        return "false"
+    elif k is None:
+        return "null"
+    elif isinstance(k, int):
+        return int.__repr__(k)
+    elif isinstance(k, float):
+        return _float_to_json(k)
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(k).__name__}"
+    )
+
+
+class _JsonWriter:
+    """Writes JSON exactly like json.dump(dataclass_to_result_dict(v), indent=indent,
+    default=default) would."""
+
+    def __init__(
+        self,
+        fp: TextIO,
+        indent: int | None,
+        default: Callable[[object], object] | None = None,
+    ):
+        self.fp = fp
+        self.default = default
+        self.chunks: list[str] = []
+        self.write = self.chunks.append
+        self.indent = indent
+        self.item_separator = ", " if indent is None else ","
+        # By level: What comes before the first / every other item and after the last
+        self._open: list[tuple[str, str, str]] = []
+        # The encoded keys (most keys appear in many nodes)
+        self._keys: dict[object, str] = {}
+
+    def _separators(self, level: int) -> tuple[str, str, str]:
+        while len(self._open) <= level:
+            n = len(self._open)
+            if self.indent is None:
+                self._open.append(("", self.item_separator, ""))
+            else:
+                inner = "\n" + " " * (self.indent * (n + 1))
+                outer = "\n" + " " * (self.indent * n)
+                self._open.append((inner, self.item_separator + inner, outer))
+        return self._open[level]
+
+    def flush(self) -> None:
+        self.fp.write("".join(self.chunks))
+        self.chunks.clear()
+
+    def _key(self, k: object) -> str:
+        encoded = self._keys.get(k)
+        if encoded is None:
+            encoded = encode_basestring_ascii(_key_to_json(k)) + ": "
+            self._keys[k] = encoded
+        return encoded
+
+    def value(self, v: object, level: int) -> None:
+        if type(v) is float:
+            self.write(_float_to_json(v))
+            return
+        plan = _plan(type(v))
+        if plan is not None:
+            self.items(_items(v, plan), level)
+        elif isinstance(v, str):
+            self.write(encode_basestring_ascii(v))
+        elif v is None:
+            self.write("null")
+        elif v is True:
+            self.write("true")
+        elif v is False:
+            self.write("false")
+        elif isinstance(v, int):
+            self.write(int.__repr__(v))
+        elif isinstance(v, float):
+            self.write(_float_to_json(v))
+        elif isinstance(v, dict):
+            self.items(v.items(), level)  # type: ignore
+        elif isinstance(v, (list, tuple)):
+            self.list(v, level)  # type: ignore
+        elif self.default is not None:
+            self.value(self.default(v), level)
+        else:
+            raise TypeError(
+                f"Object of type {type(v).__name__} is not JSON serializable"
+            )
+
+    def items(self, items: Iterable[tuple[object, Any]], level: int) -> None:
+        write = self.write
+        first, separator, last = self._separators(level)
+        before = "{" + first
+        for k, v in items:
+            write(before)
+            before = separator
+            write(self._key(k))
+            if type(v) is float and v - v == 0.0:
+                # The most common case by far: a finite float
+                write(float.__repr__(v))
+            else:
+                self.value(v, level + 1)
+            if len(self.chunks) > 8192:
+                self.flush()
+        if before == separator:
+            write(last + "}")
+        else:
+            write("{}")
+
+    def list(self, values: Iterable[object], level: int) -> None:
+        write = self.write
+        first, separator, last = self._separators(level)
+        before = "[" + first
+        for v in values:
+            write(before)
+            before = separator
+            self.value(v, level + 1)
+        if before == separator:
+            write(last + "]")
+        else:
+            write("[]")
+
+
+def write_result_json(
+    v: object,
+    fp: TextIO,
+    *,
+    indent: int | None = None,
+    default: Callable[[object], object] | None = None,
+) -> None:
+    """Write the result dict of v as JSON to fp, without building the result dict.
+
+    Like for json.dump, default is called for every value that is not JSON
+    serializable and what it returns is written instead."""
+    writer = _JsonWriter(fp, indent, default)
+    writer.value(v, 0)
+    writer.flush()
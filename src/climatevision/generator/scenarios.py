@@ -0,0 +1,195 @@
+"""Module scenarios -- calculate many variations of the same inputs at once.
+
+A scenario replaces some facts, assumptions or entries by other values. Instead of
+calculating every scenario on its own, calculate_scenarios passes a Vector (with one
+value per scenario) in place of every replaced value and does one calculation. So the
+leaves of the Result are Vectors wherever the scenarios differ.
+
+If the scenarios disagree on a comparison (e.g. max(0, x) where x is negative in some
+scenarios only) the calculation is redone separately for each group of scenarios that
+agree, and the results are put together afterwards. Likewise a group of scenarios whose
+calculation raises is split until the scenarios that fail are found, so that they do
+not take the results of the others with them (see ScenariosFailed).
+"""
+
+# pyright: strict
+
+from copy import copy
+from dataclasses import fields, is_dataclass, replace
+from math import nan
+from typing import Any, Mapping, Sequence
+
+from .generator import Result, calculate
+from .inputs import Inputs
+from .vector import Divergence, Vector
+
+
+class _ScenarioInputs(Inputs):
+    def __init__(
+        self, inputs: Inputs, facts: dict[str, Any], assumptions: dict[str, Any]
+    ):
+        super().__init__(
+            facts_and_assumptions=inputs.facts_and_assumptions(),
+            entries=inputs.entries,
+            numeric=inputs.numeric,
+        )
+        self._facts = facts
+        self._assumptions = assumptions
+
+    def fact(self, keyname: str) -> float:
+        if keyname in self._facts:
+            return self._facts[keyname]
+        return super().fact(keyname)
+
+    def ass(self, keyname: str) -> float:
+        if keyname in self._assumptions:
+            return self._assumptions[keyname]
+        return super().ass(keyname)
+
+
+def _lanes(values: Mapping[str, Sequence[float]], lanes: list[int]) -> dict[str, Any]:
+    if len(lanes) == 1:
+        return {name: v[lanes[0]] for name, v in values.items()}
+    return {name: Vector([v[lane] for lane in lanes]) for name, v in values.items()}
+
+
+def _value_in_lane(v: Any, ndx: int) -> Any:
+    if isinstance(v, Vector):
+        return v.values[ndx]
+    return v
+
+
+class ScenariosFailed(Exception):
+    """The calculation of some of the scenarios raised.
+
+    result holds the results of the other scenarios (see scenario_result), the numbers
+    of a failed scenario are all NaN. errors has the exception of every failed
+    scenario by its index.
+    """
+
+    def __init__(self, result: Result, errors: dict[int, Exception]):
+        super().__init__(
+            f"The calculation failed for the scenarios {sorted(errors)}: "
+            + "; ".join(f"{ndx}: {e!r}" for ndx, e in sorted(errors.items()))
+        )
+        self.result = result
+        self.errors = errors
+
+
+def _merge(parts: list[tuple[list[int], Any]], count: int) -> Any:
+    """Put together the results of the calculations for disjoint groups of lanes.
+    Lanes in none of the parts failed, their numbers are NaN."""
+    first = parts[0][1]
+    if is_dataclass(first) and not isinstance(first, type):
+        merged = copy(first)
+        for f in fields(first):
+            value = _merge([(lanes, getattr(v, f.name)) for lanes, v in parts], count)
+            object.__setattr__(merged, f.name, value)
+        return merged
+
+    values: list[Any] = [nan] * count
+    for lanes, v in parts:
+        for ndx, lane in enumerate(lanes):
+            values[lane] = _value_in_lane(v, ndx)
+    if not any(isinstance(v, Vector) for _, v in parts):
+        if all(type(v) is type(first) and v == first for _, v in parts):
+            complete = sum(len(lanes) for lanes, _ in parts) == count
+            if complete or not isinstance(first, (int, float)):
+                return first
+    if not all(isinstance(v, (int, float)) for v in values):
+        raise ValueError(f"Non numeric values differ between scenarios: {values}")
+    return Vector(values)
+
+
+def _calculate_lanes(
+    inputs: Inputs,
+    facts: Mapping[str, Sequence[float]],
+    assumptions: Mapping[str, Sequence[float]],
+    entries: Mapping[str, Sequence[float]],
+    lanes: list[int],
+    errors: dict[int, Exception],
+) -> Result | None:
+    """The merged Result of the lanes, or None if the calculation failed for all of
+    them. The exceptions of the failed lanes go into errors."""
+    lane_inputs = _ScenarioInputs(
+        Inputs(
+            facts_and_assumptions=inputs.facts_and_assumptions(),
+            entries=replace(inputs.entries, **_lanes(entries, lanes)),
+            numeric=inputs.numeric,
+        ),
+        facts=_lanes(facts, lanes),
+        assumptions=_lanes(assumptions, lanes),
+    )
+    try:
+        return calculate(lane_inputs)
+    except Divergence as d:
+        groups = [
+            [ndx for ndx, o in enumerate(d.mask) if o == outcome]
+            for outcome in [True, False]
+        ]
+    except Exception as e:
+        if len(lanes) == 1:
+            errors[lanes[0]] = e
+            return None
+        # Which lanes fail is not known, so try both halves on their own
+        half = len(lanes) // 2
+        groups = [list(range(half)), list(range(half, len(lanes)))]
+    parts: list[tuple[list[int], Any]] = []
+    for positions in groups:
+        group = [lanes[ndx] for ndx in positions]
+        result = _calculate_lanes(inputs, facts, assumptions, entries, group, errors)
+        if result is not None:
+            parts.append((positions, result))
+    if not parts:
+        return None
+    return _merge(parts, len(lanes))
+
+
+def calculate_scenarios(
+    inputs: Inputs,
+    *,
+    facts: Mapping[str, Sequence[float]] = {},
+    assumptions: Mapping[str, Sequence[float]] = {},
+    entries: Mapping[str, Sequence[float]] = {},
+) -> Result:
+    """Calculate the scenarios given by replacing the named facts, assumptions and entries
+    of inputs by each of the given values in turn. All sequences must have the same
+    length (the number of scenarios).
+
+    Every number in the returned Result is either a Vector with one value per scenario
+    or a plain number if that number is the same for all scenarios. Use scenario_result
+    to get the Result of a single scenario, which is identical to the result of
+    calculate with the replaced inputs.
+
+    If the calculation raises for some of the scenarios only, ScenariosFailed is
+    raised, which still has the results of the others. If it raises for all of them,
+    the exception of the first one is raised.
+    """
+    lengths = {
+        len(v) for v in [*facts.values(), *assumptions.values(), *entries.values()]
+    }
+    if len(lengths) != 1 or 0 in lengths:
+        raise ValueError("All scenario values must have the same (non zero) length")
+    lanes = list(range(lengths.pop()))
+    errors: dict[int, Exception] = {}
+    result = _calculate_lanes(inputs, facts, assumptions, entries, lanes, errors)
+    if result is None:
+        # Every scenario failed, so there is nothing to salvage
+        raise errors[0]
+    if errors:
+        raise ScenariosFailed(result, errors)
+    return result
+
+
+def scenario_result(result: Result, ndx: int) -> Result:
+    """The Result of the scenario with the given index from a result of calculate_scenarios."""
+
+    def select(v: Any) -> Any:
+        if is_dataclass(v) and not isinstance(v, type):
+            selected = copy(v)
+            for f in fields(v):
+                object.__setattr__(selected, f.name, select(getattr(v, f.name)))
+            return selected
+        return _value_in_lane(v, ndx)
+
+    return select(result)
@@ -0,0 +1,290 @@
+"""Module scheduler -- run the steps of the calculation in the order of their dependencies.
+
+Every step of the calculation is a function that takes the inputs as first argument and
+the results of other steps as further (keyword) arguments. The names of those arguments
+are the names of the steps they are computed by. So the signature of every calc function
+declares what it depends on, and the scheduler can run steps that do not depend on each
+other at the same time.
+"""
+
+# pyright: strict
+
+from concurrent.futures import Executor, Future, FIRST_COMPLETED, wait
+from contextvars import copy_context
+from copy import copy, deepcopy
+from dataclasses import dataclass
+from inspect import signature
+from typing import Any, Callable, Iterable
+import logging
+
+from .inputs import Inputs
+from .instrumentation import Instrumentation, measured, tracing_allocations
+
+log = logging.getLogger(__name__)
+
+
+@dataclass(kw_only=True, frozen=True)
+class Step:
+    name: str  # The name of the result of fn
+    label: str  # Printed when the step starts
+    fn: Callable[..., Any]
+    # The name of a step whose result fn updates in place (e.g. to fill in values that
+    # could only be computed later). Every step that reads that result runs either before
+    # or after fn, just like it does when running the steps one after the other.
+    updates: str | None = None
+
+    def arguments(self) -> list[str]:
+        """The names of the steps whose results fn takes as arguments."""
+        # The first argument is always the inputs
+        return list(signature(self.fn).parameters)[1:]
+
+
+class _RecordingEntries:
+    """Stands in for the entries and records the names of all fields that are read."""
+
+    __slots__ = ("_entries", "_reads")
+
+    def __init__(self, entries: object, reads: set[str]):
+        self._entries = entries
+        self._reads = reads
+
+    def __getattr__(self, name: str) -> Any:
+        self._reads.add(name)
+        return getattr(self._entries, name)
+
+
+@dataclass(kw_only=True)
+class Recording:
+    """What Schedule.run_incremental needs to know about a previous run."""
+
+    results: dict[str, Any]
+    # The results that other steps update in place, as they were before the update
+    pristine: dict[str, Any]
+    # The fields of the entries read by every step
+    reads: dict[str, frozenset[str]]
+
+
+class Schedule:
+    """A list of steps. The list order must be a valid order to run the steps one after
+    the other, which is also what run does unless it is given an executor."""
+
+    def __init__(self, steps: list[Step]):
+        self.steps = steps
+        self._arguments: dict[str, list[str]] = {}
+        self._dependencies: dict[str, set[str]] = {}
+        self._updated: set[str] = set()
+        for step in steps:
+            if step.name in self._arguments:
+                raise ValueError(f"Step {step.name} is defined twice")
+            arguments = step.arguments()
+            for a in arguments:
+                if a not in self._arguments:
+                    raise ValueError(
+                        f"Step {step.name} depends on {a} which is not an earlier step"
+                    )
+            if step.updates is not None:
+                if step.updates not in arguments:
+                    raise ValueError(
+                        f"Step {step.name} updates {step.updates} but does not take it as argument"
+                    )
+                if step.updates in self._updated:
+                    raise ValueError(f"{step.updates} is updated by more than one step")
+                self._updated.add(step.updates)
+            self._arguments[step.name] = arguments
+            self._dependencies[step.name] = set(arguments)
+
+        # Readers of an updated result must keep their position relative to the update.
+        for pos, updater in enumerate(steps):
+            if updater.updates is None:
+                continue
+            for other in steps[:pos]:
+                if updater.updates in self._arguments[other.name]:
+                    self._dependencies[updater.name].add(other.name)
+            for other in steps[pos + 1 :]:
+                if updater.updates in self._arguments[other.name]:
+                    self._dependencies[other.name].add(updater.name)
+
+    def dependencies(self, name: str) -> set[str]:
+        return self._dependencies[name]
+
+    def cone(self, names: Iterable[str]) -> "Schedule":
+        """The steps needed to compute the results of the given steps (as a schedule of
+        its own). That is the steps themselves, what they depend on and the steps that
+        update any of those results, in the order of this schedule."""
+        updater = {s.updates: s.name for s in self.steps if s.updates is not None}
+        needed: set[str] = set()
+        todo = list(names)
+        while todo:
+            name = todo.pop()
+            if name in needed:
+                continue
+            if name not in self._dependencies:
+                raise KeyError(name)
+            needed.add(name)
+            todo.extend(self._dependencies[name])
+            if name in updater:
+                todo.append(updater[name])
+        return Schedule([step for step in self.steps if step.name in needed])
+
+    def _kwargs(self, step: Step, results: dict[str, Any]) -> dict[str, Any]:
+        return {a: results[a] for a in self._arguments[step.name]}
+
+    def _call(
+        self,
+        step: Step,
+        inputs: Inputs,
+        kwargs: dict[str, Any],
+        instrumentation: Instrumentation | None,
+    ) -> Any:
+        log.debug("%s", step.label)
+        if instrumentation is None:
+            return step.fn(inputs, **kwargs)
+        return measured(
+            instrumentation, step.name, step.label, lambda: step.fn(inputs, **kwargs)
+        )
+
+    def run(
+        self,
+        inputs: Inputs,
+        executor: Executor | None = None,
+        *,
+        known: dict[str, Any] | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> dict[str, Any]:
+        """Run all steps and return the results by name of the step.
+
+        If an executor is given, every step is submitted to it as soon as all of its
+        dependencies are done. The executor must run the steps in this process (e.g. a
+        ThreadPoolExecutor), as some steps update the results of others in place. The
+        steps see the context variables of the caller (e.g. the numeric.using).
+
+        The steps whose results are in known are not run, those results are used instead
+        (and are part of the returned results). Results in known that another step updates
+        are copied first, so known itself can be used for many runs.
+
+        If instrumentation is given, it is told what every step that was run cost.
+        """
+        results: dict[str, Any] = {}
+        if known is not None:
+            for name, result in known.items():
+                results[name] = deepcopy(result) if name in self._updated else result
+        steps = [step for step in self.steps if step.name not in results]
+        with tracing_allocations(instrumentation):
+            if executor is None:
+                for step in steps:
+                    results[step.name] = self._call(
+                        step, inputs, self._kwargs(step, results), instrumentation
+                    )
+            else:
+                self._run_concurrently(
+                    inputs, executor, steps, results, instrumentation
+                )
+        return results
+
+    def _run_concurrently(
+        self,
+        inputs: Inputs,
+        executor: Executor,
+        steps: list[Step],
+        results: dict[str, Any],
+        instrumentation: Instrumentation | None,
+    ) -> None:
+        waiting = {
+            step.name: self._dependencies[step.name] - results.keys() for step in steps
+        }
+        running: dict[Future[Any], Step] = {}
+
+        def submit_ready_steps():
+            # In list order, so that the order is close to the one of a sequential run
+            for step in steps:
+                if step.name in waiting and not waiting[step.name]:
+                    del waiting[step.name]
+                    future = executor.submit(
+                        copy_context().run,
+                        self._call,
+                        step,
+                        inputs,
+                        self._kwargs(step, results),
+                        instrumentation,
+                    )
+                    running[future] = step
+
+        submit_ready_steps()
+        try:
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    results[step.name] = future.result()
+                    for dependencies in waiting.values():
+                        dependencies.discard(step.name)
+                submit_ready_steps()
+        finally:
+            # Only does something if a step failed
+            for future in running:
+                future.cancel()
+
+    def run_incremental(
+        self,
+        inputs: Inputs,
+        previous: Recording | None = None,
+        changed: set[str] | None = None,
+        *,
+        instrumentation: Instrumentation | None = None,
+    ) -> Recording:
+        """Run the steps one after the other, recording which fields of the entries each
+        step reads.
+
+        If the recording of a previous run is given (and changed contains the names of
+        the fields of the entries that differ from that run), only the steps that read
+        a changed field, or depend on a step that was run again, are run. The results of
+        all other steps are taken from previous. Neither previous nor its results are
+        modified.
+
+        If instrumentation is given, it is told what every step that was run cost.
+        """
+        results: dict[str, Any] = {}
+        pristine: dict[str, Any] = {}
+        reads: dict[str, frozenset[str]] = {}
+        rerun: set[str] = set()
+        with tracing_allocations(instrumentation):
+            for step in self.steps:
+                if (
+                    previous is not None
+                    and changed is not None
+                    and not previous.reads[step.name] & changed
+                    and not self._dependencies[step.name] & rerun
+                ):
+                    if step.name in self._updated:
+                        # The steps before the update must see it as it was before
+                        results[step.name] = previous.pristine[step.name]
+                        pristine[step.name] = previous.pristine[step.name]
+                    else:
+                        results[step.name] = previous.results[step.name]
+                    if step.updates is not None:
+                        # Not run again, so neither was the step whose result it
+                        # updates (see _dependencies)
+                        results[step.updates] = previous.results[step.updates]
+                    reads[step.name] = previous.reads[step.name]
+                    continue
+
+                step_reads: set[str] = set()
+                step_inputs = copy(inputs)
+                step_inputs.entries = _RecordingEntries(inputs.entries, step_reads)  # type: ignore
+                kwargs = self._kwargs(step, results)
+                if step.updates is not None:
+                    # Never update a result that might also be part of previous
+                    updated = deepcopy(pristine[step.updates])
+                    kwargs[step.updates] = updated
+                    results[step.updates] = updated
+                    rerun.add(step.updates)
+                results[step.name] = self._call(
+                    step, step_inputs, kwargs, instrumentation
+                )
+                if step.name in self._updated:
+                    # As updates only ever happen on copies this stays as it is
+                    pristine[step.name] = results[step.name]
+                reads[step.name] = frozenset(step_reads)
+                rerun.add(step.name)
+
+        return Recording(results=results, pristine=pristine, reads=reads)
@@ -0,0 +1,719 @@
+"""Module synthdata -- write a synthetic reference data set.
+
+Part of the reference data lives in a private repository. For benchmarks, load tests
+(and anything else that does not care about the actual numbers) a made up data set
+with the same layout as the real one is good enough. It contains every column the
+generator reads, for any number of made up communes (from a few dozen to 100000) plus
+their districts, their states and Germany as a whole. Göttingen (03159016) is always
+one of the communes.
+
+The communes are spread over the 16 states and their districts roughly like the real
+ones. Every commune gets a population and an area, and all other values are derived
+from those two (e.g. dense communes have more settlement area, bigger buildings and
+more flats connected to a heat net). The rows of the districts, the states and Germany
+are the sums of their communes, just like in the real data.
+
+The facts and assumptions are exactly the ones the generator reads, which we find out
+by calculating a few communes while recording every fact and assumption that is looked
+up.
+"""
+
+# pyright: strict
+
+from dataclasses import dataclass
+from os import path
+from random import Random
+from typing import Callable, Iterable
+import csv
+import json
+import math
+import os
+
+from .generator import calculate
+from .inputs import Inputs
+from .makeentries import make_entries
+from .refdata import DATASETS, FactsAndAssumptions, RefData, csv_path
+
+GOETTINGEN = "03159016"
+GERMANY = "DG000000"
+
+# The columns of every dataset (without the key column).
+COLUMNS: dict[str, list[str]] = {
+    "population": ["total"],
+    "area": [
+        "land_total",
+        "veg_forrest",
+        "veg_agri",
+        "veg_wood",
+        "land_traffic",
+        "land_settlement",
+        "veg_heath",
+        "veg_moor",
+        "veg_marsh",
+        "veg_plant_uncover_com",
+        "water_total",
+        "settlement_ghd",
+    ],
+    "flats": [
+        "buildings_2flats",
+        "buildings_1flat",
+        "buildings_3flats",
+        "buildings_dorms",
+        "residential_buildings_area_total",
+        "residential_buildings_total",
+    ],
+    "buildings": [
+        "buildings_until_1919",
+        "buildings_1919_1948",
+        "buildings_1949_1978",
+        "buildings_1979_1986",
+        "buildings_1987_1990",
+        "buildings_1991_1995",
+        "buildings_1996_2000",
+        "buildings_2001_2004",
+        "buildings_2005_2008",
+        "buildings_2009_2011",
+        "buildings_total",
+        "flats_total",
+        "flats_heatnet",
+    ],
+    "renewable_energy": ["pv", "wind_on", "biomass", "water"],
+    "traffic": [
+        "rail_ppl_elec",
+        "rail_ppl_diesel",
+        "gds_elec",
+        "gds_diesel",
+        "car_it_ot",
+        "car_ab",
+        "ldt_it_ot",
+        "ldt_ab",
+        "mhd_it_ot",
+        "mhd_ab",
+    ],
+    "destatis": ["metro_mega_km", "bus_mega_km"],
+    "nat_agri": [
+        "amount_sale_calcit",
+        "amount_sale_dolomite",
+        "amount_sale_kas",
+        "amount_sale_urea",
+        "drymass_ecrop",
+        "cows",
+        "cattle",
+        "pigs",
+        "poultry",
+        "other_animals",
+        "cows_ch4e",
+        "cows_n2oe",
+        "cattle_ch4e",
+        "cattle_n2oe",
+        "pigs_ch4e",
+        "pigs_n2oe",
+        "poultry_ch4e",
+        "poultry_n2oe",
+        "other_animals_ch4e",
+        "other_animals_n2oe",
+        "animal_wo_poultry_deposition_co2e",
+        "fertilizer_mineral_n2o",
+        "fertilizer_economy_n2o",
+        "sewage_sludge_n2o",
+        "fermentation_ecrop_n2o",
+        "pasturage_n2o",
+        "crop_residues_n2o",
+        "farmed_soil_n2o",
+        "farmed_soil_loss_organic_n2o",
+        "diffuse_nitrate_emissions_n2o",
+        "diffuse_emissions_n2o",
+        "farms",
+    ],
+    "nat_organic_agri": ["organic_farms_area"],
+    "nat_energy": [
+        "PV_roof_2017",
+        "PV_others",
+        "PV_land_2017",
+        "PV_average_flh",
+        "demand_2018",
+        "bioenergy_potential",
+    ],
+    "nat_res_buildings": ["communal"],
+    "co2path": ["GHG_budget_2016_to_year", "nonCO2_budget_2016_to_year"],
+}
+
+# The real number of communes (which is only used as weight) and districts of every
+# state, and its name.
+STATES: dict[str, tuple[int, int, str]] = {
+    "01": (1106, 15, "Schleswig-Holstein"),
+    "02": (1, 1, "Hamburg"),
+    "03": (941, 45, "Niedersachsen"),
+    "04": (2, 2, "Bremen"),
+    "05": (396, 53, "Nordrhein-Westfalen"),
+    "06": (422, 26, "Hessen"),
+    "07": (2302, 36, "Rheinland-Pfalz"),
+    "08": (1101, 44, "Baden-Württemberg"),
+    "09": (2056, 96, "Bayern"),
+    "10": (52, 6, "Saarland"),
+    "11": (1, 1, "Berlin"),
+    "12": (413, 18, "Brandenburg"),
+    "13": (726, 8, "Mecklenburg-Vorpommern"),
+    "14": (419, 13, "Sachsen"),
+    "15": (218, 14, "Sachsen-Anhalt"),
+    "16": (631, 23, "Thüringen"),
+}
+
+# The columns of the area that hold ints (all other columns of all datasets, except
+# for the population and the numbers of buildings and flats, hold floats).
+INT_COLUMNS = {"land_total", "veg_forrest", "veg_agri"}
+
+MIN_COMMUNES = len(STATES)
+MAX_COMMUNES = 100_000
+# At most 999 communes fit into a district (see ags), we aim for far less.
+MAX_COMMUNES_PER_DISTRICT = 999
+COMMUNES_PER_DISTRICT = 400
+
+# Shares of the buildings by the year they were built (roughly as in Germany).
+BUILDING_AGES = {
+    "buildings_until_1919": 0.12,
+    "buildings_1919_1948": 0.10,
+    "buildings_1949_1978": 0.34,
+    "buildings_1979_1986": 0.10,
+    "buildings_1987_1990": 0.04,
+    "buildings_1991_1995": 0.07,
+    "buildings_1996_2000": 0.09,
+    "buildings_2001_2004": 0.06,
+    "buildings_2005_2008": 0.05,
+    "buildings_2009_2011": 0.03,
+}
+
+# The state level datasets contain some shares and averages, for Germany those are the
+# mean over all states weighted by population (and not the sum).
+MEAN_COLUMNS = {"PV_average_flh", "communal"}
+
+YEARS_TO_RECORD = [2030, 2050]
+
+Row = list[float | int]
+
+
+def _district(ags: str) -> str:
+    return ags[:5] + "000"
+
+
+def _state(ags: str) -> str:
+    return ags[:2] + "000000"
+
+
+def _parents(ags: str) -> list[str]:
+    return [_district(ags), _state(ags), GERMANY]
+
+
+def _only_germany(ags: str) -> list[str]:
+    return [GERMANY]
+
+
+def _share(density: float, half: float) -> float:
+    """Goes from 0 (for density 0) to 1 (for very dense communes), 0.5 at half."""
+    return density / (density + half)
+
+
+@dataclass(kw_only=True)
+class _Commune:
+    ags: str
+    population: int
+    area: int  # in hectare
+    gemfr: bool  # A gemeindefreies Gebiet (e.g. a forest, nobody lives there)
+
+    @property
+    def density(self) -> float:
+        """Inhabitants per hectare."""
+        return self.population / self.area
+
+
+class _RecordingFactsAndAssumptions(FactsAndAssumptions):
+    """Makes up a value for every fact and assumption and remembers which were used."""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self.facts: dict[str, float] = {}
+        self.assumptions: dict[str, float] = {}
+
+    def _value(self, keyname: str) -> float:
+        return round(Random(f"{self.seed}:{keyname}").uniform(0.05, 0.95), 6)
+
+    def fact(self, keyname: str) -> float:
+        if keyname not in self.facts:
+            self.facts[keyname] = self._value(keyname)
+        return self.facts[keyname]
+
+    def ass(self, keyname: str) -> float:
+        if keyname not in self.assumptions:
+            self.assumptions[keyname] = self._value(keyname)
+        return self.assumptions[keyname]
+
+
+def _write_csv(
+    datadir: str, what: str, header: list[str], rows: Iterable[list[str]]
+) -> None:
+    fname = csv_path(datadir, what, DATASETS[what].filename)
+    os.makedirs(path.dirname(fname), exist_ok=True)
+    with open(fname, "w", newline="", encoding="utf-8") as fp:
+        writer = csv.writer(fp, lineterminator="\n")
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _split_ints(total: int, weights: list[float]) -> list[int]:
+    """Split total into ints in proportion to the weights (by largest remainder)."""
+    exact = [total * w / sum(weights) for w in weights]
+    parts = [int(x) for x in exact]
+    by_remainder = sorted(range(len(parts)), key=lambda n: parts[n] - exact[n])
+    for ndx in by_remainder[: total - sum(parts)]:
+        parts[ndx] += 1
+    return parts
+
+
+def _split(total: int, weights: list[float], maximum: int) -> list[int]:
+    """Split total into len(weights) ints between 1 and maximum, roughly in proportion
+    to the weights."""
+    assert len(weights) <= total <= len(weights) * maximum
+    parts = [1 + n for n in _split_ints(total - len(weights), weights)]
+    for ndx in range(len(parts)):
+        # Move the excess to the smallest parts
+        while parts[ndx] > maximum:
+            smallest = min(range(len(parts)), key=lambda n: parts[n])
+            move = min(parts[ndx] - maximum, maximum - parts[smallest])
+            parts[ndx] -= move
+            parts[smallest] += move
+    return parts
+
+
+class _Writer:
+    def __init__(self, datadir: str, communes: int, seed: int):
+        if not MIN_COMMUNES <= communes <= MAX_COMMUNES:
+            raise ValueError(
+                f"The number of communes must be between {MIN_COMMUNES} and {MAX_COMMUNES}"
+            )
+        self.datadir = datadir
+        self.rng = Random(seed)
+        self.seed = seed
+        all_ags = self._make_ags(communes)
+        # Every district has at least one commune where people live
+        first_in_district = {_district(ags): ags for ags in reversed(all_ags)}
+        inhabited = set(first_in_district.values()) | {GOETTINGEN}
+        self.communes = [
+            self._make_commune(ags, may_be_gemfr=ags not in inhabited)
+            for ags in all_ags
+        ]
+        self.districts = sorted({_district(c.ags) for c in self.communes})
+        self.states = sorted({_state(c.ags) for c in self.communes})
+        # The rows of the datasets that are needed to make up others
+        self.rows: dict[str, dict[str, Row]] = {}
+
+    def _make_ags(self, count: int) -> list[str]:
+        """The AGS of count communes, in districts and states like the real ones."""
+        states = list(STATES)
+        per_state = _split(count, [STATES[s][0] for s in states], count)
+        result: list[str] = []
+        for state, in_state in zip(states, per_state):
+            districts = min(
+                in_state,
+                max(STATES[state][1], -(-in_state // COMMUNES_PER_DISTRICT)),
+            )
+            # Government district and district
+            codes = [f"{r}{k:02d}" for r in range(10) for k in range(1, 100)]
+            chosen = self.rng.sample(codes, districts)
+            if state == GOETTINGEN[:2] and GOETTINGEN[2:5] not in chosen:
+                chosen[0] = GOETTINGEN[2:5]
+            per_district = _split(
+                in_state,
+                [self.rng.lognormvariate(0, 0.5) for _ in chosen],
+                MAX_COMMUNES_PER_DISTRICT,
+            )
+            for code, in_district in zip(sorted(chosen), per_district):
+                numbers = self.rng.sample(range(1, 1000), in_district)
+                district = state + code
+                if district == GOETTINGEN[:5] and int(GOETTINGEN[5:]) not in numbers:
+                    numbers[0] = int(GOETTINGEN[5:])
+                result += [f"{district}{n:03d}" for n in numbers]
+        return sorted(result)
+
+    def _make_commune(self, ags: str, *, may_be_gemfr: bool) -> _Commune:
+        rng = self.rng
+        gemfr = may_be_gemfr and rng.random() < 0.02
+        if gemfr:
+            return _Commune(
+                ags=ags,
+                population=0,
+                area=int(rng.lognormvariate(math.log(1500), 0.8)) + 1,
+                gemfr=True,
+            )
+        if ags == GOETTINGEN:
+            population = 118911
+        else:
+            population = int(rng.lognormvariate(math.log(1500), 1.3)) + 20
+        area = int(
+            rng.lognormvariate(math.log(2500), 0.6) * (1 + population / 20000) ** 0.5
+        )
+        return _Commune(ags=ags, population=population, area=area, gemfr=False)
+
+    def _with_sums(
+        self, rows: dict[str, Row], parents: Callable[[str], list[str]] = _parents
+    ) -> dict[str, Row]:
+        """Add the districts, states and Germany, as sums of their communes."""
+        sums: dict[str, Row] = {}
+        for ags, row in rows.items():
+            for parent in parents(ags):
+                total = sums.get(parent)
+                if total is None:
+                    sums[parent] = list(row)
+                else:
+                    for ndx, value in enumerate(row):
+                        total[ndx] += value
+        result = dict(rows)
+        for parent, total in sums.items():
+            result[parent] = [v if isinstance(v, int) else round(v, 4) for v in total]
+        return result
+
+    def _write_by_ags(self, what: str, rows: dict[str, Row]) -> None:
+        self.rows[what] = rows
+        _write_csv(
+            self.datadir,
+            what,
+            ["ags"] + COLUMNS[what],
+            ([a] + [str(v) for v in row] for a, row in sorted(rows.items())),
+        )
+
+    def _column(self, what: str, ags: str, column: str) -> float | int:
+        return self.rows[what][ags][COLUMNS[what].index(column)]
+
+    def _area(self, c: _Commune) -> Row:
+        rng = self.rng
+        urban = _share(c.density, 10)
+        shares = {
+            "land_settlement": 0.03 + 0.4 * urban,
+            "land_traffic": 0.03 + 0.08 * urban,
+            "water_total": 0.02 * rng.expovariate(1),
+            "veg_wood": 0.01 * rng.random(),
+            "veg_heath": 0.002 * rng.random(),
+            "veg_moor": 0.002 * rng.random(),
+            "veg_marsh": 0.001 * rng.random(),
+            "veg_plant_uncover_com": 0.003 * rng.random(),
+        }
+        rest = max(0.0, 0.98 - sum(shares.values()))
+        shares["veg_forrest"] = rest * rng.uniform(0.1, 0.6)
+        shares["veg_agri"] = rest - shares["veg_forrest"]
+        shares["settlement_ghd"] = shares["land_settlement"] * rng.uniform(0.1, 0.3)
+        return [
+            c.area
+            if column == "land_total"
+            else int(c.area * shares[column])
+            if column in INT_COLUMNS
+            else round(c.area * shares[column], 2)
+            for column in COLUMNS["area"]
+        ]
+
+    def _buildings(self, c: _Commune) -> int:
+        inhabitants_per_building = 2.3 + 6 * _share(c.density, 30)
+        return round(c.population / inhabitants_per_building)
+
+    def _flats(self, c: _Commune) -> Row:
+        buildings = self._buildings(c)
+        urban = _share(c.density, 10)
+        dorms = round(buildings * 0.005)
+        two = round(buildings * 0.15)
+        three = round(buildings * (0.05 + 0.4 * urban))
+        one = max(0, buildings - dorms - two - three)
+        values = {
+            "buildings_1flat": one,
+            "buildings_2flats": two,
+            "buildings_3flats": three,
+            "buildings_dorms": dorms,
+            "residential_buildings_total": one + two + three + dorms,
+            "residential_buildings_area_total": round(
+                c.population * self.rng.uniform(40, 50), 1
+            ),
+        }
+        return [values[column] for column in COLUMNS["flats"]]
+
+    def _buildings_row(self, c: _Commune) -> Row:
+        buildings = int(self._column("flats", c.ags, "residential_buildings_total"))
+        weights = {k: v * self.rng.uniform(0.7, 1.3) for k, v in BUILDING_AGES.items()}
+        ages = dict(zip(weights, _split_ints(buildings, list(weights.values()))))
+        flats = round(c.population / self.rng.uniform(1.9, 2.2))
+        values = {
+            **ages,
+            "buildings_total": buildings,
+            "flats_total": flats,
+            "flats_heatnet": round(
+                flats * (0.02 + 0.3 * _share(c.density, 20)) * self.rng.random()
+            ),
+        }
+        return [values[column] for column in COLUMNS["buildings"]]
+
+    def _sometimes(self, probability: float, value: float) -> float:
+        return round(value, 4) if self.rng.random() < probability else 0.0
+
+    def _renewable_energy(self, c: _Commune) -> Row:
+        rng = self.rng
+        buildings = self._column("flats", c.ags, "residential_buildings_total")
+        agri = self._column("area", c.ags, "veg_agri")
+        values = {
+            "pv": round(float(buildings) * rng.uniform(2, 8), 4),
+            "wind_on": self._sometimes(0.4, float(agri) * rng.expovariate(30)),
+            "biomass": self._sometimes(0.5, rng.lognormvariate(math.log(500), 1)),
+            "water": self._sometimes(0.1, rng.lognormvariate(math.log(100), 1.5)),
+        }
+        return [values[column] for column in COLUMNS["renewable_energy"]]
+
+    def _traffic(self, c: _Commune) -> Row:
+        rng = self.rng
+        car = c.population * rng.uniform(0.006, 0.009)
+        motorway = self._sometimes(0.3, c.area * rng.uniform(0.005, 0.02))
+        rail = c.population * rng.uniform(0.0002, 0.0006)
+        goods = c.area * rng.uniform(0.0005, 0.002)
+        elec = rng.uniform(0.5, 1)
+        values = {
+            "car_it_ot": round(car, 4),
+            "car_ab": motorway,
+            "ldt_it_ot": round(car * 0.08, 4),
+            "ldt_ab": round(motorway * 0.08, 4),
+            "mhd_it_ot": round(car * 0.05, 4),
+            "mhd_ab": round(motorway * 0.15, 4),
+            "rail_ppl_elec": round(rail * elec, 4),
+            "rail_ppl_diesel": round(rail * (1 - elec), 4),
+            "gds_elec": round(goods * elec, 4),
+            "gds_diesel": round(goods * (1 - elec), 4),
+        }
+        return [values[column] for column in COLUMNS["traffic"]]
+
+    def _destatis(self, district: str) -> Row:
+        population = self._column("population", district, "total")
+        values = {
+            "metro_mega_km": round(population * 1e-5, 4) if population > 250000 else 0,
+            "bus_mega_km": round(population * self.rng.uniform(3e-5, 6e-5), 4),
+        }
+        return [values[column] for column in COLUMNS["destatis"]]
+
+    def _nat(self, what: str, state: str) -> Row:
+        """The state level datasets, derived from the (summed up) communes."""
+        rng = self.rng
+        agri = float(self._column("area", state, "veg_agri"))
+        population = float(self._column("population", state, "total"))
+        values: dict[str, float]
+        if what == "nat_agri":
+            animals = {
+                "cows": agri * 0.25,
+                "cattle": agri * 0.45,
+                "pigs": agri * 1.5,
+                "poultry": agri * 10,
+                "other_animals": agri * 0.1,
+            }
+            animals = {k: v * rng.uniform(0.5, 1.5) for k, v in animals.items()}
+            per_animal = {"cows": 3, "cattle": 1.2, "pigs": 0.2, "poultry": 0.002}
+            per_animal["other_animals"] = 0.5
+            values = dict(animals)
+            for animal, n in animals.items():
+                values[animal + "_ch4e"] = n * per_animal[animal]
+                values[animal + "_n2oe"] = n * per_animal[animal] * 0.15
+            values["animal_wo_poultry_deposition_co2e"] = 0.1 * sum(
+                n * per_animal[a] for a, n in animals.items() if a != "poultry"
+            )
+            for column in COLUMNS[what]:
+                if column.startswith("amount_sale_"):
+                    values[column] = agri * rng.uniform(0.05, 0.3)
+                elif column.endswith("_n2o"):
+                    values[column] = agri * rng.uniform(0.01, 0.2)
+            values["drymass_ecrop"] = agri * rng.uniform(1, 2)
+            values["farms"] = agri / rng.uniform(40, 80)
+        elif what == "nat_organic_agri":
+            values = {"organic_farms_area": agri * rng.uniform(0.05, 0.15)}
+        elif what == "nat_energy":
+            pv = sum(
+                float(row[0])
+                for ags, row in self.rows["renewable_energy"].items()
+                if ags != GERMANY and ags.startswith(state[:2])
+            )
+            values = {
+                "PV_roof_2017": pv * 0.7,
+                "PV_others": pv * 0.1,
+                "PV_land_2017": pv * 0.2,
+                "PV_average_flh": rng.uniform(850, 1050),
+                "demand_2018": population * rng.uniform(6, 7),
+                "bioenergy_potential": agri * rng.uniform(3, 6),
+            }
+        else:
+            assert what == "nat_res_buildings"
+            values = {"communal": rng.uniform(0.02, 0.05)}
+        return [round(values[column], 4) for column in COLUMNS[what]]
+
+    def _germany(self, what: str, rows: dict[str, Row]) -> Row:
+        populations = {
+            state: float(self._column("population", state, "total")) for state in rows
+        }
+        total = sum(populations.values())
+        germany: Row = []
+        for ndx, column in enumerate(COLUMNS[what]):
+            if column in MEAN_COLUMNS:
+                value = sum(float(rows[s][ndx]) * populations[s] for s in rows) / total
+            else:
+                value = sum(float(row[ndx]) for row in rows.values())
+            germany.append(round(value, 4))
+        return germany
+
+    def write_datasets(self) -> None:
+        communes = self.communes
+        self._write_by_ags(
+            "population", self._with_sums({c.ags: [c.population] for c in communes})
+        )
+        self._write_by_ags(
+            "area", self._with_sums({c.ags: self._area(c) for c in communes})
+        )
+        self._write_by_ags(
+            "flats", self._with_sums({c.ags: self._flats(c) for c in communes})
+        )
+        # Gemeindefreie Gebiete are missing in the buildings and the renewable energy
+        # (see RefData._add_zero_rows_for_gemfr)
+        inhabited = [c for c in communes if not c.gemfr]
+        self._write_by_ags(
+            "buildings",
+            self._with_sums({c.ags: self._buildings_row(c) for c in inhabited}),
+        )
+        # Only the communes and Germany, the rest is summed up while loading
+        for what, make_row in [
+            ("renewable_energy", self._renewable_energy),
+            ("traffic", self._traffic),
+        ]:
+            rows = {
+                c.ags: make_row(c)
+                for c in (inhabited if what == "renewable_energy" else communes)
+            }
+            self._write_by_ags(what, self._with_sums(rows, _only_germany))
+        self._write_by_ags(
+            "destatis",
+            self._with_sums({d: self._destatis(d) for d in self.districts}),
+        )
+        for what in ["nat_agri", "nat_organic_agri", "nat_energy", "nat_res_buildings"]:
+            rows = {s: self._nat(what, s) for s in self.states}
+            rows[GERMANY] = self._germany(what, rows)
+            self._write_by_ags(what, rows)
+        self._write_area_kinds()
+        self._write_co2path()
+        self._write_ags_master()
+
+    def _write_area_kinds(self) -> None:
+        def kinds(c: _Commune) -> list[str]:
+            district = _district(c.ags)
+            urban_region = self._column(
+                "population", district, "total"
+            ) > 2 * self._column("area", district, "land_total")
+            if c.population >= 500000:
+                rt7 = "71"
+            elif c.population >= 100000:
+                rt7 = "72"
+            elif urban_region:
+                rt7 = "73" if c.population >= 20000 else "74"
+            elif c.population >= 50000:
+                rt7 = "75"
+            else:
+                rt7 = "76" if c.population >= 10000 else "77"
+            if c.population >= 100000:
+                rt3 = "city"
+            elif c.population >= 10000:
+                rt3 = "smcty"
+            else:
+                rt3 = "rural"
+            return [c.ags, rt7, rt3]
+
+        _write_csv(
+            self.datadir,
+            "area_kinds",
+            ["ags", "rt7", "rt3"],
+            (kinds(c) for c in self.communes),
+        )
+
+    def _write_co2path(self) -> None:
+        rows: list[list[str]] = []
+        ghg = non_co2 = 0.0
+        for year in range(2016, 2051):
+            # The yearly emissions go down to 0 (or almost 0) in 2045
+            ghg += 900e6 * max(0.0, (2045 - year) / 29)
+            non_co2 += 100e6 * max(0.2, (2045 - year) / 29)
+            rows.append([str(year), str(ghg), str(non_co2)])
+        _write_csv(self.datadir, "co2path", ["year"] + COLUMNS["co2path"], rows)
+
+    def _write_ags_master(self) -> None:
+        names = {
+            c.ags: f"Gemeinde {c.ags}" + (", gemfr. Gebiet" if c.gemfr else "")
+            for c in self.communes
+        }
+        names[GOETTINGEN] = "Göttingen, Stadt"
+        names.update({d: f"Landkreis {d[:5]}" for d in self.districts})
+        names.update({s: STATES[s[:2]][2] for s in self.states})
+        names[GERMANY] = "Deutschland"
+        _write_csv(
+            self.datadir,
+            "ags",
+            ["ags", "description"],
+            ([a, d] for a, d in sorted(names.items())),
+        )
+
+    def _to_record(self) -> list[str]:
+        """The AGS whose calculation should read every fact and assumption."""
+        rt7: dict[str, str] = {}
+        with open(csv_path(self.datadir, "area_kinds"), encoding="utf-8") as fp:
+            for ags, kind, _ in list(csv.reader(fp))[1:]:
+                rt7.setdefault(kind, ags)
+        by_population = sorted(
+            (c for c in self.communes if not c.gemfr), key=lambda c: c.population
+        )
+        gemfr = [c.ags for c in self.communes if c.gemfr][:1]
+        return sorted(
+            set(rt7.values())
+            | {by_population[0].ags, by_population[-1].ags, GOETTINGEN}
+            | set(gemfr)
+            | {self.districts[0], self.states[0], GERMANY}
+        )
+
+    def write_facts_and_assumptions(self) -> None:
+        recording = _RecordingFactsAndAssumptions(self.seed)
+        rd = RefData(self.datadir, fix_missing_entries=True, lazy=True)
+        # Instead of the not yet existing files (see RefData._facts_and_assumptions)
+        rd.__dict__["_facts_and_assumptions"] = recording
+        for ags in self._to_record():
+            for year in YEARS_TO_RECORD:
+                entries = make_entries(rd, ags, year)
+                calculate(Inputs(facts_and_assumptions=recording, entries=entries))
+        for what, values in [
+            ("facts", recording.facts),
+            ("assumptions", recording.assumptions),
+        ]:
+            _write_csv(
+                self.datadir,
+                what,
+                [
+                    "label",
+                    "group",
+                    "description",
+                    "value",
+                    "unit",
+                    "rationale",
+                    "reference",
+                    "link",
+                ],
+                (
+                    [label, "", f"Synthetic {label}", str(value), "", "", "", ""]
+                    for label, value in sorted(values.items())
+                ),
+            )
+
+    def write_version(self) -> None:
+        version = f"synthetic-{len(self.communes)}-{self.seed}"
+        with open(path.join(self.datadir, "production.json"), "w") as fp:
+            json.dump({"public": version, "proprietary": version}, fp)
+
+
+def write(datadir: str, *, communes: int = 300, seed: int = 0) -> None:
+    """Write a synthetic reference data set with the given number of communes to
+    datadir (which then contains a public and a proprietary directory, just like the
+    real data directory). The same seed always gives the same data set."""
+    writer = _Writer(datadir, communes, seed)
+    writer.write_datasets()
+    writer.write_facts_and_assumptions()
+    writer.write_version()
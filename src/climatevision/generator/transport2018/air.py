@@ -8,7 +8,7 @@ from ..utils import element_wise_plus
 from . import co2e
 
 
-@dataclass
+@dataclass(slots=True)
 class Air:
     # Used by air_dmstc, air, air_inter
     CO2e_combustion_based: float
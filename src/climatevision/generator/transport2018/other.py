@@ -6,7 +6,7 @@ from ..inputs import Inputs
 from ..utils import element_wise_plus
 
 
-@dataclass
+@dataclass(slots=True)
 class Other:
     # Used by other_foot, other_cycl
     CO2e_combustion_based: float
@@ -8,7 +8,7 @@ from ..utils import element_wise_plus, MILLION
 from . import co2e
 
 
-@dataclass
+@dataclass(slots=True)
 class Rail:
     # Used by rail_gds, rail_ppl_metro, rail_ppl_distance, rail_ppl, rail
     CO2e_combustion_based: float
@@ -9,7 +9,7 @@ from ..utils import element_wise_plus, MILLION
 from . import co2e
 
 
-@dataclass
+@dataclass(slots=True)
 class Road:
     """Emissions caused by transport on the Road (car, bus, lorry, ...) of both goods and people."""
 
@@ -8,7 +8,7 @@ from ..utils import element_wise_plus
 from . import co2e
 
 
-@dataclass
+@dataclass(slots=True)
 class Ship:
     # Used by ship_dmstc, ship_inter, ship
     CO2e_combustion_based: float
@@ -12,7 +12,7 @@ from .other import Other
 from .transport import Transport
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class T18:
     t: Transport
 
@@ -11,7 +11,7 @@ from .ship import Ship
 from .other import Other
 
 
-@dataclass
+@dataclass(slots=True)
 class Transport:
     # Used by t
     CO2e_combustion_based: float
@@ -74,7 +74,7 @@ def calc_air_international(inputs: Inputs, t18: T18) -> "Transport":
     )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Air:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
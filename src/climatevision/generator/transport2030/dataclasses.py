@@ -15,7 +15,7 @@ from .other import Other, OtherCycle
 from .transport import Transport
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class GPlanning:
     # Used by g_planning
     cost_wage: float
@@ -72,7 +72,7 @@ class GPlanning:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class G:
     # Used by g
     cost_wage: float
@@ -85,7 +85,7 @@ class G:
     invest_pa_com: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class T:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
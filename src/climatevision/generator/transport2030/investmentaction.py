@@ -6,7 +6,7 @@ from ..inputs import Inputs
 from ..utils import div
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class InvestmentAction:
     """For some transport mechanism additional investments are needed."""
 
@@ -154,7 +154,7 @@ class InvestmentAction:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadInvestmentAction(InvestmentAction):
     # Used by road_action_charger
     base_unit: float
@@ -10,7 +10,7 @@ from .transport import Transport, ZeroEnergyAndCO2e
 from .investmentaction import InvestmentAction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OtherFoot:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
@@ -69,7 +69,7 @@ class OtherFoot:
         return res
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class OtherCycle:
     # Used by other_cycl
     LIFT_INTO_RESULT_DICT = ["transport"]
@@ -140,7 +140,7 @@ class OtherCycle:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Other:
     # Used by other
     LIFT_INTO_RESULT_DICT = ["transport"]
@@ -10,7 +10,7 @@ from .transport import Transport
 from .investmentaction import InvestmentAction
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RailPeople:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
@@ -179,7 +179,7 @@ class RailPeople:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RailPeopleMetroActionInfra:
     # Used by rail_ppl_metro_action_infra
     base_unit: float
@@ -233,7 +233,7 @@ class RailPeopleMetroActionInfra:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RailPeopleSum:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
@@ -312,7 +312,7 @@ class RailPeopleSum:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RailGoods:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
@@ -395,7 +395,7 @@ class RailGoods:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Rail:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
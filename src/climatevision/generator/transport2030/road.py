@@ -10,6 +10,7 @@ from .transport import Transport
 from .investmentaction import InvestmentAction, RoadInvestmentAction
 
 
+# Not slotted, see BusInvestments
 @dataclass(kw_only=True)
 class TransportInvestments:
     """For every mechanism of transport, we compute some basic investment
@@ -23,7 +24,7 @@ class TransportInvestments:
     invest_per_x: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Road:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
@@ -409,7 +410,7 @@ class Road:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadCar(Road):
     # Used by road_car
     LIFT_INTO_RESULT_DICT = ["transport", "fleet_modernisation_cost"]
@@ -450,6 +451,7 @@ class RoadCar(Road):
         )
 
 
+# Not slotted, as it is used as second base class (which must not have slots too)
 @dataclass(kw_only=True)
 class BusInvestments(TransportInvestments):
     cost_wage: float
@@ -462,7 +464,7 @@ class BusInvestments(TransportInvestments):
     ratio_wage_to_emplo: float
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadBus(Road, BusInvestments):
     # Used by road_bus
     @staticmethod
@@ -589,7 +591,7 @@ class RoadBus(Road, BusInvestments):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadPeople(Road):
     # Used by road_ppl
     base_unit: float
@@ -645,7 +647,7 @@ class RoadPeople(Road):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadGoodsMediumAndHeavyDuty(Road):
     # Used by road_gds_mhd
     base_unit: float
@@ -720,7 +722,7 @@ class RoadGoodsMediumAndHeavyDuty(Road):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadGoodsLightDuty(Road):
     # Used by road_gds_ldt
     base_unit: float
@@ -762,7 +764,7 @@ class RoadGoodsLightDuty(Road):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadGoods(Road):
     # Used by road_gds
     base_unit: float
@@ -808,7 +810,7 @@ class RoadGoods(Road):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class RoadSum(Road):
     # Used by road
 
@@ -9,7 +9,7 @@ from ..transport2018.t18 import T18
 from .transport import Transport
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ShipDomestic:
     LIFT_INTO_RESULT_DICT = ["transport"]
     transport: Transport
@@ -89,7 +89,7 @@ class ShipDomestic:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ShipDomesticActionInfra:
     # Used by ship_dmstc_action_infra
     CO2e_total_2021_estimated: float
@@ -147,7 +147,7 @@ class ShipDomesticActionInfra:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class ShipInternational:
     # Used by ship_inter
     LIFT_INTO_RESULT_DICT = ["transport"]
@@ -192,7 +192,7 @@ class ShipInternational:
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Ship:
     # Used by ship
     LIFT_INTO_RESULT_DICT = ["transport"]
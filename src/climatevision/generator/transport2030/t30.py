@@ -24,7 +24,7 @@ from .transport import Transport
 from .dataclasses import GPlanning, G, T
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class T30:
     air_inter: Transport
     air_dmstc: Transport
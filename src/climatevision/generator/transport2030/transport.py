@@ -13,7 +13,7 @@ class Transport2018(Protocol):
     transport_capacity_tkm: float
 
 
-@dataclass(kw_only=True, frozen=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class ZeroEnergyAndCO2e:
     transport_capacity_pkm: float
     transport_capacity_tkm: float
@@ -21,7 +21,7 @@ class ZeroEnergyAndCO2e:
     CO2e_combustion_based: float = 0
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Transport:
     """Every form of transports is modelled at least in terms of the below."""
 
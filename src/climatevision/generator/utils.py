@@ -6,6 +6,8 @@
 from dataclasses import fields
 from typing import TypeVar
 
+from .vector import Vector
+
 MILLION = 1000000
 
 
@@ -15,6 +17,9 @@ def div(a: float, b: float) -> float:
     the data may be incomplete or irrelevant and the denominator happens to be zero.
     In this case, a result of 0 is returned, also to avoid an exception.
     """
+    if isinstance(b, Vector):
+        # The lanes might not agree on whether b is zero
+        return b.rdiv_or_zero(a)  # type: ignore
     return 0.0 if b == 0.0 else a / b
 
 
@@ -0,0 +1,135 @@
+"""Module vector -- a number that stands for the values of several scenarios at once.
+
+The calculations are plain arithmetic on floats, so a Vector can be used instead of a
+float anywhere: every arithmetic operation is simply done for every scenario (we call
+them lanes here). Comparisons (and therefore ifs, min and max) are the exception, as
+they have to decide for all lanes at once. As long as all lanes agree that is no
+problem. If they do not, Divergence is raised, and the caller (see scenarios) has to
+split the lanes into groups that agree and compute those groups separately.
+"""
+
+# pyright: strict
+
+from itertools import repeat
+from typing import Any, Callable, Union
+import operator
+
+
+class Divergence(Exception):
+    """The lanes of a Vector disagree on a comparison."""
+
+    def __init__(self, mask: list[bool]):
+        super().__init__("The scenarios take different branches")
+        self.mask = mask  # The outcome of the comparison for every lane
+
+
+OTHER = Union["Vector", float, int]
+
+# The typeshed signatures of these are not fully known
+_truediv: Callable[[Any, Any], Any] = operator.truediv  # type: ignore
+_pow: Callable[[Any, Any], Any] = operator.pow  # type: ignore
+
+
+class Vector:
+    __slots__ = ("values",)
+
+    values: list[Any]  # One float (or int) per lane
+
+    def __init__(self, values: list[Any]):
+        self.values = values
+
+    def _map(self, other: OTHER, f: Callable[[Any, Any], Any]) -> list[Any]:
+        """f(a, b) for every lane, where a is the value of self and b the one of other."""
+        if isinstance(other, Vector):
+            if len(other.values) != len(self.values):
+                raise ValueError("Vectors of different lengths can not be combined")
+            return list(map(f, self.values, other.values))
+        else:
+            return list(map(f, self.values, repeat(other)))
+
+    def _rmap(self, other: OTHER, f: Callable[[Any, Any], Any]) -> list[Any]:
+        """Like _map, but f(b, a)."""
+        if isinstance(other, Vector):
+            return other._map(self, f)
+        return list(map(f, repeat(other), self.values))
+
+    def _decide(self, outcomes: list[bool]) -> bool:
+        if all(outcomes):
+            return True
+        elif not any(outcomes):
+            return False
+        else:
+            raise Divergence(outcomes)
+
+    def __add__(self, other: OTHER) -> "Vector":
+        return Vector(self._map(other, operator.add))
+
+    def __radd__(self, other: OTHER) -> "Vector":
+        return Vector(self._rmap(other, operator.add))
+
+    def __sub__(self, other: OTHER) -> "Vector":
+        return Vector(self._map(other, operator.sub))
+
+    def __rsub__(self, other: OTHER) -> "Vector":
+        return Vector(self._rmap(other, operator.sub))
+
+    def __mul__(self, other: OTHER) -> "Vector":
+        return Vector(self._map(other, operator.mul))
+
+    def __rmul__(self, other: OTHER) -> "Vector":
+        return Vector(self._rmap(other, operator.mul))
+
+    def __truediv__(self, other: OTHER) -> "Vector":
+        return Vector(self._map(other, _truediv))
+
+    def __rtruediv__(self, other: OTHER) -> "Vector":
+        return Vector(self._rmap(other, _truediv))
+
+    def __pow__(self, other: OTHER) -> "Vector":
+        return Vector(self._map(other, _pow))
+
+    def __rpow__(self, other: OTHER) -> "Vector":
+        return Vector(self._rmap(other, _pow))
+
+    def __neg__(self) -> "Vector":
+        return Vector([-a for a in self.values])
+
+    def __pos__(self) -> "Vector":
+        return Vector([+a for a in self.values])
+
+    def __abs__(self) -> "Vector":
+        return Vector([abs(a) for a in self.values])
+
+    def rdiv_or_zero(self, other: OTHER) -> "Vector":
+        """The same as utils.div(other, self) in every lane."""
+        return Vector(self._map(other, lambda a, b: 0.0 if a == 0.0 else b / a))
+
+    def __lt__(self, other: OTHER) -> bool:
+        return self._decide(self._map(other, operator.lt))
+
+    def __le__(self, other: OTHER) -> bool:
+        return self._decide(self._map(other, operator.le))
+
+    def __gt__(self, other: OTHER) -> bool:
+        return self._decide(self._map(other, operator.gt))
+
+    def __ge__(self, other: OTHER) -> bool:
+        return self._decide(self._map(other, operator.ge))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Vector, float, int)):
+            return NotImplemented
+        return self._decide(self._map(other, operator.eq))
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, (Vector, float, int)):
+            return NotImplemented
+        return self._decide(self._map(other, operator.ne))
+
+    __hash__ = None  # type: ignore
+
+    def __bool__(self) -> bool:
+        return self._decide([bool(a) for a in self.values])
+
+    def __repr__(self) -> str:
+        return f"Vector({self.values!r})"
@@ -0,0 +1,364 @@
+# pyright: strict
+"""Module httpserver -- serve the RPCs of GeneratorRpcs (and a few static files) over
+HTTP to many clients at the same time.
+
+Every connection is read by a thread of its own and kept alive between requests.
+Calculations are CPU bound, so the RPCs are dispatched to worker processes. Every
+worker creates its GeneratorRpcs (and so loads the reference data) once and uses it
+for all requests it gets. All requests for the same AGS and year go to the same
+worker, so that its caches (the last calculation, the results and the traces) are
+used as well as if there was only one. With no workers, the RPCs are dispatched in the
+connection threads, using one GeneratorRpcs for all of them.
+
+A worker that dies (e.g. killed for using too much memory) is replaced by a new one,
+which gets the request again. Identical calculate requests that arrive at the same time are only dispatched once
+(GeneratorRpcs does the same within a process).
+
+A calculate-batch request is split up into one calculate request per job, which are
+dispatched concurrently. Their responses (with the index of the job as id) are
+streamed back as JSON lines as soon as they are done, in chunked encoding.
+"""
+
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Any, Callable, Generator, cast
+import json
+import logging
+import multiprocessing
+import signal
+import socket
+import zlib
+
+import jsonrpcserver
+
+from .rpcs import GeneratorRpcs, batch_job_requests
+from .singleflight import SingleFlight
+
+log = logging.getLogger(__name__)
+
+API_PATH = ["", "localzero", "api", "v0", ""]
+MAX_REQUEST_BYTES = 5 * 1024 * 1024
+# The RPCs whose concurrent identical requests share one response
+COALESCED_METHODS = {"calculate"}
+
+# The GeneratorRpcs of a worker process
+_worker_rpcs: GeneratorRpcs | None = None
+
+
+def _init_worker(make_rpcs: Callable[[], GeneratorRpcs]) -> None:
+    global _worker_rpcs
+    _worker_rpcs = make_rpcs()
+
+
+def _dispatch_in_worker(request: str) -> str:
+    assert _worker_rpcs is not None
+    return jsonrpcserver.dispatch(request, methods=_worker_rpcs.methods())  # type: ignore
+
+
+def _single_request(request: str) -> dict[str, Any] | None:
+    """The parsed request, None if it is not a single request (e.g. a batch, or not
+    JSON at all)."""
+    try:
+        parsed: Any = json.loads(request)
+    except ValueError:
+        return None
+    return cast(dict[str, Any], parsed) if isinstance(parsed, dict) else None
+
+
+def _coalescing_key(request: str) -> tuple[str | None, Any]:
+    """The key (and id) of a single request of one of the COALESCED_METHODS: the
+    request without its id. None for all other requests."""
+    single = _single_request(request)
+    if single is None:
+        return None, None
+    if single.get("method") not in COALESCED_METHODS or "id" not in single:
+        return None, None
+    without_id = {k: v for k, v in single.items() if k != "id"}
+    return json.dumps(without_id, sort_keys=True), single["id"]
+
+
+def _worker_of(request: str, workers: int) -> int:
+    """The worker that answers request: the same one for all requests about the same
+    AGS and year. Requests that are not about one are spread by their content."""
+    single = _single_request(request)
+    params: Any = single.get("params") if single is not None else None
+    if isinstance(params, dict) and "ags" in params and "year" in params:
+        about = json.dumps([params["ags"], params["year"]])
+    else:
+        about = request
+    return zlib.crc32(about.encode()) % workers
+
+
+def _batch_requests(request: str) -> list[str] | None:
+    """The calculate requests of a (valid) single calculate-batch request. None for
+    all other requests, including invalid ones, which are left to GeneratorRpcs to
+    answer."""
+    single = _single_request(request)
+    if single is None:
+        return None
+    params = single.get("params")
+    if single.get("method") != "calculate-batch" or not isinstance(params, dict):
+        return None
+    return batch_job_requests(cast(dict[str, Any], params).get("jobs"))  # type: ignore
+
+
+class StaticFile:
+    def __init__(self, content: str, content_type: str):
+        self.content = content.encode()
+        self.content_type = content_type
+
+
+class GeneratorHttpServer(ThreadingHTTPServer):
+    """Serves the RPCs on POST to /localzero/api/v0/ and the static files (by path) on
+    GET.
+
+    make_rpcs is called once per worker process (so it must be picklable, e.g. a
+    function defined at the top level of a module) or once if workers is 0.
+
+    Every worker is a process of its own, which answers one request after the other
+    (see _worker_of). Workers that die are replaced (see _in_worker).
+    """
+
+    # So that server_close waits for the requests in progress
+    daemon_threads = False
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        make_rpcs: Callable[[], GeneratorRpcs],
+        *,
+        workers: int,
+        static: dict[str, StaticFile] | None = None,
+    ):
+        super().__init__(address, _Handler)
+        self.static = static if static is not None else {}
+        self.rpcs: GeneratorRpcs | None = None
+        self.make_rpcs = make_rpcs
+        self.pools: list[Executor] = [self._new_pool() for _ in range(workers)]
+        # Held while a broken pool is replaced
+        self._pools_lock = Lock()
+        self.workers = workers
+        if workers == 0:
+            self.rpcs = make_rpcs()
+        self.requests: SingleFlight[str] = SingleFlight()
+        self.closing = False
+        # The connections that are waiting for their next request (see _Handler)
+        self._idle: set[socket.socket] = set()
+        self._idle_lock = Lock()
+
+    def _new_pool(self) -> Executor:
+        # Not forked, as forking a process with threads is asking for trouble
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.make_rpcs,),
+        )
+
+    def _replace_pool(self, index: int, broken: Executor) -> None:
+        """Replace the pool at index, unless another request already did."""
+        with self._pools_lock:
+            if self.pools[index] is broken:
+                log.warning("Worker %d died, starting a new one", index)
+                broken.shutdown(wait=False)
+                self.pools[index] = self._new_pool()
+
+    def _in_pool(self, index: int, request: str) -> str:
+        pool = self.pools[index]
+        try:
+            return pool.submit(_dispatch_in_worker, request).result()
+        except BrokenProcessPool:
+            self._replace_pool(index, pool)
+            raise
+
+    def _in_worker(self, index: int, request: str) -> str:
+        """Dispatch request in worker index. If the worker dies, it is replaced and the
+        request is tried once more (on the new one)."""
+        try:
+            return self._in_pool(index, request)
+        except BrokenProcessPool:
+            return self._in_pool(index, request)
+
+    def dispatch(self, request: str) -> str:
+        if self.pools:
+            index = _worker_of(request, len(self.pools))
+            key, id = _coalescing_key(request)
+            if key is None:
+                return self._in_worker(index, request)
+            response = self.requests.do(key, lambda: self._in_worker(index, request))
+            # The response may be the one to an identical request with another id
+            shared: dict[str, Any] = json.loads(response)
+            if shared.get("id") != id:
+                response = json.dumps({**shared, "id": id})
+            return response
+        assert self.rpcs is not None
+        return jsonrpcserver.dispatch(request, methods=self.rpcs.methods())  # type: ignore
+
+    def dispatch_batch(self, requests: list[str]) -> Generator[str, None, None]:
+        """The responses to the requests in the order they are done."""
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as threads:
+            futures = [threads.submit(self.dispatch, r) for r in requests]
+            try:
+                for f in as_completed(futures):
+                    yield f.result()
+            finally:
+                # In case the client went away
+                for f in futures:
+                    f.cancel()
+
+    def set_idle(self, connection: socket.socket, idle: bool) -> None:
+        with self._idle_lock:
+            if idle and not self.closing:
+                self._idle.add(connection)
+            else:
+                self._idle.discard(connection)
+
+    def graceful_shutdown(self) -> None:
+        """Stop accepting connections, close the idle ones and wait for the requests in
+        progress to be answered. Must not be called from the thread running
+        serve_forever."""
+        self.shutdown()
+        with self._idle_lock:
+            self.closing = True
+            for connection in self._idle:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            self._idle.clear()
+        # Waits for the threads of all connections
+        self.server_close()
+        with self._pools_lock:
+            pools = list(self.pools)
+        for pool in pools:
+            pool.shutdown(wait=True)
+
+    def serve_until_signalled(self) -> None:
+        """serve_forever until SIGINT or SIGTERM, then shut down gracefully."""
+
+        def on_signal(signum: int, frame: Any) -> None:
+            log.info("Shutting down")
+            # shutdown waits for serve_forever, which runs in this thread
+            Thread(target=self.shutdown).start()
+
+        previous = {
+            s: signal.signal(s, on_signal) for s in (signal.SIGINT, signal.SIGTERM)
+        }
+        try:
+            self.serve_forever()
+        finally:
+            for s, handler in previous.items():
+                signal.signal(s, handler)
+            self.graceful_shutdown()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep connections alive (which means every response needs a Content-Length)
+    protocol_version = "HTTP/1.1"
+    server: GeneratorHttpServer  # type: ignore (more specific than in the base class)
+
+    def setup(self):
+        super().setup()
+        self.server.set_idle(self.connection, True)
+
+    def parse_request(self) -> bool:
+        # The request line was read, so we are no longer idle
+        self.server.set_idle(self.connection, False)
+        return super().parse_request()
+
+    def handle_one_request(self):
+        super().handle_one_request()
+        if self.server.closing:
+            self.close_connection = True
+        else:
+            self.server.set_idle(self.connection, True)
+
+    def finish(self):
+        self.server.set_idle(self.connection, False)
+        super().finish()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log.debug(format, *args)
+
+    def _respond(
+        self, status: int, body: bytes = b"", headers: dict[str, str] = {}
+    ) -> None:
+        self.send_response(status)
+        for k, v in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        if self.path.split("/") != API_PATH:
+            self._respond(404)
+            return
+        try:
+            content_len = int(self.headers.get("Content-Length", -1))
+        except ValueError:
+            content_len = -1
+        if content_len < 0 or content_len > MAX_REQUEST_BYTES:
+            self.close_connection = True
+            self._respond(400)
+            return
+        request = self.rfile.read(content_len).decode()
+        batch = _batch_requests(request)
+        if batch is not None:
+            self._stream(self.server.dispatch_batch(batch))
+            return
+        response = self.server.dispatch(request)
+        self._respond(
+            200,
+            response.encode(),
+            {
+                "Content-type": "application/json",
+                "Access-Control-Allow-Origin": "*",
+            },
+        )
+
+    def _stream(self, lines: Generator[str, None, None]) -> None:
+        # Chunked encoding needs HTTP/1.1, for older clients the end of the
+        # connection marks the end of the response
+        chunked = self.request_version == "HTTP/1.1"
+        self.send_response(200)
+        self.send_header("Content-type", "application/jsonl")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if chunked:
+            self.send_header("Transfer-Encoding", "chunked")
+        else:
+            self.close_connection = True
+        self.end_headers()
+        with closing(lines):
+            for line in lines:
+                data = (line + "\n").encode()
+                if chunked:
+                    data = b"%x\r\n%s\r\n" % (len(data), data)
+                self.wfile.write(data)
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def do_OPTIONS(self):
+        self._respond(
+            204,
+            headers={
+                "Access-Control-Allow-Methods": "POST, GET, OPTIONS",
+                "Access-Control-Allow-Headers": "Content-Type",
+                "Access-Control-Allow-Origin": "*",
+            },
+        )
+
+    def do_GET(self):
+        f = self.server.static.get(self.path)
+        if f is None:
+            self._respond(404)
+        else:
+            self._respond(200, f.content, {"Content-type": f.content_type})
@@ -1,19 +1,93 @@
 # pyright: strict reportMissingTypeStubs=true
+from collections import OrderedDict
+from threading import Lock
 import dataclasses
+import json
 from typing import Callable, Any
 
 import jsonrpcserver
 
 from .. import generator
-from ..tracing import with_tracing
+from ..tracing import TracedResult, trace_sectors, with_tracing
+from ..tracing.traced import with_unfinalized_tracing
+from ..tracing.paths import sector_of
 from . import overridables
+from .singleflight import SingleFlight
+
+# The number of calculations whose traces are kept (see GeneratorRpcs.trace)
+MAX_TRACED = 8
+# The most jobs one calculate-batch request may ask for
+MAX_BATCH_JOBS = 1000
+
+
+def _valid_paths(paths: list[str] | None) -> bool:
+    return paths is None or (
+        isinstance(paths, list)  # type: ignore (paths come from a client)
+        and all(isinstance(p, str) for p in paths)  # type: ignore
+    )
+
+
+def batch_job_requests(jobs: list[dict[str, Any]]) -> list[str] | None:
+    """The calculate requests (with the index of their job as id) that make up
+    calculate-batch. None if jobs is not a list of jobs or too long."""
+    if (
+        not isinstance(jobs, list)  # type: ignore (jobs come from a client)
+        or len(jobs) > MAX_BATCH_JOBS
+        or not all(isinstance(job, dict) for job in jobs)  # type: ignore
+    ):
+        return None
+    return [
+        json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "calculate",
+                "params": {"overrides": {}, **job, "trace": False},
+                "id": i,
+            }
+        )
+        for i, job in enumerate(jobs)
+    ]
 
 
 class GeneratorRpcs:
+    """The RPCs of the generator. Safe to use from several threads."""
+
     rd: generator.RefData
+    # The last (untraced) calculation, so that changing a few overrides only
+    # recalculates the affected sectors.
+    last_calculation: generator.Calculation | None
+    results: generator.ResultCache
+    # The traced calculations by key of results (the most recently used last). Every
+    # one only covers the sectors that were asked for (and their dependencies).
+    traced: OrderedDict[str, list[TracedResult]]
+    # So that identical calculations asked for at the same time are only done once
+    calculations: SingleFlight[dict[str, Any]]
 
-    def __init__(self, rd: generator.RefData):
+    def __init__(
+        self, rd: generator.RefData, results: generator.ResultCache | None = None
+    ):
         self.rd = rd
+        self.last_calculation = None
+        self.results = results if results is not None else generator.ResultCache()
+        self.traced = OrderedDict()
+        self.calculations = SingleFlight()
+        # Guards last_calculation and traced
+        self._lock = Lock()
+
+    def _entries(
+        self, ags: str, year: int, overrides: dict[str, int | float | str]
+    ) -> generator.Entries:
+        defaults = dataclasses.asdict(generator.make_entries(self.rd, ags, year))
+        defaults.update(overrides)
+        return generator.Entries(**defaults)
+
+    def _inputs(
+        self, ags: str, year: int, overrides: dict[str, int | float | str]
+    ) -> generator.Inputs:
+        return generator.Inputs(
+            facts_and_assumptions=self.rd.facts_and_assumptions(),
+            entries=self._entries(ags, year, overrides),
+        )
 
     def do_list_ags(self):
         def guess_short_name_from_description(d: str) -> str:
@@ -43,21 +117,140 @@ class GeneratorRpcs:
             )
         )
 
+    def do_calculate(
+        self,
+        ags: str,
+        year: int,
+        overrides: dict[str, int | float | str],
+        trace: bool,
+        paths: list[str] | None = None,
+    ) -> dict[str, Any]:
+        """The result dict, or only its values whose path matches one of the glob
+        patterns in paths (see generator.projected_result_dict)."""
+
+        def calculate():
+            inputs = self._inputs(ags, year, overrides)
+            entries = inputs.entries
+            if trace:
+                return generator.calculate(inputs).result_dict()
+            key = self.results.key(self.rd, entries)
+            if key is not None:
+                result = self.results.get(key)
+                if result is not None:
+                    return result
+            with self._lock:
+                previous = self.last_calculation
+            c = generator.calculate_incremental(inputs, previous)
+            with self._lock:
+                self.last_calculation = c
+            result = c.result.result_dict()
+            if key is not None:
+                self.results.put(key, result)
+            return result
+
+        # Untraced calculations share the whole (cached) result and select from it
+        key = (
+            ags,
+            year,
+            json.dumps(overrides, sort_keys=True),
+            trace,
+            json.dumps(paths) if trace else None,
+        )
+
+        def traced_projection():
+            # Named after their paths in the whole result, but only the traces of
+            # the selected values are finalized
+            assert paths is not None
+            return TracedResult(with_unfinalized_tracing(calculate)).projected(paths)
+
+        if trace and paths is not None:
+            result = self.calculations.do(key, traced_projection)
+        else:
+            result = self.calculations.do(
+                key, lambda: with_tracing(enabled=trace, f=calculate)
+            )
+        if paths is not None and not trace:
+            result = generator.projected_result_dict(result, paths)
+        return result
+
     def calculate(
-        self, ags: str, year: int, overrides: dict[str, int | float | str], trace: bool
+        self,
+        ags: str,
+        year: int,
+        overrides: dict[str, int | float | str],
+        trace: bool,
+        paths: list[str] | None = None,
     ) -> jsonrpcserver.Result:
-        def calculate():
-            defaults = dataclasses.asdict(generator.make_entries(self.rd, ags, year))
-            defaults.update(overrides)
-            entries = generator.Entries(**defaults)
-            inputs = generator.Inputs(
-                facts_and_assumptions=self.rd.facts_and_assumptions(), entries=entries
+        """The result of the calculation. With paths (e.g. ["m183X.*",
+        "bisko.total"]) only the values whose path matches one of the glob patterns."""
+        if not _valid_paths(paths):
+            return jsonrpcserver.InvalidParams("paths must be a list of glob patterns")
+        return jsonrpcserver.Success(
+            self.do_calculate(ags, year, overrides, trace, paths)
+        )
+
+    def calculate_batch(self, jobs: list[dict[str, Any]]) -> jsonrpcserver.Result:
+        """The results of all jobs ({"ags", "year", "overrides", "paths"}, overrides
+        and paths being optional) in one response. The HTTP server instead streams the results as
+        they are done (see httpserver)."""
+        if batch_job_requests(jobs) is None:
+            return jsonrpcserver.InvalidParams(
+                f"jobs must be a list of at most {MAX_BATCH_JOBS} jobs"
             )
-            g = generator.calculate(inputs)
-            return g.result_dict()
+        if not all("ags" in job and "year" in job for job in jobs):
+            return jsonrpcserver.InvalidParams("Every job needs an ags and a year")
+        if not all(_valid_paths(job.get("paths")) for job in jobs):
+            return jsonrpcserver.InvalidParams("paths must be a list of glob patterns")
+        return jsonrpcserver.Success(
+            [
+                self.do_calculate(
+                    job["ags"],
+                    job["year"],
+                    job.get("overrides", {}),
+                    False,
+                    job.get("paths"),
+                )
+                for job in jobs
+            ]
+        )
 
-        result = with_tracing(enabled=trace, f=calculate)
-        return jsonrpcserver.Success(result)
+    def trace(
+        self,
+        ags: str,
+        year: int,
+        overrides: dict[str, int | float | str],
+        paths: list[str],
+    ) -> jsonrpcserver.Result:
+        """The values and traces of the given paths of the result (e.g.
+        "e30.p_local_pv_roof.energy"), without tracing the whole calculation."""
+        key = self.results.key(self.rd, self._entries(ags, year, overrides))
+        with self._lock:
+            cached = self.traced.get(key, []) if key is not None else []
+            if key is not None:
+                self.traced[key] = cached
+                self.traced.move_to_end(key)
+                while len(self.traced) > MAX_TRACED:
+                    self.traced.popitem(last=False)
+
+        def traced_result(sector: str) -> TracedResult:
+            with self._lock:
+                for t in cached:
+                    if sector in t.sectors():
+                        return t
+                missing = {sector_of(p) for p in paths}
+                for t in cached:
+                    missing -= t.sectors()
+            t = trace_sectors(lambda: self._inputs(ags, year, overrides), missing)
+            with self._lock:
+                cached.append(t)
+            return t
+
+        try:
+            return jsonrpcserver.Success(
+                {p: traced_result(sector_of(p)).lookup(p) for p in paths}
+            )
+        except KeyError:
+            return jsonrpcserver.InvalidParams("Unknown path")
 
     def get_overridables(self, ags: str, year: int) -> jsonrpcserver.Result:
         return jsonrpcserver.Success(
@@ -70,4 +263,6 @@ class GeneratorRpcs:
             "get-overridables": self.get_overridables,
             "list-ags": self.list_ags,
             "calculate": self.calculate,
+            "calculate-batch": self.calculate_batch,
+            "trace": self.trace,
         }
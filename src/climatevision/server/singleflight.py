@@ -0,0 +1,61 @@
+# pyright: strict
+"""Module singleflight -- let concurrent identical requests share one computation."""
+
+from threading import Event, Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    def __init__(self):
+        self.done = Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """Calls f only once for all callers of do that ask for the same key at the same
+    time. They all get the result of that call (or its exception).
+
+    Nothing is kept once the call is done, caching results is up to the caller.
+    Safe to use from several threads.
+    """
+
+    def __init__(self):
+        self._flights: dict[Hashable, _Flight[T]] = {}
+        self._lock = Lock()
+        # The number of calls of do that waited for the call of another one
+        self.shared = 0
+
+    def do(self, key: Hashable, f: Callable[[], T]) -> T:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+            else:
+                flight.waiters += 1
+                self.shared += 1
+        if leader:
+            try:
+                flight.result = f()
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+        else:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+        return flight.result  # type: ignore (set by the leader)
+
+    def waiting(self, key: Hashable) -> int:
+        """The number of callers that currently wait for the call for key."""
+        with self._lock:
+            flight = self._flights.get(key)
+            return flight.waiters if flight is not None else 0
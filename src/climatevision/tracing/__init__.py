@@ -4,6 +4,18 @@
 calculation is done. Used by the explorer. Not used by the Klimavision website.
 """
 
-from .monkeypatch import with_tracing
+from .traced import TRACED, finalizing_default, with_tracing, with_unfinalized_tracing
+from .number import dag_traces, expand_traces
+from .paths import TracedResult, trace_paths, trace_sectors
 
-__all__ = ["with_tracing"]
+__all__ = [
+    "TRACED",
+    "with_tracing",
+    "with_unfinalized_tracing",
+    "finalizing_default",
+    "dag_traces",
+    "expand_traces",
+    "TracedResult",
+    "trace_paths",
+    "trace_sectors",
+]
@@ -5,7 +5,23 @@
 # For the generator core this leads to surprisingly good traces as
 # we largely do not use for loops or ifs to decide how to do the computation.
 # Or to say it differently all we really have is just a collection of formulas
-from typing import Literal, Union, Callable, TypedDict
+#
+# The trace of an operation refers to the traced numbers it was done with (instead of
+# their traces). Reading a field of a result dataclass gives the Definition of that field
+# (see traced.py). So once the calculation is done and we know where in the result every
+# field ended up, a trace can refer to the name of that place instead of repeating how
+# the field was computed (see set_names).
+#
+# Traces are hash consed: building a trace equal to one that was built before returns
+# the very same object. So every subexpression is stored only once, no matter how
+# often it is used, and the traces of a calculation form a DAG. See dag_traces for a
+# JSON representation that keeps it that way. Every traced run has a table of the
+# traces built so far of its own (see interning), outside of one traces are not shared.
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Generator, Literal, Union, Callable, TypedDict
+
+from ..generator.resultdict import result_dict_items
 
 
 # Traces will be returned as values that python's json module
@@ -16,7 +32,7 @@ TRACE = Union[
     "DataTrace",
     "FactOrAss",
     "NameTrace",
-    "DefTrace",
+    "TracedNumber",
     "BinaryTrace",
     "UnaryTrace",
 ]
@@ -43,11 +59,6 @@ class NameTrace(TypedDict):
     name: str
 
 
-class DefTrace(TypedDict):
-    def_name: NameTrace
-    trace: TRACE
-
-
 class BinaryTrace(TypedDict):
     binary: Literal["+", "-", "*", "/"]
     a: TRACE
@@ -60,60 +71,122 @@ class UnaryTrace(TypedDict):
     a: TRACE
 
 
+# The traces of the current traced run by _key of their parts. Holds on to the traces,
+# so that the ids in the keys stay valid.
+_interned: ContextVar[dict[object, TRACE] | None] = ContextVar("interned", default=None)
+
+
+@contextmanager
+def interning() -> Generator[None, None, None]:
+    """Share equal traces built (in this thread) until the end of the with block. Nested
+    blocks share the traces of the outermost one. Traces built after it are no longer
+    identical to them, even if they are equal."""
+    if _interned.get() is not None:
+        yield
+        return
+    token = _interned.set({})
+    try:
+        yield
+    finally:
+        _interned.reset(token)
+
+
+def _key(x: TRACE | str) -> object:
+    """Equal for equal traces (as all traces but numbers are interned)."""
+    if type(x) is float:
+        # Unlike the float, this tells 0.0 and -0.0 apart
+        return x.hex()
+    elif type(x) is int:
+        return (int, x)
+    elif type(x) is str:
+        return x
+    elif type(x) is TracedNumber:
+        # Finalized like its trace (unlike a Definition, which may get a name)
+        return _key(x.trace)
+    # Interned (or a definition)
+    return id(x)
+
+
+def _intern(key: object, make: Callable[[], Any]) -> Any:
+    interned = _interned.get()
+    if interned is None:
+        return make()
+    t = interned.get(key)
+    if t is None:
+        t = make()
+        interned[key] = t
+    return t
+
+
 def literal(v: int | float) -> TRACE:
     return v
 
 
 def data(source: str, key: str, attr: str, value: float | int) -> TRACE:
-    return {"source": source, "key": key, "attr": attr, "value": value}
+    return _intern(
+        ("data", source, _key(key), attr, _key(value)),
+        lambda: {"source": source, "key": key, "attr": attr, "value": value},
+    )
 
 
 def fact_or_ass(n: str, value: float | int) -> TRACE:
-    return {"fact_or_ass": n, "value": value}
+    return _intern(
+        ("fact_or_ass", n, _key(value)), lambda: {"fact_or_ass": n, "value": value}
+    )
 
 
-def _replace_name_defs_by_names(trace: TRACE) -> TRACE:
+def _finalize(trace: TRACE, memo: dict[int, TRACE]) -> TRACE:
+    """Replace the named definitions in trace by their name, and all other traced
+    numbers by their (finalized) trace.
+
+    memo maps the id of every trace finalized so far to the result, so that shared
+    traces stay shared (and are only finalized once).
+    """
     match trace:
+        case int() | float():
+            return trace
+        case _:
+            pass
+    known = memo.get(id(trace))
+    if known is not None:
+        return known
+    finalized: TRACE
+    match trace:
+        case Definition(name=str(n)):
+            finalized = {"name": n}
+        case TracedNumber():
+            finalized = _finalize(trace.trace, memo)
         case {"binary": op, "a": a, "b": b, "value": v}:
-            return {
+            finalized = {
                 "binary": op,
-                "a": _replace_name_defs_by_names(a),
-                "b": _replace_name_defs_by_names(b),
+                "a": _finalize(a, memo),
+                "b": _finalize(b, memo),
                 "value": v,
             }
         case {"unary": op, "a": a}:
-            return {"unary": op, "a": _replace_name_defs_by_names(a)}
-        case int() | float():
-            return trace
-        case {"def_name": ({"name": n} as name), "trace": t}:
-            # Names we could not resolve we replace by their expression
-            if n.startswith("?"):
-                return _replace_name_defs_by_names(t)
-            else:
-                return name
-        case {"source": _, "key": _, "attr": _, "value": _}:
-            return trace
-        case {"fact_or_ass": _, "value": _}:
-            return trace
+            finalized = {"unary": op, "a": _finalize(a, memo)}
         case _:
-            return trace
-
-
-def def_name(n: str, trace: TRACE) -> DefTrace:
-    return {"def_name": {"name": n}, "trace": trace}
+            finalized = trace
+    memo[id(trace)] = finalized
+    return finalized
 
 
 def binary(
     value: float | int, op: Literal["+", "-", "*", "/"], a: TRACE, b: TRACE
 ) -> TRACE:
-    return {"binary": op, "a": a, "b": b, "value": value}
+    return _intern(
+        (op, _key(a), _key(b), _key(value)),
+        lambda: {"binary": op, "a": a, "b": b, "value": value},
+    )
 
 
 def unary(op: Literal["+", "-"], a: TRACE) -> TRACE:
-    return {"unary": op, "a": a}
+    return _intern(("unary", op, _key(a)), lambda: {"unary": op, "a": a})
 
 
 class TracedNumber:
+    __slots__ = ("value", "trace")
+
     trace: TRACE
     value: float | int
 
@@ -151,11 +224,24 @@ class TracedNumber:
         other: Union["TracedNumber", float, int],
         f: Callable[[int | float, int | float], int | float],
     ) -> "TracedNumber":
-        other = self.lift(other)
-        value = f(self.value, other.value)
+        if isinstance(other, TracedNumber):
+            value = f(self.value, other.value)
+            b = other
+        else:
+            value = f(self.value, other)
+            b = literal(other)
+        return TracedNumber(value, trace=binary(value=value, op=op, a=self, b=b))
+
+    def rbinop(
+        self,
+        op: Literal["+", "-", "*", "/"],
+        other: float | int,
+        f: Callable[[int | float, int | float], int | float],
+    ) -> "TracedNumber":
+        """other op self (for a number other that is not traced)."""
+        value = f(other, self.value)
         return TracedNumber(
-            value,
-            trace=binary(value=value, op=op, a=self.trace, b=other.trace),
+            value, trace=binary(value=value, op=op, a=literal(other), b=self)
         )
 
     def is_integer(self) -> bool:
@@ -170,26 +256,26 @@ class TracedNumber:
     def __add__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
         return self.binop("+", other, lambda a, b: a + b)
 
-    def __radd__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
-        return self.lift(other) + self
+    def __radd__(self, other: float | int) -> "TracedNumber":
+        return self.rbinop("+", other, lambda a, b: a + b)
 
     def __sub__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
         return self.binop("-", other, lambda a, b: a - b)
 
-    def __rsub__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
-        return self.lift(other) - self
+    def __rsub__(self, other: float | int) -> "TracedNumber":
+        return self.rbinop("-", other, lambda a, b: a - b)
 
     def __mul__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
         return self.binop("*", other, lambda a, b: a * b)
 
-    def __rmul__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
-        return self.lift(other) * self
+    def __rmul__(self, other: float | int) -> "TracedNumber":
+        return self.rbinop("*", other, lambda a, b: a * b)
 
     def __truediv__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
         return self.binop("/", other, lambda a, b: a / b)
 
-    def __rtruediv__(self, other: Union["TracedNumber", float, int]) -> "TracedNumber":
-        return self.lift(other) / self
+    def __rtruediv__(self, other: float | int) -> "TracedNumber":
+        return self.rbinop("/", other, lambda a, b: a / b)
 
     def __gt__(self, other: Union["TracedNumber", float, int]) -> bool:
         if isinstance(other, self.__class__):
@@ -224,8 +310,41 @@ class TracedNumber:
     def __str__(self) -> str:
         return f"{self.value} : {self.trace}"
 
+    def __repr__(self) -> str:
+        # How this number appears in the traces of others
+        return repr(self.trace)
+
     def __neg__(self) -> "TracedNumber":
-        return self.__class__(-self.value, trace=unary("-", self.trace))
+        return TracedNumber(-self.value, trace=unary("-", self))
+
+
+class Definition(TracedNumber):
+    """The value of a field of a result dataclass, as read from there (see traced.py).
+    The trace is the value that was stored in the field."""
+
+    __slots__ = ("name",)
+
+    # The path to the field in the result (see set_names)
+    name: str | None
+
+    def __init__(self, stored: Union[TracedNumber, float, int]):
+        if isinstance(stored, TracedNumber):
+            super().__init__(stored.value, stored)
+        else:
+            super().__init__(stored, literal(stored))
+        self.name = None
+
+    def __repr__(self) -> str:
+        return repr(self.trace) if self.name is None else repr({"name": self.name})
+
+
+def _definition(tn: TracedNumber) -> Definition | None:
+    """The definition tn is, or was read as (see traced.py)."""
+    if isinstance(tn, Definition):
+        return tn
+    if isinstance(tn.trace, Definition):
+        return tn.trace
+    return None
 
 
 RESULT_DICTIONARY = dict[
@@ -237,71 +356,143 @@ JSON_RESULT_DICTIONARY = dict[
 ]
 
 
-def set_names(r: RESULT_DICTIONARY, path: list[str] = []) -> None:
-    """For all name definitions at the toplevel of a tracednumber, set their name to
-    the path to that traced number in the tree.  Unless the name is already set.
-    This is done by side effect and relies on sharing for the proper effect.
-    """
+def set_names(r: object, path: list[str] = []) -> None:
+    """Name every definition in r after its path in r (e.g. r18.p.energy), unless it
+    already has a name (because the same field is also found at an earlier path).
 
-    def helper(
-        path: list[str],
-        node: Union[int, float, None, "TracedNumber", "RESULT_DICTIONARY"],
-    ) -> None:
-        match node:
+    r is a result dict or a result dataclass (e.g. Result), which is not converted.
+    """
+    items = result_dict_items(r)
+    if items is None:
+        return
+    for k, v in items:
+        match v:
             case TracedNumber():
-                match node.trace:
-                    case {"def_name": ({"name": str(n)} as name), "trace": _}:
-                        if n.startswith("?"):
-                            name["name"] = ".".join(path)
-                    case _:
-                        pass
-            case int() | float() | None:
-                pass
-            case dict():
-                return set_names(node, path)
-
-    for k, v in r.items():
-        helper(path + [k], v)
+                d = _definition(v)
+                if d is not None and d.name is None:
+                    d.name = ".".join(path + [k])
+            case _:
+                set_names(v, path + [k])
 
 
 def finalize_traces_in_result(r: RESULT_DICTIONARY, path: list[str] = []) -> None:
     """Finalize the traces.  This does several things:
-    1. We set the names in name definitions for things reachable by following the result tree. (e.g. r18.r.CO2e_combustion_based)
-    2. We replace all traced numbers by a TracedValue
-    3. We replace the toplevel name definitions by their trace
-    4. We replace all other name definitions by either
-        4.1 their name if the name was resolved in 1
-        4.2 the trace if it wasn't (this can for example happen for intermediate result dictionaries like
-            the sum of several Transport).
+    1. We name all traced numbers reachable by following the result tree (see
+       set_names).
+    2. We replace all traced numbers by a ValueWithTrace (see value_with_trace).
     """
     set_names(r)
+    memo: dict[int, TRACE] = {}
 
-    def replace_definitions(r: JSON_RESULT_DICTIONARY, path: list[str] = []) -> None:
+    def replace(r: JSON_RESULT_DICTIONARY, path: list[str] = []) -> None:
         for k, v in r.items():
             match v:
                 case TracedNumber() as tn:
-                    match tn.trace:
-                        case {"def_name": _, "trace": t}:
-                            r[k] = {
-                                "value": tn.value,
-                                "trace": _replace_name_defs_by_names(t),
-                            }
-
-                        case _:
-                            r[k] = {
-                                "value": tn.value,
-                                "trace": _replace_name_defs_by_names(tn.trace),
-                            }
-                    assert not isinstance(r[k], TracedNumber)
+                    r[k] = value_with_trace(tn, memo)
                 case int() | float() | None:
                     pass
                 case {"value": _, "trace": _}:
                     pass
                 case dict():
-                    replace_definitions(v, path + [k])
+                    replace(v, path + [k])
                 case _:
 
                     # Already replaced
                     pass
 
-    replace_definitions(r)  # type: ignore (We are converting RESULT_DICTIONARY into JSON_RESULT_DICTIONARY in place here)
+    replace(r)  # type: ignore (We are converting RESULT_DICTIONARY into JSON_RESULT_DICTIONARY in place here)
+
+
+def value_with_trace(tn: TracedNumber, memo: dict[int, TRACE]) -> ValueWithTrace:
+    """The value of tn (which is stored in the result) and its trace, with all named
+    definitions in it replaced by their names and all other traced numbers by their
+    traces. If tn is a definition, that is how it was defined (and not its name). memo
+    is passed on to _finalize."""
+    d = _definition(tn)
+    trace = d.trace if d is not None else tn.trace
+    return {"value": tn.value, "trace": _finalize(trace, memo)}
+
+
+class TraceRef(TypedDict):
+    ref: int
+
+
+class DagTraces(TypedDict):
+    result: dict[str, Any]
+    traces: list[dict[str, Any]]
+
+
+def dag_traces(r: dict[str, Any]) -> DagTraces:
+    """Turn a finalized result into a JSON value that stores every trace only once.
+
+    Every trace (but numbers and names) is put into the list traces and replaced by a
+    reference {"ref": index} into that list, in the result as well as in the other
+    traces. A trace only refers to traces before it in the list. Use expand_traces
+    to get the result back with all references replaced by their trace.
+    """
+    traces: list[dict[str, Any]] = []
+    refs: dict[int, TraceRef] = {}
+
+    def ref(trace: Any) -> Any:
+        match trace:
+            case int() | float() | {"name": _}:
+                return trace
+            case _:
+                pass
+        r = refs.get(id(trace))
+        if r is None:
+            node = dict(trace)
+            for child in ("a", "b"):
+                if child in node:
+                    node[child] = ref(node[child])
+            traces.append(node)
+            r = refs[id(trace)] = {"ref": len(traces) - 1}
+        return r
+
+    def helper(r: dict[str, Any]) -> dict[str, Any]:
+        res: dict[str, Any] = {}
+        for k, v in r.items():
+            match v:
+                case {"value": value, "trace": trace}:
+                    res[k] = {"value": value, "trace": ref(trace)}
+                case dict():
+                    res[k] = helper(v)  # type: ignore (a nested result)
+                case _:
+                    res[k] = v
+        return res
+
+    result = helper(r)
+    return {"result": result, "traces": traces}
+
+
+def expand_traces(d: DagTraces) -> dict[str, Any]:
+    """The result of dag_traces as returned by finalize_traces_in_result."""
+    traces: list[Any] = []
+
+    def expand(trace: Any) -> Any:
+        match trace:
+            case {"ref": int(i)}:
+                return traces[i]
+            case _:
+                return trace
+
+    for node in d["traces"]:
+        node = dict(node)
+        for child in ("a", "b"):
+            if child in node:
+                node[child] = expand(node[child])
+        traces.append(node)
+
+    def helper(r: dict[str, Any]) -> dict[str, Any]:
+        res: dict[str, Any] = {}
+        for k, v in r.items():
+            match v:
+                case {"value": value, "trace": trace}:
+                    res[k] = {"value": value, "trace": expand(trace)}
+                case dict():
+                    res[k] = helper(v)  # type: ignore (a nested result)
+                case _:
+                    res[k] = v
+        return res
+
+    return helper(d["result"])
@@ -0,0 +1,100 @@
+# pyright: strict
+
+"""Traces of single values of the result, e.g. "e30.p_local_pv_roof.energy".
+
+Finalizing all the traces of a result (see number.finalize_traces_in_result) takes about
+as long as the traced calculation itself, and most of the time only a few values are
+looked at. So a TracedResult only finalizes the traces that are looked up, and the
+calculation only runs the steps that the looked up sectors depend on.
+"""
+
+from dataclasses import fields
+from typing import Any, Callable, Iterable, cast
+
+from ..generator import Inputs, Result, projected_result_dict
+from ..generator.generator import SCHEDULE
+from ..generator.resultdict import dataclass_to_result_dict
+from .traced import with_unfinalized_tracing
+from .number import TRACE, TracedNumber, set_names, value_with_trace
+
+
+class TracedResult:
+    """The result dict of a traced calculation (or of some of its sectors), whose
+    traces are finalized when they are looked up."""
+
+    def __init__(self, r: dict[str, Any]):
+        set_names(r)
+        self._r = r
+        # Shared by all lookups, so that every trace is only finalized once
+        self._memo: dict[int, TRACE] = {}
+
+    def sectors(self) -> set[str]:
+        return set(self._r)
+
+    def lookup(self, path: str) -> Any:
+        """The value (with its trace) or the dict of values at path.
+
+        Raises KeyError if there is no such path.
+        """
+        v: Any = self._r
+        for k in path.split("."):
+            if not isinstance(v, dict):
+                raise KeyError(path)
+            v = cast(dict[str, Any], v)[k]
+        return self._finalized(v)
+
+    def projected(self, paths: list[str]) -> dict[str, Any]:
+        """The values (with their traces) whose path matches one of the glob patterns
+        in paths (see generator.projected_result_dict)."""
+        return self._finalized(projected_result_dict(self._r, paths))
+
+    def _finalized(self, v: Any) -> Any:
+        match v:
+            case TracedNumber():
+                return value_with_trace(v, self._memo)
+            case dict():
+                return {k: self._finalized(x) for k, x in v.items()}  # type: ignore
+            case _:
+                return v
+
+
+def sector_of(path: str) -> str:
+    return path.split(".", maxsplit=1)[0]
+
+
+def trace_sectors(inputs: Callable[[], Inputs], sectors: Iterable[str]) -> TracedResult:
+    """Calculate the given sectors (fields of Result) with tracing enabled, running only
+    the steps they depend on. The TracedResult contains those sectors and all sectors
+    they depend on (so that the names in the traces are the same as in a complete
+    traced calculation).
+
+    inputs is called with tracing enabled as well, so that the traces of the entries
+    lead back to the reference data they were made from.
+
+    Raises KeyError for unknown sectors.
+    """
+    sectors = set(sectors)
+    known = {f.name for f in fields(Result)}
+    for s in sectors:
+        if s not in known:
+            raise KeyError(s)
+    schedule = SCHEDULE.cone(sectors)
+
+    def calculate() -> dict[str, Any]:
+        results = schedule.run(inputs())
+        # In the order of the fields of Result, like Result.result_dict
+        return {
+            f.name: dataclass_to_result_dict(results[f.name])
+            for f in fields(Result)
+            if f.name in results
+        }
+
+    return TracedResult(with_unfinalized_tracing(calculate))
+
+
+def trace_paths(inputs: Callable[[], Inputs], paths: Iterable[str]) -> dict[str, Any]:
+    """The values (with their traces) at the given paths (see trace_sectors). Raises
+    KeyError for unknown paths."""
+    paths = list(paths)
+    traced = trace_sectors(inputs, {sector_of(p) for p in paths})
+    return {p: traced.lookup(p) for p in paths}
@@ -0,0 +1,187 @@
+# pyright: strict
+
+"""Tracing without changing the generator: the calculation is done with traced numbers
+(see generator.numeric), which record how they were computed.
+
+The result dataclasses are instantiated as subclasses whose fields are read as
+definitions (see number.Definition): the same one for every read of a field, so that
+the traces of the numbers computed from it can refer to it by name.
+"""
+
+from copy import deepcopy
+from dataclasses import fields
+from contextlib import AbstractContextManager
+from typing import Any, Callable, TypeVar
+
+from ..generator.numeric import Numeric, using
+from ..generator.refdata import FactsAndAssumptions
+from . import number
+
+
+class TracedFactsAndAssumptions(FactsAndAssumptions):
+    """Returns every fact and assumption as a traced number."""
+
+    def __init__(self, facts_and_assumptions: FactsAndAssumptions):
+        # Share the parsed values instead of parsing them again
+        self.__dict__.update(facts_and_assumptions.__dict__)
+
+    def fact(self, keyname: str) -> float:
+        return number.TracedNumber.fact_or_ass(keyname, super().fact(keyname))  # type: ignore (traced numbers can be used instead of floats)
+
+    def ass(self, keyname: str) -> float:
+        return number.TracedNumber.fact_or_ass(keyname, super().ass(keyname))  # type: ignore
+
+
+# The definitions of the fields read so far (with the value read), by the id of the
+# instance of a traced class. The traced classes have no room for them, as they must
+# have the same layout as the result dataclasses (see numeric._choosing_init).
+_definitions: dict[int, dict[str, tuple[object, number.Definition]]] = {}
+
+
+def _traced_getattribute(self: Any, name: str) -> Any:
+    value = object.__getattribute__(self, name)
+    if not isinstance(value, (float, int, number.TracedNumber)):
+        return value
+    definitions = _definitions.get(id(self))
+    if definitions is None:
+        definitions = _definitions.setdefault(id(self), {})
+    known = definitions.get(name)
+    if known is None:
+        definition = number.Definition(value)
+        definitions[name] = (value, definition)
+        return definition
+    stored, definition = known
+    if value is stored:
+        return definition
+    # The field was assigned to after it was read. The traces keep referring to what
+    # was read first.
+    return number.TracedNumber(number.TracedNumber.lift(value).value, definition)
+
+
+def _traced_del(self: Any, forget: Callable[..., object] = _definitions.pop) -> None:
+    forget(id(self), None)
+
+
+def _traced_deepcopy(self: object, memo: dict[int, Any]) -> object:
+    """Also copy the definitions read so far. The traced numbers in the fields are
+    shared (they never change), so the copy hands out the definitions other results
+    already refer to (e.g. when the scheduler copies a known result before updating
+    it)."""
+    cls = type(self)
+    copied = object.__new__(cls)
+    memo[id(self)] = copied
+    try:
+        names = list(object.__getattribute__(self, "__dict__"))
+    except AttributeError:
+        names = [f.name for f in fields(cls)]  # type: ignore (a result dataclass)
+    for name in names:
+        try:
+            value = object.__getattribute__(self, name)
+        except AttributeError:
+            continue
+        if not isinstance(value, number.TracedNumber):
+            value = deepcopy(value, memo)
+        object.__setattr__(copied, name, value)
+    definitions = _definitions.get(id(self))
+    if definitions is not None:
+        _definitions[id(copied)] = dict(definitions)
+    return copied
+
+
+# The subclasses of the result dataclasses, by result dataclass
+_traced_classes: dict[type, type] = {}
+
+
+def _traced_class(cls: type) -> type:
+    traced = _traced_classes.get(cls)
+    if traced is None:
+        created = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__slots__": (),
+                "__getattribute__": _traced_getattribute,
+                "__del__": _traced_del,
+                "__deepcopy__": _traced_deepcopy,
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+            },
+        )
+        # Two threads may get here at the same time, but only one class is used
+        traced = _traced_classes.setdefault(cls, created)
+        # So that instances of traced classes (e.g. copies) stay traced
+        _traced_classes[traced] = traced
+    return traced
+
+
+class Traced(Numeric):
+    """Traced numbers (see number.TracedNumber)."""
+
+    chooses_classes = True
+
+    def data(self, value: float, dataset: str, key: object, attr: str) -> float:
+        # make facts and assumptions prettier
+        if dataset in ["facts", "assumptions"] and attr == "value":
+            return number.TracedNumber.fact_or_ass(str(key), value)  # type: ignore
+        return number.TracedNumber.data(value, dataset, key, attr)  # type: ignore
+
+    def fact_or_ass(self, keyname: str, value: float) -> float:
+        return number.TracedNumber.fact_or_ass(keyname, value)  # type: ignore
+
+    def facts_and_assumptions(
+        self, facts_and_assumptions: FactsAndAssumptions
+    ) -> FactsAndAssumptions:
+        return TracedFactsAndAssumptions(facts_and_assumptions)
+
+    def result_class(self, cls: type) -> type:
+        return _traced_class(cls)
+
+    def scope(self) -> AbstractContextManager[None]:
+        # Equal traces are shared within the outermost traced run
+        return number.interning()
+
+
+TRACED = Traced()
+
+T = TypeVar("T")
+
+
+def with_unfinalized_tracing(f: Callable[[], T]) -> T:
+    """Run f with tracing enabled (in this thread), so that the entries made and the
+    inputs created in f are traced. The traces in the result of f are left as they are
+    (see tracing.paths)."""
+    with using(TRACED):
+        return f()
+
+
+def with_tracing_enabled(f: Callable[[], T]) -> T:
+    """Enable tracing and run f.  f should return a json ready object, that is
+    the return value of Result.result_dict, or asdict(entries)
+    """
+    result = with_unfinalized_tracing(f)
+    number.finalize_traces_in_result(result)  # type: ignore
+    return result
+
+
+def finalizing_default(result: object) -> Callable[[object], object]:
+    """Name the definitions in result (see number.set_names), which is a result dict or
+    a result dataclass with traces that are not finalized yet (see
+    with_unfinalized_tracing). Returns the default for generator.write_result_json that
+    writes every traced number in it as its value and finalized trace, like
+    finalize_traces_in_result does, but one at a time as they are written."""
+    number.set_names(result)
+    memo: dict[int, number.TRACE] = {}
+
+    def default(v: object) -> object:
+        if isinstance(v, number.TracedNumber):
+            return number.value_with_trace(v, memo)
+        raise TypeError(f"Object of type {type(v).__name__} is not JSON serializable")
+
+    return default
+
+
+def with_tracing(enabled: bool, f: Callable[[], T]) -> T:
+    if enabled:
+        return with_tracing_enabled(f)
+    else:
+        return f()
@@ -1,9 +1,22 @@
 # pyright: strict
 
+from pathlib import Path
 from typing import Any
+import json
 import os
 
+import pytest
+
+from climatevision.generator import (
+    Inputs,
+    RefData,
+    calculate,
+    calculate_with_default_inputs,
+    make_entries,
+)
+from climatevision.tracing import with_tracing
 from devtool import Devtool
+import commands.cmd_test_end_to_end
 
 filePath = "test.txt"
 
@@ -35,6 +48,30 @@ def test_cmd_run_with_parameters():
         assert False, "file " + filePath + " was not created"
 
 
+def test_cmd_run_compact_writes_the_same_json():
+    outputs: list[Any] = []
+    for args in [["run"], ["run", "-compact"]]:
+        if os.path.exists(filePath):
+            assert False, "file " + filePath + " already exists"
+        check_cmd(args + ["-o", filePath], "run", True)
+        with open(filePath) as fp:
+            outputs.append(json.load(fp))
+        os.remove(filePath)
+    assert outputs[0] == outputs[1]
+
+
+def test_cmd_run_trace_writes_the_traced_result_dict(tmp_path: Path):
+    fname = tmp_path / "traced.json"
+    check_cmd(["run", "-trace", "-o", str(fname)], "run", True)
+    with open(fname) as fp:
+        written = fp.read()
+    expected = with_tracing(
+        enabled=True,
+        f=lambda: calculate_with_default_inputs("03159016", 2035).result_dict(),
+    )
+    assert written == json.dumps(expected, indent=4)
+
+
 def test_cmd_make_entries_with_defaults():
     check_cmd(["make"], "make", True)
 
@@ -63,6 +100,13 @@ def test_cmd_explorer():
     )
 
 
+def test_cmd_explorer_with_parameters():
+    args = Devtool().parse_args(["explorer", "-cache-dir", "cache", "-workers", "2"])
+    assert args.subcmd == "explorer"
+    assert args.cache_dir == "cache"
+    assert args.workers == 2
+
+
 def test_cmd_ready_to_rock():
     check_cmd(
         ["ready_to_rock"],
@@ -111,6 +155,126 @@ def test_cmd_test_end_to_end_run_all_ags():
     )
 
 
+def test_cmd_test_end_to_end_run_all_ags_with_parameters():
+    args = Devtool().parse_args(
+        ["test_end_to_end", "run_all_ags", "-jobs", "4", "-resume"]
+        + ["-results", "results.jsonl", "-ags", "03159016", "08111000"]
+    )
+    assert args.subcmd == "run_all_ags"
+    assert args.jobs == 4
+    assert args.resume
+    assert args.results == "results.jsonl"
+    assert args.ags == ["03159016", "08111000"]
+
+
+@pytest.fixture
+def run_all_ags_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Let run_all_ags write its progress and errors into tmp_path."""
+    for name in ["PROGRESS_FILE", "ERRORS_FILE"]:
+        fname = getattr(commands.cmd_test_end_to_end, name)
+        monkeypatch.setattr(commands.cmd_test_end_to_end, name, str(tmp_path / fname))
+    return tmp_path
+
+
+def some_ags(count: int) -> list[str]:
+    return list(RefData.cached().ags_master())[:count]
+
+
+def run_all_ags(*args: str):
+    check_cmd(["test_end_to_end", "run_all_ags", *args], "run_all_ags", True)
+
+
+def read_results(fname: Path) -> list[dict[str, Any]]:
+    with open(fname) as fp:
+        return [json.loads(line) for line in fp]
+
+
+def read_progress(tmp_path: Path) -> list[list[str]]:
+    with open(tmp_path / commands.cmd_test_end_to_end.PROGRESS_FILE) as fp:
+        return [line.split() for line in fp]
+
+
+def test_cmd_test_end_to_end_run_all_ags_on_a_pool(run_all_ags_files: Path):
+    results = run_all_ags_files / "results.jsonl"
+    ags_list = some_ags(5)
+
+    run_all_ags("-jobs", "2", "-results", str(results), "-ags", *ags_list)
+
+    refdata = RefData.cached()
+    by_ags = {r["ags"]: r for r in read_results(results)}
+    assert sorted(by_ags) == sorted(ags_list)
+    for ags in ags_list:
+        assert by_ags[ags]["year"] == 2035
+        expected = calculate(
+            Inputs(
+                facts_and_assumptions=refdata.facts_and_assumptions(),
+                entries=make_entries(refdata, ags, 2035),
+            )
+        ).result_dict()
+        # Compare as JSON, so that NaNs are equal
+        assert json.dumps(by_ags[ags]["result"]) == json.dumps(expected)
+
+
+def test_cmd_test_end_to_end_run_all_ags_resume_skips_the_ags_done(
+    run_all_ags_files: Path,
+):
+    results = run_all_ags_files / "results.jsonl"
+    ags_list = some_ags(4)
+
+    run_all_ags("-results", str(results), "-ags", *ags_list[:2])
+    run_all_ags("-resume", "-results", str(results), "-ags", *ags_list)
+
+    # The results of both runs are in the file, every AGS once
+    assert [r["ags"] for r in read_results(results)] == ags_list
+    assert read_progress(run_all_ags_files) == [[ags, "2035"] for ags in ags_list]
+
+    # Without -resume everything starts over
+    run_all_ags("-results", str(results), "-ags", *ags_list[:1])
+    assert [r["ags"] for r in read_results(results)] == ags_list[:1]
+
+
+def test_cmd_test_end_to_end_run_all_ags_resume_retries_the_ags_that_failed(
+    run_all_ags_files: Path, monkeypatch: pytest.MonkeyPatch
+):
+    results = run_all_ags_files / "results.jsonl"
+    ags_list = some_ags(3)
+
+    def failing_calculate(inputs: Inputs):
+        if inputs.entries.m_AGS_com == ags_list[1]:
+            raise ValueError("failed on purpose")
+        return calculate(inputs)
+
+    with monkeypatch.context() as m:
+        m.setattr(commands.cmd_test_end_to_end, "calculate", failing_calculate)
+        run_all_ags("-results", str(results), "-ags", *ags_list)
+    assert read_progress(run_all_ags_files) == [
+        [ags_list[0], "2035"],
+        [ags_list[2], "2035"],
+    ]
+
+    run_all_ags("-resume", "-results", str(results), "-ags", *ags_list)
+    assert [r["ags"] for r in read_results(results)] == [
+        ags_list[0],
+        ags_list[2],
+        ags_list[1],
+    ]
+
+
+def test_cmd_test_end_to_end_run_all_ags_resume_only_skips_the_same_year(
+    run_all_ags_files: Path,
+):
+    results = run_all_ags_files / "results.jsonl"
+    ags_list = some_ags(2)
+
+    run_all_ags("-results", str(results), "-ags", *ags_list)
+    run_all_ags("-year", "2040", "-resume", "-results", str(results), "-ags", *ags_list)
+    run_all_ags("-year", "2040", "-resume", "-results", str(results), "-ags", *ags_list)
+
+    assert [(r["ags"], r["year"]) for r in read_results(results)] == [
+        (ags, year) for year in [2035, 2040] for ags in ags_list
+    ]
+
+
 def test_cmd_test_end_to_end_update_expectations():
     check_cmd(
         ["test_end_to_end", "update_expectations"],
@@ -126,3 +290,21 @@ def test_cmd_test_end_to_end_create_expectations_with_defaults():
         "create_expectation",
         False,  # Same rationale as above
     )
+
+
+def test_cmd_bench():
+    if os.path.exists(filePath):
+        assert False, "file " + filePath + " already exists"
+
+    # On a small synthetic data set, and only a few quick benchmarks
+    check_cmd(
+        ["bench", "-communes", "20", "-filter", "make_entries", "-repeat", "3"]
+        + ["-o", filePath],
+        "bench",
+        True,
+    )
+
+    with open(filePath) as fp:
+        benchmarks = json.load(fp)["benchmarks"]
+    os.remove(filePath)
+    assert set(benchmarks) == {"make_entries/goettingen", "make_entries/germany"}
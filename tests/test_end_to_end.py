@@ -109,7 +109,7 @@ def end_to_end(datadir_status: refdatatools.DataDirStatus, ags: Any, year: int =
 
 
 def make_entries_test(ags: Any, year: int):
-    refdata = RefData.load()
+    refdata = RefData.cached()
     root = refdatatools.root_of_this_repo()
     fname = f"entries_{ags}_{year}.json"
     with open(os.path.join(root, "tests", "end_to_end_expected", fname)) as fp:
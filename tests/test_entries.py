@@ -1,11 +1,104 @@
 # pyright: strict
 
-from climatevision.generator import RefData
+from dataclasses import asdict
+from pathlib import Path
+from typing import Callable
+import csv
+
+import pytest
+
+from climatevision.generator import (
+    RefData,
+    make_entries,
+    make_entries_batch,
+    synthdata,
+)
+from climatevision.generator.refdata import DATASETS, RowNotFound
 from climatevision.server import overridables
+from climatevision.tracing import with_tracing
 
 
 def test_sections_with_defaults():
     """This tests that calling populate_defaults does not raise an exception. We particularly
     want to protect against a incorrect name of a overridable field."""
-    refdata = RefData.load()
+    refdata = RefData.cached()
     overridables.sections_with_defaults(refdata, "08416041", 2035)
+
+
+def test_make_entries_batch_is_identical_to_make_entries():
+    refdata = RefData.cached()
+    # A commune, an administrative district, a federal state, germany and one that does not exist
+    all_ags = ["03159016", "08416041", "08416000", "08000000", "DG000000", "99999999"]
+    years = [2035, 2050]
+    batch = make_entries_batch(refdata, all_ags, years)
+    for ags in all_ags:
+        for year in years:
+            try:
+                expected = make_entries(refdata, ags, year)
+            except Exception as e:
+                with pytest.raises(type(e)):
+                    batch.entries(ags, year)
+                continue
+            assert batch.entries(ags, year) == expected
+
+
+def _edit_csv(datadir: str, dataset: str, edit: Callable[[list[list[str]]], None]):
+    fname = DATASETS[dataset].path(datadir)
+    with open(fname, newline="") as fp:
+        rows = list(csv.reader(fp))
+    edit(rows)
+    with open(fname, "w", newline="") as fp:
+        csv.writer(fp).writerows(rows)
+
+
+def test_make_entries_batch_raises_what_make_entries_raises(tmp_path: Path):
+    datadir = str(tmp_path / "data")
+    synthdata.write(datadir, communes=30)
+    refdata = RefData.load(datadir, use_snapshot=False)
+    communes = [a for a in refdata.ags_master() if not a.endswith("000")]
+    no_flats = communes[0]
+    # So that every commune of that state divides by zero
+    no_agri_state = communes[-1][:2] + "000000"
+
+    def remove_flats(rows: list[list[str]]):
+        rows[:] = [r for r in rows if r[0] != no_flats]
+
+    def remove_agri(rows: list[list[str]]):
+        veg_agri = rows[0].index("veg_agri")
+        for r in rows:
+            if r[0] == no_agri_state:
+                r[veg_agri] = "0"
+
+    _edit_csv(datadir, "flats", remove_flats)
+    _edit_csv(datadir, "area", remove_agri)
+    refdata = RefData.load(datadir, use_snapshot=False)
+
+    all_ags = list(refdata.ags_master())
+    batch = make_entries_batch(refdata, all_ags, [2035])
+    raised: set[type] = set()
+    for ags in all_ags:
+        try:
+            expected = make_entries(refdata, ags, 2035)
+        except (RowNotFound, ZeroDivisionError) as e:
+            raised.add(type(e))
+            with pytest.raises(type(e)):
+                batch.entries(ags, 2035)
+            continue
+        assert batch.entries(ags, 2035) == expected
+    assert raised == {RowNotFound, ZeroDivisionError}
+
+
+def test_make_entries_batch_traces_like_make_entries():
+    refdata = RefData.cached()
+    traced = with_tracing(
+        enabled=True,
+        f=lambda: asdict(
+            make_entries_batch(refdata, ["03159016", "08111000"], [2035]).entries(
+                "03159016", 2035
+            )
+        ),
+    )
+    expected = with_tracing(
+        enabled=True, f=lambda: asdict(make_entries(refdata, "03159016", 2035))
+    )
+    assert traced == expected
@@ -0,0 +1,191 @@
+# pyright: strict
+
+from http.client import HTTPConnection
+from threading import Event, Thread
+from typing import Any
+import json
+import os
+import signal
+
+import jsonrpcserver
+
+from climatevision.generator import RefData
+from climatevision.server import GeneratorRpcs
+from climatevision.server.httpserver import GeneratorHttpServer, StaticFile
+
+
+class SlowRpcs(GeneratorRpcs):
+    def __init__(self):
+        super().__init__(RefData.cached())
+        self.started = Event()
+        self.proceed = Event()
+
+    def slow(self) -> jsonrpcserver.Result:
+        self.started.set()
+        self.proceed.wait()
+        return jsonrpcserver.Success("done")
+
+    def methods(self) -> Any:
+        return {**super().methods(), "slow": self.slow}
+
+
+class PidRpcs(GeneratorRpcs):
+    """Tells which worker process answered."""
+
+    def __init__(self):
+        super().__init__(RefData.cached())
+
+    def pid(self, ags: str, year: int) -> jsonrpcserver.Result:
+        return jsonrpcserver.Success(os.getpid())
+
+    def methods(self) -> Any:
+        return {**super().methods(), "pid": self.pid}
+
+
+def start() -> tuple[GeneratorHttpServer, SlowRpcs, Thread]:
+    server = GeneratorHttpServer(
+        ("localhost", 0),
+        SlowRpcs,
+        workers=0,
+        static={"/": StaticFile("<html></html>", "text/html")},
+    )
+    thread = Thread(target=server.serve_forever)
+    thread.start()
+    assert isinstance(server.rpcs, SlowRpcs)
+    return server, server.rpcs, thread
+
+
+def call(conn: HTTPConnection, method: str, params: dict[str, Any]) -> Any:
+    body = json.dumps({"jsonrpc": "2.0", "method": method, "params": params, "id": 1})
+    conn.request("POST", "/localzero/api/v0/", body)
+    response = conn.getresponse()
+    assert response.status == 200
+    return json.loads(response.read())["result"]
+
+
+def test_connections_are_kept_alive():
+    server, _, thread = start()
+    try:
+        conn = HTTPConnection("localhost", server.server_address[1])
+        assert call(conn, "list-ags", {})
+        sock = conn.sock
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        assert response.read() == b"<html></html>"
+        assert call(conn, "list-ags", {})
+        assert conn.sock is sock
+        conn.close()
+    finally:
+        server.graceful_shutdown()
+        thread.join()
+
+
+def test_shutdown_answers_the_requests_in_progress():
+    server, rpcs, thread = start()
+    port = server.server_address[1]
+    results: list[Any] = []
+    slow = Thread(
+        target=lambda: results.append(
+            call(HTTPConnection("localhost", port), "slow", {})
+        )
+    )
+    slow.start()
+    assert rpcs.started.wait(timeout=10)
+    # Other requests are answered while the slow one is still running. And a
+    # connection that is kept alive but idle does not keep the server running.
+    idle = HTTPConnection("localhost", port)
+    assert call(idle, "list-ags", {})
+
+    shutdown = Thread(target=server.graceful_shutdown)
+    shutdown.start()
+    rpcs.proceed.set()
+    shutdown.join(timeout=10)
+    assert not shutdown.is_alive()
+    slow.join()
+    assert results == ["done"]
+    thread.join()
+
+
+def test_calculate_batch_streams_one_line_per_job():
+    server, _, thread = start()
+    try:
+        conn = HTTPConnection("localhost", server.server_address[1])
+        ags = [a["ags"] for a in call(conn, "list-ags", {})][:2]
+        jobs: list[dict[str, Any]] = [{"ags": a, "year": 2035} for a in ags]
+        jobs.append({"ags": ags[0]})
+        body = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "method": "calculate-batch",
+                "params": {"jobs": jobs},
+                "id": 1,
+            }
+        )
+        conn.request("POST", "/localzero/api/v0/", body)
+        response = conn.getresponse()
+        assert response.getheader("Transfer-Encoding") == "chunked"
+        lines = [json.loads(line) for line in response.read().splitlines()]
+        by_job = {line["id"]: line for line in lines}
+        assert sorted(by_job) == [0, 1, 2]
+        for i, a in enumerate(ags):
+            assert by_job[i]["result"] == call(
+                conn,
+                "calculate",
+                {"ags": a, "year": 2035, "overrides": {}, "trace": False},
+            )
+        assert by_job[2]["error"]["message"] == "Invalid params"
+        conn.close()
+    finally:
+        server.graceful_shutdown()
+        thread.join()
+
+
+def test_requests_for_the_same_ags_and_year_go_to_the_same_worker():
+    server = GeneratorHttpServer(("localhost", 0), PidRpcs, workers=2)
+    thread = Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        conn = HTTPConnection("localhost", server.server_address[1])
+        ags = [a["ags"] for a in call(conn, "list-ags", {})][:4]
+        about = [{"ags": a, "year": year} for a in ags for year in [2025, 2035]]
+        pids = [call(conn, "pid", params) for params in about]
+        assert [call(conn, "pid", params) for params in about] == pids
+        assert all(pid != os.getpid() for pid in pids)
+        result = call(conn, "calculate", {**about[0], "overrides": {}, "trace": False})
+        assert "r18" in result
+        conn.close()
+    finally:
+        server.graceful_shutdown()
+        thread.join()
+
+
+def test_a_worker_that_died_is_replaced():
+    server = GeneratorHttpServer(("localhost", 0), PidRpcs, workers=1)
+    thread = Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        conn = HTTPConnection("localhost", server.server_address[1])
+        about = {"ags": "03159016", "year": 2035}
+        pid = call(conn, "pid", about)
+        os.kill(pid, signal.SIGKILL)
+        new_pid = call(conn, "pid", about)
+        assert new_pid != pid
+        assert call(conn, "pid", about) == new_pid
+        conn.close()
+    finally:
+        server.graceful_shutdown()
+        thread.join()
+
+
+def test_malformed_content_length_is_a_bad_request():
+    server, _, thread = start()
+    try:
+        conn = HTTPConnection("localhost", server.server_address[1])
+        conn.putrequest("POST", "/localzero/api/v0/")
+        conn.putheader("Content-Length", "many")
+        conn.endheaders()
+        assert conn.getresponse().status == 400
+        conn.close()
+    finally:
+        server.graceful_shutdown()
+        thread.join()
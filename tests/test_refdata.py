@@ -8,9 +8,19 @@
    of the reference data module.
 """
 
+from pathlib import Path
+from typing import Any
+import os
+
 import pytest
 
-from climatevision.generator import RefData
+from climatevision.generator import RefData, refdatatools, synthdata
+from climatevision.generator.refdata import (
+    DATASETS,
+    DataFrame,
+    RowNotFound,
+    SnapshotKey,
+)
 
 FEDERAL_STATES = ["%02i000000" % i for i in range(1, 17)]
 
@@ -60,3 +70,113 @@ def test_co2path(refdata: RefData):
     p = refdata.co2path(2035)
     assert p.float("GHG_budget_2016_to_year") == pytest.approx(7923139996.0)
     assert p.float("nonCO2_budget_2016_to_year") == pytest.approx(1586688275)
+
+
+def test_snapshot_contains_same_data_as_csv_files():
+    """Loading twice makes sure that the second load is served from the snapshot."""
+    RefData.load()
+    from_snapshot = RefData.load()
+    from_csv = RefData.load(use_snapshot=False)
+    assert from_snapshot.ags_master() == from_csv.ags_master()
+    for ags in FEDERAL_STATES:
+        assert str(from_snapshot.traffic(ags)) == str(from_csv.traffic(ags))
+        assert str(from_snapshot.population(ags)) == str(from_csv.population(ags))
+    assert str(from_snapshot.co2path(2035)) == str(from_csv.co2path(2035))
+    assert from_snapshot.fact("Fact_M_CO2e_wo_lulucf_2015_vs_2018") == from_csv.fact(
+        "Fact_M_CO2e_wo_lulucf_2015_vs_2018"
+    )
+
+
+def test_snapshot_key_is_the_one_of_the_files_loaded(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    datadir = str(tmp_path / "data")
+    synthdata.write(datadir, communes=30)
+    RefData.load(datadir)
+    moved = str(tmp_path / "moved")
+    os.rename(datadir, moved)
+
+    def not_from_csv(*args: Any, **kwargs: Any) -> RefData:
+        assert False, "expected the snapshot to be used"
+
+    monkeypatch.setattr(RefData, "load_from_csv", not_from_csv)
+    rd = RefData.load(moved)
+    # The snapshot remembers where it was made from, but that is gone
+    assert rd._datadir == moved  # type: ignore
+    key = SnapshotKey.of_datadir(moved, fix_missing_entries=True)
+    assert key is not None and rd.snapshot_key() == key
+
+    # The key is not computed again, it belongs to the data that was loaded
+    csv_file = DATASETS["population"].path(moved)
+    st = os.stat(csv_file)
+    os.utime(csv_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert SnapshotKey.of_datadir(moved, fix_missing_entries=True) != key
+    assert rd.snapshot_key() == key
+
+
+def test_numeric_looking_str_columns_keep_their_value(refdata: RefData):
+    """rt7 only contains numbers, so it is stored as a float column, but it is accessed as a str."""
+    assert refdata.area_kinds("03159016").str("rt7") in [
+        "71",
+        "72",
+        "73",
+        "74",
+        "75",
+        "76",
+        "77",
+    ]
+    assert isinstance(refdata.population("03159016").int("total"), int)
+
+
+def test_float_columns_keep_the_values_as_written_in_the_csv_file(tmp_path: Path):
+    fname = tmp_path / "public" / "example" / "2018.csv"
+    fname.parent.mkdir(parents=True)
+    fname.write_text(
+        "ags,value\n" + "a,1624424700.0\n" + "b,007\n" + "c,1.50\n" + "d,\n" + "e,3\n"
+    )
+    df = DataFrame.load_ags(str(tmp_path), "example")
+    column = df.header["value"]
+    raw = {"a": "1624424700.0", "b": "007", "c": "1.50", "d": "", "e": "3"}
+
+    assert df.float_at(df.index_of("b"), column) == 7.0
+    assert df.to_dict() == {key: {"value": value} for key, value in raw.items()}
+
+    df.append_rows({"a": ["2.0"], "f": ["09"]})
+    df.append_rows({"b": [8.0]})
+    assert [df.get(key) for key in ["a", "b", "f"]] == [["2.0"], ["8"], ["09"]]
+    # Until a value that is not a number turns it into a str column
+    df.append_rows({"g": ["x"]})
+    assert df.get("c") == ["1.50"] and df.get("f") == ["09"]
+
+
+def test_lazy_load_contains_same_data_as_eager_load(refdata: RefData):
+    lazy = RefData.load(lazy=True)
+    assert lazy.fact("Fact_M_CO2e_wo_lulucf_2015_vs_2018") == refdata.fact(
+        "Fact_M_CO2e_wo_lulucf_2015_vs_2018"
+    )
+    for ags in FEDERAL_STATES:
+        # traffic and renewable_energy are only complete after the fixups
+        assert str(lazy.traffic(ags)) == str(refdata.traffic(ags))
+        assert str(lazy.renewable_energy(ags)) == str(refdata.renewable_energy(ags))
+    assert lazy.ags_master() == refdata.ags_master()
+
+
+def test_cached_is_shared_until_the_data_changes():
+    cached = RefData.cached()
+    assert RefData.cached() is cached
+    assert RefData.cached(fix_missing_entries=False) is not cached
+
+    fname = os.path.join(refdatatools.datadir(), "public", "co2path", "2018.csv")
+    st = os.stat(fname)
+    try:
+        os.utime(fname, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert RefData.cached() is not cached
+    finally:
+        os.utime(fname, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+
+def test_unknown_facts_and_assumptions_raise_row_not_found(refdata: RefData):
+    with pytest.raises(RowNotFound):
+        refdata.fact("Fact_does_not_exist")
+    with pytest.raises(RowNotFound):
+        refdata.ass("Ass_does_not_exist")
@@ -0,0 +1,88 @@
+# pyright: strict
+
+from dataclasses import replace
+from pathlib import Path
+import os
+
+import pytest
+
+from climatevision.generator import (
+    Inputs,
+    RefData,
+    ResultCache,
+    calculate,
+    make_entries,
+)
+from climatevision.generator.numeric import using
+from climatevision.tracing import TRACED
+
+
+def test_results_are_cached_in_memory():
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    cache = ResultCache()
+    first = cache.result_dict(refdata, entries)
+    assert cache.result_dict(refdata, entries) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    other = replace(entries, r_area_m2=2 * entries.r_area_m2)
+    inputs = Inputs(
+        facts_and_assumptions=refdata.facts_and_assumptions(), entries=other
+    )
+    assert cache.result_dict(refdata, other) == calculate(inputs).result_dict()
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_results_calculated_while_tracing_are_plain():
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    cache = ResultCache()
+    with using(TRACED):
+        traced = cache.result_dict(refdata, entries)
+    assert type(traced["r18"]["p"]["energy"]) is float
+    assert cache.result_dict(refdata, entries) is traced
+
+
+def test_results_are_cached_on_disk(tmp_path: Path):
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    first = ResultCache(directory=str(tmp_path)).result_dict(refdata, entries)
+
+    cache = ResultCache(directory=str(tmp_path))
+    assert cache.result_dict(refdata, entries) == first
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_disk_cache_is_bounded(tmp_path: Path):
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    cache = ResultCache(directory=str(tmp_path), max_disk_bytes=1)
+    cache.result_dict(refdata, entries)
+    assert os.listdir(tmp_path) == []
+
+
+def test_disk_cache_only_looks_at_the_directory_when_it_might_be_full(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    scans: list[str] = []
+    scandir = os.scandir
+
+    def counting_scandir(directory: str):
+        if directory == str(tmp_path):
+            scans.append(directory)
+        return scandir(directory)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    cache = ResultCache(directory=str(tmp_path))
+    for area in range(1, 4):
+        cache.result_dict(refdata, replace(entries, r_area_m2=area))
+    assert len(os.listdir(tmp_path)) == 3
+    assert len(scans) == 1
+
+    # The next file does not fit anymore
+    cache.max_disk_bytes = sum(f.stat().st_size for f in tmp_path.iterdir()) + 1
+    cache.result_dict(refdata, replace(entries, r_area_m2=4))
+    assert len(scans) == 2
+    assert len(os.listdir(tmp_path)) < 4
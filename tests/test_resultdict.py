@@ -0,0 +1,89 @@
+# pyright: strict
+
+from dataclasses import dataclass
+import io
+import json
+
+from climatevision.generator import calculate_with_default_inputs
+from climatevision.generator.resultdict import (
+    dataclass_to_result_dict,
+    projected_result_dict,
+    write_result_json,
+)
+
+
+@dataclass(kw_only=True)
+class Inner:
+    energy: float
+    name: str
+
+
+@dataclass(kw_only=True)
+class Outer:
+    LIFT_INTO_RESULT_DICT = ["inner"]
+
+    total: float
+    inner: Inner
+    parts: list[int]
+    nothing: None = None
+
+
+def test_lifted_fields_are_merged_into_the_parent():
+    outer = Outer(total=1.5, inner=Inner(energy=2.0, name="x"), parts=[1, 2])
+    assert dataclass_to_result_dict(outer) == {
+        "total": 1.5,
+        "parts": [1, 2],
+        "nothing": None,
+        "energy": 2.0,
+        "name": "x",
+    }
+
+
+def test_write_result_json_is_the_same_as_json_dump():
+    outer = Outer(total=float("nan"), inner=Inner(energy=2.0, name="ä"), parts=[])
+    result = calculate_with_default_inputs("03159016", 2035)
+    for v in [outer, result]:
+        for indent in [None, 4]:
+            fp = io.StringIO()
+            write_result_json(v, fp, indent=indent)
+            assert fp.getvalue() == json.dumps(
+                dataclass_to_result_dict(v), indent=indent
+            )
+
+
+def test_write_result_json_writes_what_default_returns():
+    parts: list[object] = [1, {3}]
+    outer = Outer(total=1.5, inner=Inner(energy=2.0, name="x"), parts=parts)  # type: ignore
+
+    def default(v: object) -> object:
+        assert isinstance(v, set)
+        return sorted(v)  # type: ignore
+
+    fp = io.StringIO()
+    write_result_json(outer, fp, default=default)
+    assert fp.getvalue() == json.dumps(dataclass_to_result_dict(outer), default=default)
+
+
+def test_projection_keeps_only_the_matching_paths():
+    outer = Outer(total=1.5, inner=Inner(energy=2.0, name="x"), parts=[1, 2])
+    assert projected_result_dict(outer, ["TOTAL", "par?s"]) == {
+        "total": 1.5,
+        "parts": [1, 2],
+    }
+    # Lifted fields are at the top level of the path too
+    assert projected_result_dict(outer, ["energy", "nope.*"]) == {"energy": 2.0}
+
+    result = calculate_with_default_inputs("03159016", 2035)
+    full = result.result_dict()
+    assert result.result_dict(paths=["*"]) == full
+    assert result.result_dict(paths=["bisko.total", "m183X.*"]) == {
+        "bisko": {"total": full["bisko"]["total"]},
+        "m183X": full["m183X"],
+    }
+    # '*' also matches across '.'
+    co2e = result.result_dict(paths=["e30.*.co2e_total"])
+    assert co2e["e30"]["e"]["CO2e_total"] == full["e30"]["e"]["CO2e_total"]
+    assert all(list(v) == ["CO2e_total"] for v in co2e["e30"].values())
+    # Projecting the result dict gives the same
+    for paths in [["*.co2e_total"], ["r18.r.*", "h30"], []]:
+        assert projected_result_dict(full, paths) == result.result_dict(paths=paths)
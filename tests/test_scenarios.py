@@ -0,0 +1,96 @@
+# pyright: strict
+
+from dataclasses import replace
+from math import isnan
+
+import pytest
+
+from climatevision.generator import (
+    Inputs,
+    RefData,
+    ScenariosFailed,
+    Vector,
+    calculate,
+    calculate_scenarios,
+    make_entries,
+    scenario_result,
+)
+from climatevision.generator.utils import div
+from climatevision.generator.vector import Divergence
+
+
+def test_vector_arithmetic_is_done_per_lane():
+    v = Vector([1.0, 2.0, 4.0])
+    assert (2 * v + 1).values == [3.0, 5.0, 9.0]
+    assert (1 / v - v).values == [0.0, -1.5, -3.75]
+    assert div(1.0, Vector([0.0, 2.0])).values == [0.0, 0.5]  # type: ignore
+
+
+def test_vector_comparisons_must_agree():
+    v = Vector([1.0, 2.0, 4.0])
+    assert v > 0
+    assert not v > 5
+    with pytest.raises(Divergence) as e:
+        assert v > 1.5
+    assert e.value.mask == [False, True, True]
+
+
+def test_calculate_scenarios_is_identical_to_calculate():
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    ass = "Ass_E_P_renew_loss_brutto_to_netto"
+    loss = refdata.facts_and_assumptions().ass(ass)
+    losses = [loss * 0.9, loss * 1.1, loss]
+    populations = [
+        entries.m_population_com_2018 * f for f in [0.5, 2.0, 1.0]  # type: ignore
+    ]
+    inputs = Inputs(
+        facts_and_assumptions=refdata.facts_and_assumptions(), entries=entries
+    )
+
+    result = calculate_scenarios(
+        inputs,
+        assumptions={ass: losses},
+        entries={"m_population_com_2018": populations},
+    )
+
+    for ndx in range(3):
+        expected = calculate_scenarios(
+            Inputs(
+                facts_and_assumptions=refdata.facts_and_assumptions(),
+                entries=replace(entries, m_population_com_2018=populations[ndx]),
+            ),
+            assumptions={ass: [losses[ndx]]},
+        ).result_dict()
+        assert scenario_result(result, ndx).result_dict() == expected
+    assert calculate(inputs).result_dict() == scenario_result(result, 2).result_dict()
+
+
+def test_a_failing_scenario_does_not_fail_the_others():
+    refdata = RefData.cached()
+    entries = make_entries(refdata, "03159016", 2035)
+    population = entries.m_population_nat
+    populations = [population, 0, population * 1.1, population * 0.9]
+    inputs = Inputs(
+        facts_and_assumptions=refdata.facts_and_assumptions(), entries=entries
+    )
+
+    with pytest.raises(ScenariosFailed) as e:
+        calculate_scenarios(inputs, entries={"m_population_nat": populations})
+
+    assert list(e.value.errors) == [1]
+    assert isinstance(e.value.errors[1], ZeroDivisionError)
+    for ndx in [0, 2, 3]:
+        expected = calculate(
+            Inputs(
+                facts_and_assumptions=refdata.facts_and_assumptions(),
+                entries=replace(entries, m_population_nat=populations[ndx]),
+            )
+        )
+        assert (
+            scenario_result(e.value.result, ndx).result_dict() == expected.result_dict()
+        )
+    assert isnan(scenario_result(e.value.result, 1).bisko.total.CO2e_total)  # type: ignore
+
+    with pytest.raises(ZeroDivisionError):
+        calculate_scenarios(inputs, entries={"m_population_nat": [0, 0]})
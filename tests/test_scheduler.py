@@ -0,0 +1,232 @@
+# pyright: strict
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from types import SimpleNamespace
+from typing import Any
+import sys
+
+import pytest
+
+from climatevision.generator import (
+    Inputs,
+    RefData,
+    StepMeasurement,
+    StepStatistics,
+    calculate,
+    calculate_incremental,
+    calculate_with_default_inputs,
+    calculate_years,
+    make_entries,
+)
+from climatevision.generator.scheduler import Schedule, Step
+
+
+def a(inputs: Any) -> int:
+    return 1
+
+
+def b(inputs: Any, *, a: int) -> int:
+    return a + 1
+
+
+def c(inputs: Any, *, a: int) -> int:
+    return a + 2
+
+
+def d(inputs: Any, *, b: int, c: int) -> int:
+    return b * c
+
+
+def update_a(inputs: Any, *, a: int) -> None:
+    pass
+
+
+def test_dependencies_are_taken_from_the_signature():
+    schedule = Schedule(
+        [
+            Step(name="a", label="a", fn=a),
+            Step(name="b", label="b", fn=b),
+            Step(name="c", label="c", fn=c),
+            Step(name="d", label="d", fn=d),
+        ]
+    )
+    assert schedule.dependencies("a") == set()
+    assert schedule.dependencies("c") == {"a"}
+    assert schedule.dependencies("d") == {"b", "c"}
+
+
+def test_readers_of_updated_results_keep_their_order():
+    schedule = Schedule(
+        [
+            Step(name="a", label="a", fn=a),
+            Step(name="b", label="b", fn=b),
+            Step(name="update_a", label="update_a", fn=update_a, updates="a"),
+            Step(name="c", label="c", fn=c),
+            Step(name="d", label="d", fn=d),
+        ]
+    )
+    assert schedule.dependencies("update_a") == {"a", "b"}
+    assert schedule.dependencies("c") == {"a", "update_a"}
+    assert schedule.dependencies("d") == {"b", "c"}
+
+
+def test_steps_must_only_depend_on_earlier_steps():
+    with pytest.raises(ValueError):
+        Schedule([Step(name="b", label="b", fn=b), Step(name="a", label="a", fn=a)])
+
+
+def test_cone_contains_dependencies_and_updaters():
+    schedule = Schedule(
+        [
+            Step(name="a", label="a", fn=a),
+            Step(name="b", label="b", fn=b),
+            Step(name="update_a", label="update_a", fn=update_a, updates="a"),
+            Step(name="c", label="c", fn=c),
+            Step(name="d", label="d", fn=d),
+        ]
+    )
+    assert [s.name for s in schedule.cone(["b"]).steps] == ["a", "b", "update_a"]
+    assert [s.name for s in schedule.cone(["a"]).steps] == ["a", "b", "update_a"]
+    assert len(schedule.cone(["d"]).steps) == 5
+    with pytest.raises(KeyError):
+        schedule.cone(["e"])
+
+
+def test_run_with_known_results_skips_their_steps():
+    schedule = Schedule(
+        [
+            Step(name="a", label="a", fn=a),
+            Step(name="b", label="b", fn=b),
+            Step(name="c", label="c", fn=c),
+            Step(name="d", label="d", fn=d),
+        ]
+    )
+    assert schedule.run(None, known={"a": 2}) == {"a": 2, "b": 3, "c": 4, "d": 12}  # type: ignore
+
+
+def test_run_with_executor_gives_the_same_results():
+    schedule = Schedule(
+        [
+            Step(name="a", label="a", fn=a),
+            Step(name="b", label="b", fn=b),
+            Step(name="c", label="c", fn=c),
+            Step(name="d", label="d", fn=d),
+        ]
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        assert schedule.run(None, executor=executor) == schedule.run(None)  # type: ignore
+
+
+def test_step_statistics_add_up_every_run():
+    schedule = Schedule(
+        [
+            Step(name="a", label="a", fn=a),
+            Step(name="b", label="b", fn=b),
+            Step(name="c", label="c", fn=c),
+        ]
+    )
+    stats = StepStatistics(measure_allocations=True)
+    schedule.run(None, instrumentation=stats)  # type: ignore
+    schedule.run(None, known={"a": 2}, instrumentation=stats)  # type: ignore
+    assert {name: s.count for name, s in stats.steps.items()} == {
+        "a": 1,
+        "b": 2,
+        "c": 2,
+    }
+    assert all(s.wall >= 0 and s.cpu >= 0 for s in stats.steps.values())
+    assert stats.report().splitlines()[0].split()[0] == "step"
+
+
+def test_step_statistics_count_steps_done_on_many_threads_at_once():
+    stats = StepStatistics()
+    measurement = StepMeasurement(name="a", label="a", wall=1.0, cpu=1.0)
+
+    def done_many_times(_: int):
+        for _ in range(10000):
+            stats.step_done(measurement)
+
+    # Switch threads as often as possible, so that unsynchronized updates get lost
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(done_many_times, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+    assert stats.steps["a"].count == 80000
+    assert stats.steps["a"].wall == 80000.0
+
+
+def make_x(inputs: Any) -> dict[str, int]:
+    return {"x": 1}
+
+
+def read_x(inputs: Any, *, make_x: dict[str, int]) -> int:
+    return make_x["x"] + inputs.entries.k
+
+
+def update_x(inputs: Any, *, make_x: dict[str, int]) -> None:
+    make_x["x"] = 100
+
+
+def read_updated_x(inputs: Any, *, make_x: dict[str, int]) -> int:
+    return make_x["x"]
+
+
+def test_run_incremental_reuses_updated_results_as_they_were_before_the_update():
+    schedule = Schedule(
+        [
+            Step(name="make_x", label="make_x", fn=make_x),
+            Step(name="read_x", label="read_x", fn=read_x),
+            Step(name="update_x", label="update_x", fn=update_x, updates="make_x"),
+            Step(name="read_updated_x", label="read_updated_x", fn=read_updated_x),
+        ]
+    )
+    previous = schedule.run_incremental(SimpleNamespace(entries=SimpleNamespace(k=1)))  # type: ignore
+    inputs = SimpleNamespace(entries=SimpleNamespace(k=2))
+    recording = schedule.run_incremental(inputs, previous, {"k"})  # type: ignore
+    # read_x ran again, but still before the update
+    assert recording.results == schedule.run(inputs)  # type: ignore
+    assert recording.results["read_x"] == 3
+    assert recording.results["make_x"] == {"x": 100}
+    assert previous.results["read_x"] == 2
+
+
+def test_calculate_with_executor_gives_the_same_result():
+    refdata = RefData.cached()
+
+    def inputs():
+        return Inputs(
+            facts_and_assumptions=refdata.facts_and_assumptions(),
+            entries=make_entries(refdata, "03159016", 2035),
+        )
+
+    expected = calculate(inputs()).result_dict()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert calculate(inputs(), executor=executor).result_dict() == expected
+
+
+def test_calculate_incremental_gives_the_same_result():
+    refdata = RefData.cached()
+    facts_and_assumptions = refdata.facts_and_assumptions()
+    entries = make_entries(refdata, "03159016", 2035)
+    previous = calculate_incremental(
+        Inputs(facts_and_assumptions=facts_and_assumptions, entries=entries)
+    )
+    before = previous.result.result_dict()
+
+    changed = replace(entries, r_area_m2=2 * entries.r_area_m2)
+    inputs = Inputs(facts_and_assumptions=facts_and_assumptions, entries=changed)
+    expected = calculate(inputs).result_dict()
+    assert calculate_incremental(inputs, previous).result.result_dict() == expected
+    assert previous.result.result_dict() == before
+
+
+def test_calculate_years_gives_the_same_results():
+    years = [2025, 2035, 2045]
+    results = calculate_years("03159016", years)
+    assert list(results) == years
+    for year in years:
+        expected = calculate_with_default_inputs("03159016", year).result_dict()
+        assert results[year].result_dict() == expected
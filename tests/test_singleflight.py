@@ -0,0 +1,91 @@
+# pyright: strict
+
+from threading import Event, Thread
+
+import pytest
+
+from climatevision.server.httpserver import _coalescing_key  # type: ignore
+from climatevision.server.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_computation():
+    flight: SingleFlight[list[int]] = SingleFlight()
+    started = Event()
+    proceed = Event()
+    calls: list[str] = []
+
+    def compute() -> list[int]:
+        calls.append("compute")
+        started.set()
+        proceed.wait()
+        return [1, 2, 3]
+
+    results: list[list[int]] = []
+    threads = [
+        Thread(target=lambda: results.append(flight.do("key", compute)))
+        for _ in range(4)
+    ]
+    threads[0].start()
+    assert started.wait(timeout=10)
+    for t in threads[1:]:
+        t.start()
+    while flight.waiting("key") < 3:
+        pass
+    proceed.set()
+    for t in threads:
+        t.join()
+
+    assert calls == ["compute"]
+    assert len(results) == 4
+    assert all(r is results[0] for r in results)
+    assert flight.shared == 3
+    # Nothing is kept once the computation is done
+    assert flight.do("key", lambda: [4]) == [4]
+
+
+def test_errors_are_shared_too():
+    flight: SingleFlight[int] = SingleFlight()
+    started = Event()
+    proceed = Event()
+    errors: list[Exception] = []
+
+    def fail() -> int:
+        started.set()
+        proceed.wait()
+        raise ValueError("broken")
+
+    def call():
+        try:
+            flight.do("key", fail)
+        except ValueError as e:
+            errors.append(e)
+
+    leader = Thread(target=call)
+    leader.start()
+    assert started.wait(timeout=10)
+    follower = Thread(target=call)
+    follower.start()
+    while flight.waiting("key") == 0:
+        pass
+    proceed.set()
+    leader.join()
+    follower.join()
+    assert len(errors) == 2 and errors[0] is errors[1]
+    with pytest.raises(ValueError):
+        flight.do("key", fail)
+
+
+def test_only_identical_calculate_requests_are_coalesced():
+    def request(id: int, method: str = "calculate", ags: str = "03159016") -> str:
+        return (
+            f'{{"jsonrpc": "2.0", "id": {id}, "method": "{method}",'
+            f' "params": {{"ags": "{ags}", "year": 2035}}}}'
+        )
+
+    key, id = _coalescing_key(request(1))
+    assert key is not None and id == 1
+    assert _coalescing_key(request(2)) == (key, 2)
+    assert _coalescing_key(request(1, ags="08111000"))[0] != key
+    assert _coalescing_key(request(1, method="list-ags"))[0] is None
+    assert _coalescing_key("[" + request(1) + "]")[0] is None
+    assert _coalescing_key("not json")[0] is None
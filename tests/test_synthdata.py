@@ -0,0 +1,57 @@
+# pyright: strict
+
+from os import path
+from typing import Any
+
+import pytest
+
+from climatevision.generator import Inputs, RefData, calculate, make_entries, synthdata
+
+
+def write(tmp_path: Any, communes: int, seed: int = 0) -> str:
+    datadir = str(tmp_path / f"data-{communes}-{seed}")
+    synthdata.write(datadir, communes=communes, seed=seed)
+    return datadir
+
+
+def test_every_ags_can_be_calculated(tmp_path: Any):
+    rd = RefData.load(write(tmp_path, 60), use_snapshot=False)
+    communes = [a for a in rd.ags_master() if not a.endswith("000")]
+    assert len(communes) == 60
+    assert synthdata.GOETTINGEN in communes
+    for ags in rd.ags_master():
+        entries = make_entries(rd, ags, 2035)
+        calculate(
+            Inputs(facts_and_assumptions=rd.facts_and_assumptions(), entries=entries)
+        )
+
+
+def test_districts_and_states_are_the_sums_of_their_communes(tmp_path: Any):
+    rd = RefData.load(write(tmp_path, 200), use_snapshot=False)
+    population = rd.dataset("population")
+    totals: dict[str, int] = {}
+    for ags, row in population.float_rows():
+        if not ags.endswith("000"):
+            for parent in [ags[:5] + "000", ags[:2] + "000000", "DG000000"]:
+                totals[parent] = totals.get(parent, 0) + int(row[0])
+    for parent, total in totals.items():
+        assert rd.population(parent).int("total") == total
+        assert parent in rd.ags_master()
+
+
+def test_the_same_seed_gives_the_same_data(tmp_path: Any):
+    first = write(tmp_path / "a", 30, seed=1)
+    second = write(tmp_path / "b", 30, seed=1)
+    other = write(tmp_path / "c", 30, seed=2)
+
+    def read(datadir: str) -> str:
+        with open(path.join(datadir, "public", "area", "2018.csv")) as fp:
+            return fp.read()
+
+    assert read(first) == read(second)
+    assert read(first) != read(other)
+
+
+def test_too_few_communes():
+    with pytest.raises(ValueError):
+        synthdata.write("unused", communes=synthdata.MIN_COMMUNES - 1)
@@ -1,6 +1,35 @@
-from climatevision.tracing.number import TracedNumber
-from climatevision.generator import calculate_with_default_inputs
-from climatevision.tracing import with_tracing
+from concurrent.futures import ThreadPoolExecutor
+from os import path
+from typing import Any, Iterator
+import gzip
+import json
+
+import pytest
+
+from climatevision.tracing.number import (
+    Definition,
+    TracedNumber,
+    finalize_traces_in_result,
+    interning,
+)
+from climatevision.generator import (
+    Inputs,
+    RefData,
+    calculate_with_default_inputs,
+    calculate,
+    calculate_years,
+    make_entries,
+    synthdata,
+)
+from climatevision.generator.residences2018.r18 import R18
+from climatevision.server import GeneratorRpcs
+from climatevision.tracing import (
+    TRACED,
+    dag_traces,
+    expand_traces,
+    trace_paths,
+    with_tracing,
+)
 
 
 def test_literal():
@@ -86,6 +115,83 @@ def test_comparisons():
     assert TracedNumber.lift(1) < 2  # type: ignore
 
 
+def test_equal_traces_are_shared():
+    with interning():
+        a = TracedNumber.fact_or_ass("Fact_A", 2)
+        b = TracedNumber.data(3, "pop", "x", "y")
+        assert (a * b).trace is (a * b).trace
+        assert (a * b).trace is (TracedNumber.fact_or_ass("Fact_A", 2) * b).trace
+        assert a.trace is TracedNumber.fact_or_ass("Fact_A", 2).trace
+        assert (a + 1).trace is not (a - 1).trace
+        assert (a * 0.0).trace is not (a * -0.0).trace
+        # A definition may get a name, so it is not the same as the value stored
+        assert (Definition(a) * b).trace is not (a * b).trace
+    assert (a * b).trace is not (a * b).trace
+
+
+def test_every_traced_run_shares_the_traces_of_its_own():
+    a = TracedNumber.fact_or_ass("Fact_A", 2)
+
+    def other_run() -> Any:
+        with interning():
+            return (a * 2).trace
+
+    with interning():
+        shared = (a * 2).trace
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(other_run).result() is not shared
+        # The end of the other run did not forget the traces of this one
+        assert (a * 2).trace is shared
+
+
+def test_traces_refer_to_the_names_of_values_in_the_result():
+    computed = TracedNumber.fact_or_ass("Fact_A", 2) * 3
+    # What reading the field a of a result dataclass gives
+    a = Definition(computed)
+    r = {"s": {"a": a, "b": a + 1, "c": computed}, "t": {"a": a}}
+    finalize_traces_in_result(r)  # type: ignore
+    full_trace = {
+        "binary": "*",
+        "a": {"fact_or_ass": "Fact_A", "value": 2},
+        "b": 3,
+        "value": 6,
+    }
+    assert r == {
+        "s": {
+            "a": {"value": 6, "trace": full_trace},
+            "b": {
+                "value": 7,
+                "trace": {"binary": "+", "a": {"name": "s.a"}, "b": 1, "value": 7},
+            },
+            # Only values read from a field are named, not every equal computation
+            "c": {"value": 6, "trace": full_trace},
+        },
+        "t": {"a": {"value": 6, "trace": full_trace}},
+    }
+
+
+def test_dag_traces():
+    shared = TracedNumber.fact_or_ass("Fact_A", 2) / 3
+    r = {"s": {"x": shared + shared, "y": shared * 2}, "n": None, "v": 1}
+    finalize_traces_in_result(r)  # type: ignore
+    dag = dag_traces(r)  # type: ignore
+    assert dag["traces"] == [
+        {"fact_or_ass": "Fact_A", "value": 2},
+        {"binary": "/", "a": {"ref": 0}, "b": 3, "value": 2 / 3},
+        {"binary": "+", "a": {"ref": 1}, "b": {"ref": 1}, "value": 4 / 3},
+        {"binary": "*", "a": {"ref": 1}, "b": 2, "value": 4 / 3},
+    ]
+    assert dag["result"] == {
+        "s": {
+            "x": {"value": 4 / 3, "trace": {"ref": 2}},
+            "y": {"value": 4 / 3, "trace": {"ref": 3}},
+        },
+        "n": None,
+        "v": 1,
+    }
+    assert expand_traces(dag) == r
+
+
 def test_enable_disable_tracing():
     """Here we do not care about the value computed nor do we care about the exact trace.
     What we do want is that the value stays the same across each run and that the trace
@@ -123,3 +229,144 @@ def test_enable_disable_tracing():
         str(result["a30"]["g"]["cost_wage"])  # type: ignore
         == "{'value': " + expected_value + ", 'trace': " + expected_trace + "}"
     )
+
+
+def test_trace_paths_gives_the_traces_of_a_complete_run():
+    rd = RefData.cached()
+    paths = ["r18.p.energy", "e30.p_local_pv_roof.energy", "h30.p"]
+    traces = trace_paths(
+        lambda: Inputs(
+            facts_and_assumptions=rd.facts_and_assumptions(),
+            entries=make_entries(rd, "03159016", 2035),
+        ),
+        paths,
+    )
+    result = with_tracing(
+        enabled=True,
+        f=lambda: calculate_with_default_inputs("03159016", 2035).result_dict(),
+    )
+    for p in paths:
+        sector, rest = p.split(".", maxsplit=1)
+        expected = result[sector]
+        for k in rest.split("."):
+            expected = expected[k]  # type: ignore
+        assert traces[p] == expected
+
+
+def test_traced_calculate_with_paths_gives_the_traces_of_a_complete_run():
+    rpcs = GeneratorRpcs(RefData.cached())
+    projected = rpcs.do_calculate(
+        "03159016", 2035, {}, trace=True, paths=["r18.p.energy", "h30.p"]
+    )
+    result = rpcs.do_calculate("03159016", 2035, {}, trace=True)
+    assert projected == {
+        "r18": {"p": {"energy": result["r18"]["p"]["energy"]}},
+        "h30": {"p": result["h30"]["p"]},
+    }
+
+
+def test_traced_and_untraced_calculations_can_run_at_the_same_time():
+    rd = RefData.cached()
+
+    def calculate(traced: bool) -> dict[str, Any]:
+        return with_tracing(
+            enabled=traced,
+            f=lambda: calculate_with_default_inputs("03159016", 2035).result_dict(),
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(calculate, [True, False] * 4))
+    traced, untraced = results[0], results[1]
+    assert traced["r18"]["p"]["energy"]["value"] == untraced["r18"]["p"]["energy"]
+    for r in results[1::2]:
+        assert r == untraced
+    # Tracing never leaks out of the calculations that asked for it
+    assert type(rd.fact("Fact_R_P_newbuilt_2011_2018")) is float
+
+
+def test_result_classes_are_only_changed_while_tracing():
+    rd = RefData.cached()
+    init = R18.__dict__["__init__"]
+
+    result = calculate(
+        Inputs(
+            facts_and_assumptions=rd.facts_and_assumptions(),
+            entries=make_entries(rd, "03159016", 2035),
+            numeric=TRACED,
+        )
+    )
+
+    assert type(result.r18) is not R18 and isinstance(result.r18, R18)
+    # Untraced calculations afterwards create plain results as fast as before
+    assert R18.__dict__["__init__"] is init
+    assert type(calculate_with_default_inputs("03159016", 2035).r18) is R18
+
+
+def test_calculate_years_traces_like_calculate():
+    # The 2018 sectors of 2030 are reused (and copied before being updated) for 2035
+    traced = with_tracing(
+        enabled=True,
+        f=lambda: calculate_years("03159016", [2030, 2035])[2035].result_dict(),
+    )
+    expected = with_tracing(
+        enabled=True,
+        f=lambda: calculate_with_default_inputs("03159016", 2035).result_dict(),
+    )
+    assert traced == expected
+
+
+@pytest.fixture(scope="module")
+def synthetic_refdata(tmp_path_factory: pytest.TempPathFactory) -> RefData:
+    datadir = str(tmp_path_factory.mktemp("tracing") / "data")
+    synthdata.write(datadir, communes=60, seed=0)
+    return RefData.load(datadir, use_snapshot=False)
+
+
+def synthetic_inputs(rd: RefData, ags: str, year: int) -> Inputs:
+    return Inputs(
+        facts_and_assumptions=rd.facts_and_assumptions(),
+        entries=make_entries(rd, ags, year),
+    )
+
+
+def test_traces_match_the_known_good_ones(synthetic_refdata: RefData):
+    """Every value is named after the field it was defined in (and not after some other
+    field that merely holds the same number)."""
+    expected_file = path.join(
+        path.dirname(__file__),
+        "end_to_end_expected",
+        f"traced_synthdata_{synthdata.GOETTINGEN}_2035.json.gz",
+    )
+    with gzip.open(expected_file, "rt") as fp:
+        expected = json.load(fp)
+    result = with_tracing(
+        enabled=True,
+        f=lambda: calculate(
+            synthetic_inputs(synthetic_refdata, synthdata.GOETTINGEN, 2035)
+        ).result_dict(),
+    )
+    # Round trip through JSON, so that e.g. tuples compare equal to lists
+    assert json.loads(json.dumps(result)) == expected
+
+
+def test_trace_paths_gives_the_traces_of_a_complete_run_for_every_path(
+    synthetic_refdata: RefData,
+):
+    """Every sector is traced on its own, so this also checks that the names in the
+    traces do not depend on which other sectors are calculated."""
+
+    def inputs() -> Inputs:
+        return synthetic_inputs(synthetic_refdata, synthdata.GOETTINGEN, 2035)
+
+    result = with_tracing(enabled=True, f=lambda: calculate(inputs()).result_dict())
+
+    def values(d: dict[str, Any], prefix: str) -> Iterator[tuple[str, Any]]:
+        for k, v in d.items():
+            if isinstance(v, dict) and set(v) != {"value", "trace"}:  # type: ignore
+                yield from values(v, prefix + k + ".")  # type: ignore
+            else:
+                yield prefix + k, v
+
+    for sector, sector_result in result.items():
+        expected = dict(values(sector_result, sector + "."))
+        assert trace_paths(inputs, expected) == expected